@@ -0,0 +1 @@
+"""Reproducible, headless performance benchmarks for the hand tracking stack."""
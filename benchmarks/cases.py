@@ -0,0 +1,342 @@
+"""Individual benchmark cases; each returns a list of Metric values."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+import pyarrow.parquet as pq
+
+from roboticsdatacolleciton.detection import HandDetector
+from roboticsdatacolleciton.loggers import HandLogWriter
+from roboticsdatacolleciton.pipelines import VideoProcessingPipeline
+from roboticsdatacolleciton.storage import MANIFEST_KEY
+from roboticsdatacolleciton.video import VideoFileStream
+from roboticsdatacolleciton.visualization import HandPreviewRenderer
+
+from .stub_detector import StubHandDetector
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+# Dependencies that must not load just because the package (or a CLI's --help) was imported.
+HEAVY_MODULES = ("cv2", "mediapipe", "pyarrow")
+
+
+@dataclass(slots=True)
+class Metric:
+    """One measured value; ``higher_is_better`` drives regression checks."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+def best_of(repeat: int, fn: Callable[[], float]) -> float:
+    """Smallest duration over ``repeat`` runs; the minimum is the least noisy estimate."""
+
+    return min(fn() for _ in range(max(1, repeat)))
+
+
+def bench_decode(video: Path, label: str, prefetch: int = 0, repeat: int = 3) -> List[Metric]:
+    frames = 0
+
+    def run() -> float:
+        nonlocal frames
+        frames = 0
+        started = time.perf_counter()
+        with VideoFileStream(video, prefetch=prefetch) as stream:
+            for _ in stream.frames():
+                frames += 1
+        return time.perf_counter() - started
+
+    seconds = best_of(repeat, run)
+    return [Metric(f"decode/{label}/prefetch{prefetch}/fps", frames / seconds, "frames/s", True)]
+
+
+def bench_log_writer(frames: int = 20000, max_num_hands: int = 2, repeat: int = 3) -> List[Metric]:
+    detector = StubHandDetector(max_num_hands=max_num_hands)
+    blank = np.zeros((720, 1280, 3), dtype=np.uint8)
+    detections = [detector.detect(blank) for _ in range(frames)]
+    rows = sum(len(positions) for positions in detections)
+    size = 0
+
+    def run() -> float:
+        nonlocal size
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "bench.parquet"
+            writer = HandLogWriter(output_path=log_path)
+            started = time.perf_counter()
+            for frame_index, positions in enumerate(detections):
+                writer.record(frame_index, positions)
+            writer.close()
+            elapsed = time.perf_counter() - started
+            size = log_path.stat().st_size
+        return elapsed
+
+    seconds = best_of(repeat, run)
+    return [
+        Metric("log_writer/rows_per_second", rows / seconds, "rows/s", True),
+        Metric("log_writer/file_bytes", float(size), "bytes", False),
+        Metric("log_writer/bytes_per_row", size / max(1, rows), "bytes/row", False),
+    ]
+
+
+def bench_features(frames: int = 20000, max_num_hands: int = 2, repeat: int = 3) -> List[Metric]:
+    """Kinematic feature extraction over a stub-detector log, including reading and writing Parquet."""
+
+    from roboticsdatacolleciton.features import compute_kinematic_features
+
+    detector = StubHandDetector(max_num_hands=max_num_hands)
+    blank = np.zeros((720, 1280, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "bench.parquet"
+        writer = HandLogWriter(output_path=log_path)
+        for frame_index in range(frames):
+            writer.record(frame_index, detector.detect(blank))
+        writer.close()
+        # The first run also pays one-off imports; best_of discards it when repeat > 1.
+        seconds = best_of(repeat, lambda: compute_kinematic_features(log_path).elapsed_seconds)
+        rows = writer.rows_written
+    return [Metric("features/rows_per_second", rows / seconds, "rows/s", True)]
+
+
+def bench_dataset_s3(frames: int = 20000, files: int = 8, repeat: int = 3) -> List[Metric]:
+    """HandDataset on S3Storage over the in-memory S3 stand-in: upload, manifest round-trip, scan, compact.
+
+    One uncompressed log is larger than the 5 MiB part size so it goes up as
+    a multipart upload. The results are checked as well as timed: wrong
+    listings, manifests or row counts raise instead of producing numbers.
+    """
+
+    from roboticsdatacolleciton.storage import HandDataset, Partition, S3Storage
+    from roboticsdatacolleciton.storage.s3 import MIN_PART_SIZE
+
+    from .fake_s3 import InMemoryS3Client
+
+    detector = StubHandDetector()
+    blank = np.zeros((720, 1280, 3), dtype=np.uint8)
+    detections = [detector.detect(blank) for _ in range(frames)]
+    with tempfile.TemporaryDirectory() as tmp:
+        logs = []
+        for number in range(files):
+            log_path = Path(tmp) / f"log-{number}.parquet"
+            # The first log is written uncompressed so it is large enough for a multipart upload.
+            writer = HandLogWriter(output_path=log_path, compression=None if number == 0 else "zstd")
+            for frame_index, positions in enumerate(detections if number == 0 else detections[: frames // files]):
+                writer.record(frame_index, positions)
+            writer.close()
+            logs.append((log_path, Partition("bench", f"cam{number % 2}", "2024-01-01")))
+        if logs[0][0].stat().st_size <= MIN_PART_SIZE:
+            raise RuntimeError("bench_dataset_s3 needs more frames to exercise multipart uploads")
+        total_bytes = sum(path.stat().st_size for path, _ in logs)
+        rows = sum(pq.ParquetFile(path).metadata.num_rows for path, _ in logs)
+
+        def run() -> Tuple[float, float]:
+            client = InMemoryS3Client(page_size=3)
+            storage = S3Storage("bench", "hands", client=client, part_size=MIN_PART_SIZE)
+            started = time.perf_counter()
+            added = HandDataset(storage).add_logs(logs)
+            upload_seconds = time.perf_counter() - started
+            if client.multipart_uploads == 0 or client.aborted_uploads:
+                raise RuntimeError("expected a completed multipart upload")
+            reopened = HandDataset(storage)
+            if sorted(entry.key for entry in reopened.entries) != sorted(entry.key for entry in added):
+                raise RuntimeError("manifest did not round-trip")
+            listed = {item.key for item in storage.list()}
+            expected = {MANIFEST_KEY} | {entry.key for entry in added} | {entry.summary_key for entry in added}
+            if listed != expected:
+                raise RuntimeError(f"unexpected objects: {sorted(listed ^ expected)}")
+            started = time.perf_counter()
+            scanned = sum(len(batch) for _, batch in reopened.iter_batches())
+            scan_seconds = time.perf_counter() - started
+            reopened.compact()
+            if scanned != rows or sum(entry.rows for entry in reopened.rebuild_manifest()) != rows:
+                raise RuntimeError("row count changed")
+            storage.close()
+            return upload_seconds, scan_seconds
+
+        timings = [run() for _ in range(max(1, repeat))]
+    return [
+        Metric("dataset/s3_add_mb_per_second", total_bytes / 1e6 / min(upload for upload, _ in timings), "MB/s", True),
+        Metric("dataset/s3_scan_rows_per_second", rows / min(scan for _, scan in timings), "rows/s", True),
+    ]
+
+
+def bench_training_tensors(
+    frames: int = 20000,
+    max_num_hands: int = 2,
+    window: int = 32,
+    reads: int = 2000,
+    repeat: int = 3,
+) -> List[Metric]:
+    """Tensor export throughput, then random window reads from the memory-mapped arrays."""
+
+    from roboticsdatacolleciton.training import LandmarkWindowDataset, export_training_tensors
+
+    detector = StubHandDetector(max_num_hands=max_num_hands)
+    blank = np.zeros((720, 1280, 3), dtype=np.uint8)
+    with tempfile.TemporaryDirectory() as tmp:
+        log_path = Path(tmp) / "bench.parquet"
+        writer = HandLogWriter(output_path=log_path)
+        for frame_index in range(frames):
+            writer.record(frame_index, detector.detect(blank))
+        writer.close()
+        output_dir = Path(tmp) / "tensors"
+        export_seconds = best_of(
+            repeat, lambda: export_training_tensors([log_path], output_dir, overwrite=True).elapsed_seconds
+        )
+
+        dataset = LandmarkWindowDataset(output_dir, window=window)
+        order = np.random.default_rng(0).integers(0, len(dataset), size=reads)
+
+        def run() -> float:
+            started = time.perf_counter()
+            for index in order.tolist():
+                dataset[index]
+            return time.perf_counter() - started
+
+        read_seconds = best_of(repeat, run)
+    return [
+        Metric("training/export_frames_per_second", frames / export_seconds, "frames/s", True),
+        Metric(f"training/window{window}_reads_per_second", reads / read_seconds, "windows/s", True),
+    ]
+
+
+def bench_roi(width: int = 640, height: int = 480, frames: int = 240, size: int = 48) -> List[Metric]:
+    """RegionOfInterestDetector around a stateful detector following a moving marker hand.
+
+    The marker sweeps across the frame, so the crop has to move. Every frame
+    must map back to the landmarks a plain full-frame pass finds (within one
+    pixel); a mismatch means the wrapped detector kept tracking state from a
+    different view, and raises instead of producing numbers.
+    """
+
+    from roboticsdatacolleciton.detection.roi import RegionOfInterestDetector
+
+    from .stub_detector import MarkerHandDetector
+
+    reference = MarkerHandDetector()
+    roi = RegionOfInterestDetector(MarkerHandDetector())
+    frame = np.zeros((height, width, 3), dtype=np.uint8)
+    scale = np.array([width, height], dtype=np.float64)
+    for index in range(frames):
+        x = int((width - size) * (0.5 + 0.5 * np.sin(index * 0.04)))
+        y = int((height - size) * (0.5 + 0.4 * np.cos(index * 0.07)))
+        frame[:] = 0
+        frame[y:y + size, x:x + size] = 255
+        expected, actual = reference.detect(frame), roi.detect(frame)
+        if len(expected) != len(actual):
+            raise RuntimeError(f"frame {index}: ROI found {len(actual)} hands, full frame {len(expected)}")
+        for full, cropped in zip(expected, actual):
+            error = np.abs((full.landmark_array[:, :2] - cropped.landmark_array[:, :2]) * scale).max()
+            if error > 1.0:
+                raise RuntimeError(f"frame {index}: ROI landmarks are {error:.1f} px off the full-frame pass")
+    if roi.stats.roi_frames == 0:
+        raise RuntimeError("bench_roi never inferred on a crop")
+    return [
+        Metric("roi/pixel_ratio", roi.stats.pixel_ratio, "ratio", False),
+        Metric("roi/tracker_resets_per_frame", roi.stats.resets / frames, "ratio", False),
+    ]
+
+
+def bench_render(width: int, height: int, frames: int = 300, repeat: int = 3) -> List[Metric]:
+    renderer = HandPreviewRenderer(window_name="benchmark", threaded=False)
+    detector = StubHandDetector()
+    frame = np.full((height, width, 3), 64, dtype=np.uint8)
+    detections = [detector.detect(frame) for _ in range(frames)]
+
+    def run() -> float:
+        started = time.perf_counter()
+        for positions in detections:
+            renderer.annotate(frame, positions)
+        return time.perf_counter() - started
+
+    seconds = best_of(repeat, run)
+    return [Metric(f"render/{width}x{height}/ms_per_frame", seconds / frames * 1000.0, "ms", False)]
+
+
+def bench_pipeline(
+    video: Path,
+    label: str,
+    detector_factory: Callable[[], HandDetector],
+    backend: str,
+    repeat: int = 1,
+) -> List[Metric]:
+    frames = 0
+
+    def run() -> float:
+        nonlocal frames
+        with tempfile.TemporaryDirectory() as tmp:
+            pipeline = VideoProcessingPipeline(
+                video_stream=VideoFileStream(video, prefetch=4),
+                detector=detector_factory(),
+                logger=HandLogWriter(output_path=Path(tmp) / "bench.parquet"),
+            )
+            stats = pipeline.run()
+        frames = stats.frames
+        return stats.elapsed_seconds
+
+    seconds = best_of(repeat, run)
+    return [Metric(f"pipeline/{backend}/{label}/fps", frames / seconds, "frames/s", True)]
+
+
+def bench_import(module: str, repeat: int = 5) -> List[Metric]:
+    """Import ``module`` in fresh interpreters and count the heavy dependencies it drags in."""
+
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"print(json.dumps([elapsed, [name for name in {HEAVY_MODULES!r} if name in sys.modules]]))\n"
+    )
+    results = []
+    for _ in range(max(1, repeat)):
+        output = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+        results.append(json.loads(output.stdout))
+    seconds = min(elapsed for elapsed, _ in results)
+    label = module.partition(".")[2] or "package"
+    return [
+        Metric(f"startup/import/{label}/ms", seconds * 1000.0, "ms", False),
+        Metric(f"startup/import/{label}/heavy_modules", float(len(results[0][1])), "modules", False),
+    ]
+
+
+def bench_cli_help(script: str, repeat: int = 5) -> List[Metric]:
+    """Wall time of ``python <script> --help``, interpreter start-up included."""
+
+    def run() -> float:
+        start = time.perf_counter()
+        subprocess.run([sys.executable, script, "--help"], cwd=REPO_ROOT, capture_output=True, check=True)
+        return time.perf_counter() - start
+
+    return [Metric(f"startup/cli/{Path(script).stem}/help_ms", best_of(repeat, run) * 1000.0, "ms", False)]
+
+
+def mediapipe_factory(model_path: Optional[str]) -> Callable[[], HandDetector]:
+    """Detector factory for the real MediaPipe backend available in this environment.
+
+    Raises RuntimeError with the reason when neither backend can be created.
+    """
+
+    from roboticsdatacolleciton.detection import create_hand_detector
+
+    errors = []
+    for backend in ("solutions", "tasks"):
+        kwargs = {"model_path": model_path} if backend == "tasks" else {}
+        try:
+            create_hand_detector(backend, **kwargs).close()
+        except Exception as exc:  # missing legacy API or missing .task model
+            errors.append(f"{backend}: {exc}")
+            continue
+        return lambda: create_hand_detector(backend, **kwargs)
+    raise RuntimeError("; ".join(errors))
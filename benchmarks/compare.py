@@ -0,0 +1,85 @@
+"""Compare two benchmark result files and flag regressions."""
+from __future__ import annotations
+
+import argparse
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List
+
+
+@dataclass(slots=True)
+class Comparison:
+    name: str
+    baseline: float
+    current: float
+    unit: str
+    higher_is_better: bool
+
+    @property
+    def change(self) -> float:
+        """Relative change, positive when the metric got better."""
+
+        if self.baseline == 0:
+            # Counts such as heavy_modules: leaving zero is a regression, staying there is not.
+            if self.current == 0:
+                return 0.0
+            return float("inf") if (self.current > 0) == self.higher_is_better else float("-inf")
+        delta = (self.current - self.baseline) / self.baseline
+        return delta if self.higher_is_better else -delta
+
+    def regressed(self, threshold: float) -> bool:
+        return self.change < -threshold
+
+
+def load_metrics(path: str | Path) -> Dict[str, dict]:
+    with Path(path).open("r", encoding="utf-8") as fp:
+        payload = json.load(fp)
+    return {metric["name"]: metric for metric in payload["metrics"]}
+
+
+def compare(baseline: Dict[str, dict], current: Dict[str, dict]) -> List[Comparison]:
+    """Pair up metrics present in both runs."""
+
+    return [
+        Comparison(
+            name=name,
+            baseline=baseline[name]["value"],
+            current=metric["value"],
+            unit=metric["unit"],
+            higher_is_better=metric["higher_is_better"],
+        )
+        for name, metric in current.items()
+        if name in baseline
+    ]
+
+
+def format_report(comparisons: List[Comparison], threshold: float) -> str:
+    lines = []
+    for item in comparisons:
+        flag = "REGRESSION" if item.regressed(threshold) else ""
+        lines.append(
+            f"{item.name:<48} {item.baseline:>14.2f} -> {item.current:>14.2f} {item.unit:<10} "
+            f"{item.change:>+8.1%} {flag}"
+        )
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline", type=str)
+    parser.add_argument("current", type=str)
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    comparisons = compare(load_metrics(args.baseline), load_metrics(args.current))
+    print(format_report(comparisons, args.threshold))
+    if any(item.regressed(args.threshold) for item in comparisons):
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
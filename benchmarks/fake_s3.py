@@ -0,0 +1,114 @@
+"""In-memory stand-in for the boto3 S3 client calls made by S3Storage."""
+from __future__ import annotations
+
+import hashlib
+import io
+import threading
+import uuid
+from typing import Dict, Iterator, List
+
+
+class InMemoryS3Client:
+    """Implements the subset of ``boto3.client("s3")`` that S3Storage uses.
+
+    Objects live in a dict, so the dataset code (uploads, multipart
+    assembly, listing, manifest reads) can be exercised and timed without
+    MinIO or network access. Like S3, multipart parts other than the last
+    must be at least 5 MiB and a completed upload must list its parts in
+    order with matching ETags. Counters record how objects were uploaded.
+    """
+
+    MIN_PART_SIZE = 5 * 1024 * 1024
+
+    def __init__(self, page_size: int = 1000) -> None:
+        self.page_size = page_size
+        self.objects: Dict[str, bytes] = {}
+        self.multipart_uploads = 0
+        self.parts_uploaded = 0
+        self.aborted_uploads = 0
+        self._uploads: Dict[str, Dict[int, bytes]] = {}
+        self._lock = threading.Lock()
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes) -> dict:  # noqa: N803 - boto3 argument names
+        with self._lock:
+            self.objects[f"{Bucket}/{Key}"] = bytes(Body)
+        return {"ETag": _etag(Body)}
+
+    def get_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
+        with self._lock:
+            data = self.objects.get(f"{Bucket}/{Key}")
+        if data is None:
+            raise KeyError(f"NoSuchKey: {Key}")
+        return {"Body": io.BytesIO(data), "ContentLength": len(data)}
+
+    def delete_object(self, Bucket: str, Key: str) -> dict:  # noqa: N803
+        with self._lock:
+            self.objects.pop(f"{Bucket}/{Key}", None)
+        return {}
+
+    def list_objects_v2(self, Bucket: str, Prefix: str = "", MaxKeys: int = 1000, StartAfter: str = "") -> dict:  # noqa: N803
+        root = f"{Bucket}/"
+        with self._lock:
+            keys = sorted(
+                key[len(root):] for key in self.objects if key.startswith(root + Prefix) and key[len(root):] > StartAfter
+            )
+            contents = [{"Key": key, "Size": len(self.objects[root + key])} for key in keys[:MaxKeys]]
+        return {"Contents": contents, "IsTruncated": len(keys) > MaxKeys} if contents else {"IsTruncated": False}
+
+    def get_paginator(self, operation: str) -> "_ListPaginator":
+        if operation != "list_objects_v2":
+            raise NotImplementedError(operation)
+        return _ListPaginator(self)
+
+    def create_multipart_upload(self, Bucket: str, Key: str) -> dict:  # noqa: N803
+        upload_id = uuid.uuid4().hex
+        with self._lock:
+            self._uploads[upload_id] = {}
+            self.multipart_uploads += 1
+        return {"UploadId": upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, PartNumber: int, UploadId: str, Body: bytes) -> dict:  # noqa: N803
+        with self._lock:
+            self._uploads[UploadId][PartNumber] = bytes(Body)
+            self.parts_uploaded += 1
+        return {"ETag": _etag(Body)}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict) -> dict:  # noqa: N803
+        with self._lock:
+            uploaded = self._uploads.pop(UploadId)
+        parts = MultipartUpload["Parts"]
+        numbers = [part["PartNumber"] for part in parts]
+        if numbers != sorted(uploaded) or numbers != list(range(1, len(numbers) + 1)):
+            raise ValueError(f"InvalidPartOrder: {numbers}")
+        for part in parts:
+            if part["ETag"] != _etag(uploaded[part["PartNumber"]]):
+                raise ValueError(f"InvalidPart: {part['PartNumber']}")
+        if any(len(uploaded[number]) < self.MIN_PART_SIZE for number in numbers[:-1]):
+            raise ValueError("EntityTooSmall")
+        self.put_object(Bucket, Key, b"".join(uploaded[number] for number in numbers))
+        return {}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str) -> dict:  # noqa: N803
+        with self._lock:
+            self._uploads.pop(UploadId, None)
+            self.aborted_uploads += 1
+        return {}
+
+
+class _ListPaginator:
+    def __init__(self, client: InMemoryS3Client) -> None:
+        self.client = client
+
+    def paginate(self, Bucket: str, Prefix: str = "") -> Iterator[dict]:  # noqa: N803
+        start_after = ""
+        while True:
+            page = self.client.list_objects_v2(Bucket=Bucket, Prefix=Prefix, MaxKeys=self.client.page_size, StartAfter=start_after)
+            yield page
+            contents: List[dict] = page.get("Contents", [])
+            if not page["IsTruncated"] or not contents:
+                return
+            start_after = contents[-1]["Key"]
+
+
+def _etag(data: bytes) -> str:
+    return f'"{hashlib.md5(data).hexdigest()}"'
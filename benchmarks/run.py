@@ -0,0 +1,167 @@
+"""Run the benchmark suite headlessly and store the results as JSON.
+
+Usage::
+
+    python -m benchmarks.run --suite quick --output benchmarks/results/latest.json
+    python -m benchmarks.run --baseline benchmarks/results/main.json --threshold 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import cv2
+import numpy as np
+import pyarrow
+
+from . import cases
+from .compare import compare, format_report, load_metrics
+from .stub_detector import StubHandDetector
+from .synthetic import generate_video, video_name
+
+# Import-time and CLI start-up cases; run in fresh interpreters.
+STARTUP_MODULES = (
+    "roboticsdatacolleciton",
+    "roboticsdatacolleciton.detection",
+    "roboticsdatacolleciton.features",
+    "roboticsdatacolleciton.loggers",
+    "roboticsdatacolleciton.pipelines",
+    "roboticsdatacolleciton.storage",
+    "roboticsdatacolleciton.training",
+)
+STARTUP_SCRIPTS = (
+    "main.py",
+    "preview.py",
+    "process_video.py",
+    "process_batch.py",
+    "export_video.py",
+    "dataset.py",
+    "compute_features.py",
+    "export_tensors.py",
+)
+
+# (width, height, frames) per suite.
+SUITES: Dict[str, List[Tuple[int, int, int]]] = {
+    "quick": [(640, 480, 150), (1280, 720, 90)],
+    "full": [(640, 480, 600), (1280, 720, 600), (1920, 1080, 300), (3840, 2160, 120)],
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Headless performance benchmarks")
+    parser.add_argument("--suite", choices=sorted(SUITES), default="quick")
+    parser.add_argument("--data-dir", type=str, default="benchmarks/data", help="Where synthetic videos are cached")
+    parser.add_argument("--output", type=str, default="benchmarks/results/latest.json")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per micro-benchmark; the fastest is kept")
+    parser.add_argument("--model-path", type=str, default=None, help="HandLandmarker .task model for the Tasks backend")
+    parser.add_argument("--skip-mediapipe", action="store_true", help="Skip the end-to-end MediaPipe pipeline cases")
+    parser.add_argument("--baseline", type=str, default=None, help="Earlier result file to compare against")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown that counts as a regression")
+    return parser.parse_args()
+
+
+def environment() -> dict:
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    try:
+        import mediapipe
+
+        mediapipe_version = getattr(mediapipe, "__version__", "unknown")
+    except ImportError:
+        mediapipe_version = None
+    return {
+        "timestamp": time.time(),
+        "commit": commit,
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "opencv": cv2.__version__,
+        "opencv_threads": cv2.getNumThreads(),
+        "numpy": np.__version__,
+        "pyarrow": pyarrow.__version__,
+        "mediapipe": mediapipe_version,
+    }
+
+
+def run_suite(args: argparse.Namespace) -> Tuple[List[cases.Metric], Dict[str, str]]:
+    metrics: List[cases.Metric] = []
+    skipped: Dict[str, str] = {}
+    for module in STARTUP_MODULES:
+        metrics += cases.bench_import(module, repeat=max(5, args.repeat))
+    for script in STARTUP_SCRIPTS:
+        metrics += cases.bench_cli_help(script, repeat=max(5, args.repeat))
+
+    videos = []
+    for width, height, frames in SUITES[args.suite]:
+        label = f"{width}x{height}"
+        videos.append((label, generate_video(Path(args.data_dir) / video_name(width, height, frames), width, height, frames)))
+
+    for label, video in videos:
+        for prefetch in (0, 8):
+            metrics += cases.bench_decode(video, label, prefetch=prefetch, repeat=args.repeat)
+        metrics += cases.bench_pipeline(video, label, StubHandDetector, backend="stub", repeat=args.repeat)
+
+    metrics += cases.bench_log_writer(frames=5000 if args.suite == "quick" else 50000, repeat=args.repeat)
+    metrics += cases.bench_features(frames=5000 if args.suite == "quick" else 50000, repeat=args.repeat)
+    metrics += cases.bench_dataset_s3(frames=20000 if args.suite == "quick" else 50000, repeat=args.repeat)
+    metrics += cases.bench_training_tensors(frames=5000 if args.suite == "quick" else 50000, repeat=args.repeat)
+    metrics += cases.bench_roi()
+
+    for width, height, _ in SUITES[args.suite]:
+        metrics += cases.bench_render(width, height, frames=100, repeat=args.repeat)
+
+    if args.skip_mediapipe:
+        skipped["pipeline/mediapipe"] = "--skip-mediapipe"
+    else:
+        try:
+            factory = cases.mediapipe_factory(args.model_path)
+        except RuntimeError as exc:
+            skipped["pipeline/mediapipe"] = str(exc)
+        else:
+            for label, video in videos:
+                metrics += cases.bench_pipeline(video, label, factory, backend="mediapipe")
+    return metrics, skipped
+
+
+def main() -> None:
+    args = parse_args()
+    metrics, skipped = run_suite(args)
+    payload = {
+        "suite": args.suite,
+        "environment": environment(),
+        "metrics": [metric.to_dict() for metric in metrics],
+        "skipped": skipped,
+    }
+    output = Path(args.output)
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with output.open("w", encoding="utf-8") as fp:
+        json.dump(payload, fp, indent=2)
+
+    for metric in metrics:
+        print(f"{metric.name:<48} {metric.value:>14.2f} {metric.unit}")
+    for name, reason in skipped.items():
+        print(f"{name:<48} skipped: {reason}")
+    print(f"Results written to {output}")
+
+    if args.baseline:
+        comparisons = compare(load_metrics(args.baseline), load_metrics(output))
+        print(format_report(comparisons, args.threshold))
+        regressions = [item for item in comparisons if item.regressed(args.threshold)]
+        if regressions:
+            raise SystemExit(f"{len(regressions)} metric(s) regressed by more than {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
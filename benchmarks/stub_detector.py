@@ -0,0 +1,145 @@
+"""Deterministic detector that emits realistic HandPosition data without MediaPipe."""
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+
+from roboticsdatacolleciton.types import NUM_LANDMARKS, HandPosition
+
+# Right hand, palm facing the camera, in units of hand length with the wrist
+# at the origin and fingers pointing up (MediaPipe landmark order).
+_TEMPLATE = np.array(
+    [
+        (0.00, 0.00), (-0.18, -0.10), (-0.30, -0.25), (-0.38, -0.40), (-0.45, -0.52),
+        (-0.15, -0.45), (-0.17, -0.65), (-0.18, -0.78), (-0.19, -0.90),
+        (0.00, -0.48), (0.00, -0.70), (0.00, -0.85), (0.00, -0.98),
+        (0.13, -0.45), (0.15, -0.65), (0.16, -0.78), (0.17, -0.88),
+        (0.24, -0.38), (0.28, -0.52), (0.30, -0.62), (0.32, -0.72),
+    ],
+    dtype=np.float32,
+)
+_DEPTH = np.linspace(0.0, -0.08, NUM_LANDMARKS, dtype=np.float32)
+
+
+class StubHandDetector:
+    """Implements the HandDetector protocol with smooth, seeded hand motion.
+
+    Frame ``n`` always yields the same hands for a given ``seed``, so logs and
+    rendering costs are comparable across runs. Every ``gap_every`` frames no
+    hands are returned, mimicking detections dropping out.
+    """
+
+    def __init__(self, max_num_hands: int = 2, seed: int = 0, gap_every: int = 15) -> None:
+        self.max_num_hands = max_num_hands
+        self.seed = seed
+        self.gap_every = gap_every
+        rng = np.random.default_rng(seed)
+        self._phases = rng.uniform(0, 2 * np.pi, size=(max_num_hands, 3))
+        self._frame = 0
+
+    @property
+    def cache_params(self) -> dict:
+        return {"backend": "stub", "max_num_hands": self.max_num_hands, "seed": self.seed}
+
+    def detect(self, frame: np.ndarray) -> List[HandPosition]:
+        index = self._frame
+        self._frame += 1
+        if self.gap_every and index % self.gap_every == self.gap_every - 1:
+            return []
+        height, width = frame.shape[:2]
+        positions = []
+        for hand, (phase_x, phase_y, phase_r) in enumerate(self._phases):
+            angle = 0.4 * np.sin(phase_r + index * 0.05)
+            rotation = np.array([[np.cos(angle), -np.sin(angle)], [np.sin(angle), np.cos(angle)]], dtype=np.float32)
+            scale = 0.22 + 0.04 * np.sin(phase_r + index * 0.03)
+            wrist = (
+                0.3 + 0.4 * hand / max(1, self.max_num_hands - 1) + 0.1 * np.sin(phase_x + index * 0.02),
+                0.8 + 0.05 * np.cos(phase_y + index * 0.02),
+            )
+            template = _TEMPLATE * (1.0 if hand % 2 else -1.0, 1.0)
+            landmarks = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+            landmarks[:, :2] = template @ rotation.T * scale + wrist
+            landmarks[:, 2] = _DEPTH
+            palm_x, palm_y = landmarks[:, :2].mean(axis=0, dtype=np.float64).tolist()
+            positions.append(
+                HandPosition(
+                    label="Right" if hand % 2 else "Left",
+                    confidence=0.9,
+                    normalized_palm=(palm_x, palm_y),
+                    pixel_palm=(int(palm_x * width), int(palm_y * height)),
+                    landmark_array=landmarks,
+                )
+            )
+        return positions
+
+    def reset(self) -> None:
+        self._frame = 0
+
+    def warm_up(self, frame_shape: tuple = (480, 640, 3)) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class MarkerHandDetector:
+    """Finds one bright marker and reports the hand template stretched over it.
+
+    Stateful like MediaPipe's video mode: once a hand is found, the next call
+    only searches the previous hand's region (in normalized coordinates of
+    the previous image), so feeding it a different crop without ``reset()``
+    clips or loses the marker. Used to check ``RegionOfInterestDetector``.
+    """
+
+    def __init__(self, threshold: int = 128, region_padding: float = 0.5) -> None:
+        self.threshold = threshold
+        self.region_padding = region_padding
+        self._region = None
+
+    @property
+    def cache_params(self) -> dict:
+        return {"backend": "marker", "threshold": self.threshold}
+
+    def detect(self, frame: np.ndarray) -> List[HandPosition]:
+        height, width = frame.shape[:2]
+        bright = frame.max(axis=2) >= self.threshold
+        if self._region is not None:
+            x0, y0, x1, y1 = self._region
+            window = np.zeros_like(bright)
+            window[int(y0 * height):int(np.ceil(y1 * height)), int(x0 * width):int(np.ceil(x1 * width))] = True
+            bright &= window
+        ys, xs = np.nonzero(bright)
+        if not len(xs):
+            self._region = None
+            return []
+        left, right = xs.min() / width, (xs.max() + 1) / width
+        top, bottom = ys.min() / height, (ys.max() + 1) / height
+        pad_x, pad_y = (right - left) * self.region_padding, (bottom - top) * self.region_padding
+        self._region = (max(0.0, left - pad_x), max(0.0, top - pad_y), min(1.0, right + pad_x), min(1.0, bottom + pad_y))
+
+        lower, upper = _TEMPLATE.min(axis=0), _TEMPLATE.max(axis=0)
+        unit = (_TEMPLATE - lower) / (upper - lower)
+        landmarks = np.empty((NUM_LANDMARKS, 3), dtype=np.float32)
+        landmarks[:, 0] = left + unit[:, 0] * (right - left)
+        landmarks[:, 1] = top + unit[:, 1] * (bottom - top)
+        landmarks[:, 2] = _DEPTH
+        palm_x, palm_y = landmarks[:, :2].mean(axis=0, dtype=np.float64).tolist()
+        return [
+            HandPosition(
+                label="Right",
+                confidence=0.9,
+                normalized_palm=(palm_x, palm_y),
+                pixel_palm=(int(palm_x * width), int(palm_y * height)),
+                landmark_array=landmarks,
+            )
+        ]
+
+    def reset(self) -> None:
+        self._region = None
+
+    def warm_up(self, frame_shape: tuple = (480, 640, 3)) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
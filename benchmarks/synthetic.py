@@ -0,0 +1,71 @@
+"""Deterministic synthetic videos for benchmarking decode and end-to-end throughput."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Tuple
+
+import cv2
+import numpy as np
+
+
+def video_name(width: int, height: int, frames: int, fps: float = 30.0, seed: int = 0) -> str:
+    return f"synthetic_{width}x{height}_{frames}f_{fps:g}fps_s{seed}.mp4"
+
+
+def generate_video(
+    path: str | Path,
+    width: int,
+    height: int,
+    frames: int,
+    fps: float = 30.0,
+    seed: int = 0,
+) -> Path:
+    """Write an mp4 of moving skin-toned blobs over a textured background.
+
+    The same arguments always produce the same frames, and the content moves
+    every frame so codecs cannot collapse it into trivially cheap P-frames.
+    Existing files are reused.
+    """
+
+    path = Path(path)
+    if path.exists():
+        return path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    background = rng.integers(40, 90, size=(height, width, 3), dtype=np.uint8)
+    background = cv2.GaussianBlur(background, (0, 0), sigmaX=max(1.0, width / 200))
+    tmp_path = path.with_name(f".{path.name}.tmp.mp4")
+    writer = cv2.VideoWriter(str(tmp_path), cv2.VideoWriter_fourcc(*"mp4v"), fps, (width, height))
+    if not writer.isOpened():
+        raise RuntimeError(f"OpenCV cannot encode mp4v video at {tmp_path}")
+    try:
+        blobs = _blob_paths(rng, count=2)
+        for index in range(frames):
+            frame = np.roll(background, (index * 3) % width, axis=1)
+            for centre, radius, color in _blob_positions(blobs, index, width, height):
+                cv2.circle(frame, centre, radius, color, -1, cv2.LINE_AA)
+            writer.write(frame)
+    finally:
+        writer.release()
+    tmp_path.replace(path)
+    return path
+
+
+def _blob_paths(rng: np.random.Generator, count: int) -> np.ndarray:
+    # Per blob: x/y phase, x/y angular speed, radius fraction.
+    return np.column_stack(
+        [
+            rng.uniform(0, 2 * np.pi, size=(count, 2)),
+            rng.uniform(0.01, 0.05, size=(count, 2)),
+            rng.uniform(0.06, 0.12, size=count),
+        ]
+    )
+
+
+def _blob_positions(blobs: np.ndarray, index: int, width: int, height: int):
+    colors: Tuple[Tuple[int, int, int], ...] = ((120, 160, 220), (100, 140, 200))
+    for blob, color in zip(blobs, colors):
+        phase_x, phase_y, speed_x, speed_y, radius = blob
+        x = 0.5 + 0.35 * np.sin(phase_x + speed_x * index)
+        y = 0.5 + 0.35 * np.cos(phase_y + speed_y * index)
+        yield (int(x * width), int(y * height)), max(2, int(radius * min(width, height))), color
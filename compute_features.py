@@ -0,0 +1,92 @@
+"""Compute kinematic features (velocities, grip aperture, ...) for existing hand logs."""
+from __future__ import annotations
+
+import argparse
+import glob
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Derive per-hand kinematic features from Parquet hand logs")
+    parser.add_argument("logs", nargs="+", help="Parquet logs (globs allowed)")
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Output path for a single log (defaults to <log>.features.parquet next to each log)",
+    )
+    parser.add_argument("--fps", type=float, default=30.0, help="Frame rate for logs without captured_at timestamps")
+    parser.add_argument(
+        "--max-gap-frames",
+        type=int,
+        default=5,
+        help="Leave velocities undefined across gaps longer than this many frames",
+    )
+    parser.add_argument(
+        "--frame-size",
+        type=str,
+        default=None,
+        help="WIDTHxHEIGHT of the source video (inferred from the log when omitted)",
+    )
+    parser.add_argument("--batch-size", type=int, default=65536, help="Rows streamed per batch")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes for several logs (defaults to CPU count)")
+    return parser.parse_args()
+
+
+def parse_frame_size(value: Optional[str]) -> Optional[Tuple[int, int]]:
+    if value is None:
+        return None
+    width, _, height = value.lower().partition("x")
+    try:
+        return int(width), int(height)
+    except ValueError:
+        raise SystemExit(f"--frame-size must look like 1280x720, got {value!r}") from None
+
+
+def main() -> None:
+    args = parse_args()
+    # Imported after argument parsing so --help does not load PyArrow.
+    from roboticsdatacolleciton.features import compute_kinematic_features
+
+    paths: List[str] = [path for pattern in args.logs for path in (sorted(glob.glob(pattern)) or [pattern])]
+    paths = [path for path in paths if not path.endswith(".features.parquet")]
+    if args.output and len(paths) != 1:
+        raise SystemExit("--output can only be used with a single log")
+    missing = [path for path in paths if not Path(path).is_file()]
+    if missing:
+        raise SystemExit(f"Log not found: {missing[0]}")
+    options = dict(
+        fps=args.fps,
+        max_gap_frames=args.max_gap_frames,
+        frame_size=parse_frame_size(args.frame_size),
+        batch_size=args.batch_size,
+    )
+
+    workers = min(len(paths), args.workers or os.cpu_count() or 1)
+    if workers <= 1:
+        results = (compute_kinematic_features(path, args.output, **options) for path in paths)
+        for stats in results:
+            print_stats(stats)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {pool.submit(compute_kinematic_features, path, None, **options): path for path in paths}
+        for future in as_completed(futures):
+            print_stats(future.result())
+
+
+def print_stats(stats) -> None:  # noqa: ANN001
+    print(
+        f"{stats.log_path} -> {stats.output_path}: {stats.rows} rows, {stats.frames} frames, "
+        f"{stats.tracks} tracks, {stats.gaps} gaps, {stats.rows_per_second:,.0f} rows/s",
+        flush=True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Manage a partitioned hand-log dataset on local disk or S3: add logs, compact, list."""
+from __future__ import annotations
+
+import argparse
+import glob
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Manage a partitioned dataset of hand logs")
+    parser.add_argument(
+        "--dataset",
+        type=str,
+        required=True,
+        help="Dataset root: a local directory or s3://bucket/prefix",
+    )
+    parser.add_argument("--endpoint-url", type=str, default=None, help="S3-compatible endpoint (e.g. MinIO)")
+    parser.add_argument("--row-group-size", type=int, default=1_048_576, help="Rows per row group after compaction")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    add = subparsers.add_parser("add", help="Upload Parquet logs into a session/camera/date partition")
+    add.add_argument("logs", nargs="+", help="Parquet logs (globs allowed); sibling .summary.json files are uploaded too")
+    add.add_argument("--session", type=str, required=True, help="Session identifier")
+    add.add_argument("--camera", type=str, default="cam0", help="Camera identifier")
+    add.add_argument("--date", type=str, default=None, help="Partition date YYYY-MM-DD (defaults to each log's mtime)")
+
+    compact = subparsers.add_parser("compact", help="Merge small files within each partition")
+    compact.add_argument("--small-file-mb", type=float, default=32.0, help="Files below this size are merged")
+    compact.add_argument("--target-file-mb", type=float, default=512.0, help="Upper bound for merged files")
+
+    subparsers.add_parser("ls", help="List partitions and file statistics from the manifest")
+    subparsers.add_parser("rebuild-manifest", help="Recreate the manifest from the stored files")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    # Imported after argument parsing so --help does not load PyArrow.
+    from roboticsdatacolleciton.storage import HandDataset, Partition, open_storage
+
+    options = {"endpoint_url": args.endpoint_url} if args.endpoint_url else {}
+    storage = open_storage(args.dataset, **options)
+    dataset = HandDataset(storage, row_group_size=args.row_group_size)
+    try:
+        if args.command == "add":
+            paths = [path for pattern in args.logs for path in (sorted(glob.glob(pattern)) or [pattern])]
+            # One add_logs call uploads everything in parallel and writes the manifest once.
+            added = dataset.add_logs(
+                (path, Partition.for_log(path, args.session, args.camera, args.date)) for path in paths
+            )
+            for entry in added:
+                print(f"{entry.key}: {entry.rows} rows, frames {entry.frame_min}-{entry.frame_max}")
+        elif args.command == "compact":
+            report = dataset.compact(
+                small_file_bytes=int(args.small_file_mb * 1024 * 1024),
+                target_file_bytes=int(args.target_file_mb * 1024 * 1024),
+            )
+            print(
+                f"Compacted {report.files_before} files into {report.files_after} "
+                f"({report.rows} rows, {report.bytes_before / 1e6:.1f} MB -> {report.bytes_after / 1e6:.1f} MB) "
+                f"in {report.elapsed_seconds:.1f}s"
+            )
+        elif args.command == "ls":
+            for partition in dataset.partitions():
+                entries = [entry for entry in dataset.entries if entry.partition == partition]
+                rows = sum(entry.rows for entry in entries)
+                size = sum(entry.bytes for entry in entries)
+                recordings = sum(len(entry.sources) for entry in entries)
+                print(f"{partition.prefix}: {len(entries)} files, {recordings} recordings, {rows} rows, {size / 1e6:.1f} MB")
+        elif args.command == "rebuild-manifest":
+            print(f"Manifest lists {len(dataset.rebuild_manifest())} files")
+    finally:
+        storage.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""Pack hand logs into memory-mapped .npy tensors with a per-video index for training."""
+from __future__ import annotations
+
+import argparse
+import glob
+from pathlib import Path
+from typing import List
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Export Parquet hand logs to memory-mappable training tensors")
+    parser.add_argument("logs", nargs="+", help="Parquet logs (globs allowed), concatenated in the given order")
+    parser.add_argument("--output-dir", type=str, required=True, help="Directory for the .npy arrays and index.json")
+    parser.add_argument("--max-hands", type=int, default=2, help="Hand slots per frame; extra hands are dropped")
+    parser.add_argument("--min-confidence", type=float, default=None, help="Skip hands below this confidence")
+    parser.add_argument("--labels", nargs="+", default=None, help="Only export these handedness labels")
+    parser.add_argument("--batch-size", type=int, default=65536, help="Rows streamed per batch")
+    parser.add_argument("--overwrite", action="store_true", help="Replace an existing, non-empty output directory")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    # Imported after argument parsing so --help does not load PyArrow.
+    from roboticsdatacolleciton.training import export_training_tensors
+
+    paths: List[str] = [path for pattern in args.logs for path in (sorted(glob.glob(pattern)) or [pattern])]
+    paths = [path for path in paths if not path.endswith(".features.parquet")]
+    missing = [path for path in paths if not Path(path).is_file()]
+    if missing:
+        raise SystemExit(f"Log not found: {missing[0]}")
+    try:
+        report = export_training_tensors(
+            paths,
+            args.output_dir,
+            max_hands=args.max_hands,
+            min_confidence=args.min_confidence,
+            labels=args.labels,
+            batch_size=args.batch_size,
+            overwrite=args.overwrite,
+        )
+    except FileExistsError as exc:
+        raise SystemExit(str(exc)) from None
+    for video in report.videos:
+        print(f"{video.log_path}: rows {video.offset}-{video.offset + video.frames}, frames from {video.first_frame}")
+    print(
+        f"Exported {report.frames} frames ({report.hands} hands, {report.dropped_hands} dropped) "
+        f"to {report.output_dir}: {report.bytes / 1e6:.1f} MB in {report.elapsed_seconds:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Render an annotated copy of a video from its existing hand log, without re-running detection."""
+from __future__ import annotations
+
+import argparse
+from pathlib import Path
+
+from roboticsdatacolleciton.video import VideoFileOpenError
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Draw logged hand detections onto a video and save it")
+    parser.add_argument("--video-path", type=str, required=True, help="Video the log was produced from")
+    parser.add_argument(
+        "--log-path",
+        type=str,
+        default=None,
+        help="Parquet log written by process_video.py (defaults to logs/<video-name>.parquet)",
+    )
+    parser.add_argument(
+        "--output",
+        type=str,
+        default=None,
+        help="Annotated video to write (defaults to <video-name>.annotated.mp4 next to the log)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to CPU count)")
+    parser.add_argument("--segments", type=int, default=None, help="Frame ranges to split into (defaults to --workers)")
+    parser.add_argument("--codec", type=str, default="mp4v", help="FourCC passed to cv2.VideoWriter")
+    parser.add_argument("--min-confidence", type=float, default=None, help="Only draw hands at or above this score")
+    parser.add_argument("--keep-segments", action="store_true", help="Keep per-segment videos after concatenation")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    # Imported after argument parsing so --help does not load OpenCV or PyArrow.
+    from roboticsdatacolleciton.batch import AnnotatedVideoExporter
+
+    video_path = Path(args.video_path)
+    log_path = Path(args.log_path) if args.log_path else Path("logs") / f"{video_path.stem}.parquet"
+    output_path = Path(args.output) if args.output else log_path.with_name(f"{video_path.stem}.annotated.mp4")
+    try:
+        exporter = AnnotatedVideoExporter(
+            video_path,
+            log_path,
+            output_path,
+            num_workers=args.workers,
+            num_segments=args.segments,
+            codec=args.codec,
+            min_confidence=args.min_confidence,
+            keep_segments=args.keep_segments,
+        )
+        report = exporter.run()
+    except (VideoFileOpenError, FileNotFoundError, ValueError) as exc:
+        raise SystemExit(str(exc)) from exc
+
+    for segment in report.segments:
+        if not segment.ok:
+            print(f"Segment {segment.index} failed: {segment.error}")
+    if report.failures:
+        raise SystemExit(1)
+    print(
+        f"Wrote {report.frames} frames to {report.output_path} in {report.elapsed_seconds:.1f}s "
+        f"({report.fps:.1f} fps, {len(report.segments)} segments joined by {report.concat_method})"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,14 +2,17 @@
 from __future__ import annotations
 
 import argparse
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 
-from roboticsdatacolleciton.config import RealtimeTrackingConfig
-from roboticsdatacolleciton.detection import MediaPipeHandTracker
-from roboticsdatacolleciton.pipelines import RealTimeHandTrackingPipeline
-from roboticsdatacolleciton.types import HandPosition
-from roboticsdatacolleciton.video import CameraOpenError, CameraStream
-from roboticsdatacolleciton.visualization import HandPreviewRenderer
+from roboticsdatacolleciton.config import MultiCameraConfig, RealtimeTrackingConfig
+from roboticsdatacolleciton.detection import DETECTOR_BACKENDS
+from roboticsdatacolleciton.ipc import DEFAULT_SHM_NAME
+from roboticsdatacolleciton.loggers import OVERFLOW_POLICIES
+from roboticsdatacolleciton.video import CameraOpenError
+
+if TYPE_CHECKING:
+    from roboticsdatacolleciton.pipelines import MultiCameraFrame
+    from roboticsdatacolleciton.types import HandPosition
 
 
 def parse_args() -> argparse.Namespace:
@@ -20,11 +23,103 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--min-detection-confidence", type=float, default=0.5, help="MediaPipe detection score threshold")
     parser.add_argument("--min-tracking-confidence", type=float, default=0.5, help="MediaPipe tracking score threshold")
     parser.add_argument("--max-num-hands", type=int, default=2, help="Maximum hands to track")
+    parser.add_argument(
+        "--backend",
+        choices=DETECTOR_BACKENDS,
+        default="solutions",
+        help="MediaPipe API to run. 'tasks' uses HandLandmarker in LIVE_STREAM mode so capture and inference overlap.",
+    )
+    parser.add_argument("--model-path", type=str, default=None, help="HandLandmarker .task model for --backend tasks")
+    parser.add_argument("--model-complexity", type=int, choices=(0, 1), default=1, help="Hands model size for --backend solutions")
     parser.add_argument(
         "--no-preview",
         action="store_true",
         help="Disable the OpenCV window that shows the live preview with overlays.",
     )
+    parser.add_argument(
+        "--preview-fps",
+        type=float,
+        default=30.0,
+        help="Refresh the preview window at most this often; frames in between are not drawn.",
+    )
+    parser.add_argument(
+        "--roi",
+        action="store_true",
+        help="Run inference on a crop around the previous frame's hands, falling back to the full frame when tracking is lost",
+    )
+    parser.add_argument("--roi-margin", type=float, default=0.25, help="Crop padding as a fraction of the hands' bounding box")
+    parser.add_argument(
+        "--max-inference-width",
+        type=int,
+        default=None,
+        help="Downscale the image handed to MediaPipe to at most this many pixels wide",
+    )
+    parser.add_argument(
+        "--latest-frame-only",
+        action="store_true",
+        help="Grab frames on a background thread and always detect on the newest one, dropping stale frames.",
+    )
+    parser.add_argument(
+        "--buffer-pool",
+        action="store_true",
+        help="Reuse frame buffers for capture, color conversion and preview instead of allocating per frame.",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="logs/profile.json",
+        default=None,
+        metavar="JSON_PATH",
+        help="Time every pipeline stage and write the results as JSON at exit (default path: logs/profile.json)",
+    )
+    parser.add_argument(
+        "--prometheus-file",
+        type=str,
+        default=None,
+        help="Also rewrite stage metrics in Prometheus text format to this file while running",
+    )
+    parser.add_argument("--prometheus-interval", type=float, default=10.0, help="Seconds between Prometheus file updates")
+    parser.add_argument(
+        "--cameras",
+        nargs="+",
+        default=None,
+        metavar="SOURCE",
+        help="Track several cameras at once, one worker process each. Sources are device indices or video files "
+        "(played back in real time as virtual cameras). Replaces --device-index; the preview window is disabled.",
+    )
+    parser.add_argument(
+        "--sync-tolerance-ms",
+        type=float,
+        default=20.0,
+        help="Detections from different cameras captured within this window are merged into one multi-camera frame",
+    )
+    parser.add_argument("--loop-files", action="store_true", help="Restart file-backed cameras when they reach the end")
+    parser.add_argument(
+        "--shm-publish",
+        nargs="?",
+        const=DEFAULT_SHM_NAME,
+        default=None,
+        metavar="NAME",
+        help=f"Publish every frame's detections to a shared-memory ring buffer for local controllers "
+        f"(default name: {DEFAULT_SHM_NAME}); read it with roboticsdatacolleciton.ipc.SharedHandsReader",
+    )
+    parser.add_argument("--shm-slots", type=int, default=64, help="Frames kept in the shared-memory ring buffer")
+    parser.add_argument("--quiet", action="store_true", help="Do not print detections to the console")
+    parser.add_argument(
+        "--log-path",
+        type=str,
+        default=None,
+        help="Record detections with capture timestamps to this Parquet file on a background thread",
+    )
+    parser.add_argument("--row-group-size", type=int, default=8192, help="Rows per Parquet row group when recording")
+    parser.add_argument("--log-queue-size", type=int, default=1024, help="Frames buffered for the recording thread")
+    parser.add_argument(
+        "--log-overflow",
+        choices=OVERFLOW_POLICIES,
+        default="spill",
+        help="What to do when the recording queue is full: wait for the writer, drop the oldest queued frame, "
+        "or spill frames to a temporary file and write them once the writer catches up",
+    )
     return parser.parse_args()
 
 
@@ -42,8 +137,60 @@ def console_output(positions: Iterable[HandPosition]) -> None:
     print(f"\r{message}", end="", flush=True)
 
 
+def no_output(positions: Iterable[HandPosition]) -> None:
+    pass
+
+
+def multi_camera_output(frame: MultiCameraFrame) -> None:
+    parts = []
+    for name, result in frame.results.items():
+        parts.append(f"{name}: {len(result.positions)} hands" if result is not None else f"{name}: --")
+    print(f"\r{' | '.join(parts)} (skew {frame.skew_ms:4.1f} ms)", end="", flush=True)
+
+
+def run_multi_camera(args: argparse.Namespace) -> None:
+    from roboticsdatacolleciton.pipelines import MultiCameraPipeline
+
+    config = MultiCameraConfig(
+        sources=[int(source) if source.isdigit() else source for source in args.cameras],
+        frame_width=args.frame_width,
+        frame_height=args.frame_height,
+        max_num_hands=args.max_num_hands,
+        min_detection_confidence=args.min_detection_confidence,
+        min_tracking_confidence=args.min_tracking_confidence,
+        detector_backend=args.backend,
+        model_complexity=args.model_complexity,
+        model_path=args.model_path,
+        sync_tolerance_ms=args.sync_tolerance_ms,
+        loop_files=args.loop_files,
+    )
+    stats = MultiCameraPipeline(config, output_fn=multi_camera_output).run()
+    print(f"\n{stats.merged_frames} merged frames, {stats.complete_frames} with every camera present")
+    for camera, source in zip(stats.cameras.values(), config.sources):
+        if camera.error:
+            print(f"{camera.name} ({source}): failed with {camera.error}")
+            continue
+        print(
+            f"{camera.name} ({source}): {camera.frames} frames at {camera.fps:.1f} fps, "
+            f"{camera.dropped_frames} dropped, latency mean {camera.latency.mean_latency_ms:.1f} ms / "
+            f"p95 {camera.latency.p95_latency_ms:.1f} ms / max {camera.latency.max_latency_ms:.1f} ms"
+        )
+
+
 def main() -> None:
     args = parse_args()
+    if args.cameras:
+        run_multi_camera(args)
+        return
+    # Imported after argument parsing so --help does not load OpenCV, MediaPipe or PyArrow.
+    from roboticsdatacolleciton.detection import RegionOfInterestDetector, create_hand_detector
+    from roboticsdatacolleciton.ipc import SharedHandsPublisher
+    from roboticsdatacolleciton.loggers import BackgroundHandLogWriter, HandLogWriter
+    from roboticsdatacolleciton.pipelines import RealTimeHandTrackingPipeline
+    from roboticsdatacolleciton.profiling import PrometheusTextfileWriter, StageProfiler
+    from roboticsdatacolleciton.video import CameraStream, FrameBufferPool
+    from roboticsdatacolleciton.visualization import HandPreviewRenderer
+
     config = RealtimeTrackingConfig(
         device_index=args.device_index,
         frame_width=args.frame_width,
@@ -51,31 +198,112 @@ def main() -> None:
         max_num_hands=args.max_num_hands,
         min_detection_confidence=args.min_detection_confidence,
         min_tracking_confidence=args.min_tracking_confidence,
+        detector_backend=args.backend,
+        model_complexity=args.model_complexity,
+        model_path=args.model_path,
+        latest_frame_only=args.latest_frame_only,
+        roi_tracking=args.roi,
+        roi_margin=args.roi_margin,
+        max_inference_width=args.max_inference_width,
+        reuse_frame_buffers=args.buffer_pool,
     )
 
+    buffer_pool = FrameBufferPool() if config.reuse_frame_buffers else None
+    profiler = StageProfiler() if args.profile or args.prometheus_file else None
     camera = CameraStream(
         device_index=config.device_index,
         frame_width=config.frame_width,
         frame_height=config.frame_height,
+        latest_frame_only=config.latest_frame_only,
+        buffer_pool=buffer_pool,
+    )
+    roi = config.roi_tracking or bool(config.max_inference_width)
+    try:
+        detector = create_hand_detector(
+            config.detector_backend,
+            # The ROI wrapper needs each frame's result before cropping the next, so it stays synchronous.
+            running_mode="video" if roi else "live_stream",
+            model_path=config.model_path,
+            model_complexity=config.model_complexity,
+            max_num_hands=config.max_num_hands,
+            min_detection_confidence=config.min_detection_confidence,
+            min_tracking_confidence=config.min_tracking_confidence,
+            buffer_pool=buffer_pool,
+            profiler=profiler,
+        )
+    except FileNotFoundError as exc:
+        raise SystemExit(str(exc)) from exc
+    if roi:
+        detector = RegionOfInterestDetector(
+            detector,
+            margin=config.roi_margin,
+            max_inference_width=config.max_inference_width,
+            full_frame_interval=30 if config.roi_tracking else 1,
+        )
+    # Pay for graph start-up now rather than on the first camera frame.
+    detector.warm_up((config.frame_height or 480, config.frame_width or 640, 3))
+
+    visualizer = None if args.no_preview else HandPreviewRenderer(
+        window_name="Hand Tracking Preview", buffer_pool=buffer_pool, max_display_fps=args.preview_fps
     )
-    detector = MediaPipeHandTracker(
-        max_num_hands=config.max_num_hands,
-        min_detection_confidence=config.min_detection_confidence,
-        min_tracking_confidence=config.min_tracking_confidence,
+
+    publisher = (
+        SharedHandsPublisher(args.shm_publish, slots=args.shm_slots, max_hands=config.max_num_hands)
+        if args.shm_publish
+        else None
     )
 
-    visualizer = None if args.no_preview else HandPreviewRenderer(window_name="Hand Tracking Preview")
+    recorder = (
+        BackgroundHandLogWriter(
+            HandLogWriter(output_path=args.log_path, row_group_size=args.row_group_size, timestamps=True),
+            queue_size=args.log_queue_size,
+            overflow=args.log_overflow,
+        )
+        if args.log_path
+        else None
+    )
 
     pipeline = RealTimeHandTrackingPipeline(
         camera=camera,
         detector=detector,
         config=config,
-        output_fn=console_output,
+        output_fn=no_output if args.quiet else console_output,
         visualizer=visualizer,
+        profiler=profiler,
+        publisher=publisher,
+        recorder=recorder,
     )
+    exporter = (
+        PrometheusTextfileWriter(profiler, args.prometheus_file, interval=args.prometheus_interval)
+        if args.prometheus_file
+        else None
+    )
+    if exporter:
+        exporter.start()
 
     try:
-        pipeline.run()
+        stats = pipeline.run()
+        print(
+            f"\n{stats.frames} frames, capture-to-detection latency "
+            f"mean {stats.mean_latency_ms:.1f} ms / p95 {stats.p95_latency_ms:.1f} ms / max {stats.max_latency_ms:.1f} ms, "
+            f"{stats.dropped_frames} stale frames dropped",
+            end="",
+        )
+        if recorder:
+            recording = recorder.stats
+            print(
+                f"\nRecorded {recording.written_frames} frames to {args.log_path} "
+                f"({recording.dropped_frames} dropped, {recording.spilled_frames} spilled, "
+                f"max queue depth {recording.max_queue_depth})",
+                end="",
+            )
+        if buffer_pool:
+            pool = buffer_pool.stats
+            print(
+                f"\nBuffer pool: {pool.allocations} allocations, {pool.reuses} reuses ({pool.reuse_ratio:.1%}), "
+                f"{pool.bytes_reused / 1024**2:.1f} MiB not reallocated",
+                end="",
+            )
     except CameraOpenError as exc:
         print(
             "\nCould not access the camera. Verify permissions (System Settings → Privacy & Security → Camera) "
@@ -84,6 +312,13 @@ def main() -> None:
         raise SystemExit(str(exc)) from exc
     finally:
         print()
+        if exporter:
+            exporter.stop()
+        if profiler:
+            print(profiler.format_table())
+            if args.profile:
+                profiler.dump_json(args.profile)
+                print(f"Stage profile written to {args.profile}")
 
 
 if __name__ == "__main__":
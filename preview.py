@@ -3,10 +3,8 @@ from __future__ import annotations
 
 import argparse
 
-from roboticsdatacolleciton.detection import MediaPipeHandTracker
-from roboticsdatacolleciton.pipelines import VideoProcessingPipeline
-from roboticsdatacolleciton.video import VideoFileOpenError, VideoFileStream
-from roboticsdatacolleciton.visualization import HandPreviewRenderer
+from roboticsdatacolleciton.detection import DEFAULT_CACHE_DIR, DETECTOR_BACKENDS
+from roboticsdatacolleciton.video import VideoFileOpenError
 
 
 def parse_args() -> argparse.Namespace:
@@ -20,28 +18,74 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--max-num-hands", type=int, default=2, help="Maximum hands to track")
     parser.add_argument("--min-detection-confidence", type=float, default=0.5)
     parser.add_argument("--min-tracking-confidence", type=float, default=0.5)
+    parser.add_argument("--backend", choices=DETECTOR_BACKENDS, default="solutions", help="MediaPipe API to run")
+    parser.add_argument("--model-path", type=str, default=None, help="HandLandmarker .task model for --backend tasks")
+    parser.add_argument("--model-complexity", type=int, choices=(0, 1), default=1, help="Hands model size for --backend solutions")
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        help="Decode up to this many frames ahead on a background thread (0 disables prefetching)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        nargs="?",
+        const=str(DEFAULT_CACHE_DIR),
+        default=None,
+        metavar="DIR",
+        help=(
+            "Cache detections in DIR and replay them on later runs over the same video "
+            f"(off by default; DIR defaults to {DEFAULT_CACHE_DIR})"
+        ),
+    )
+    parser.add_argument("--cache-max-gb", type=float, default=10.0, help="Evict cached detections above this size")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore --cache-dir and always run inference")
     return parser.parse_args()
 
 
 def main() -> None:
     args = parse_args()
-    detector = MediaPipeHandTracker(
-        max_num_hands=args.max_num_hands,
-        min_detection_confidence=args.min_detection_confidence,
-        min_tracking_confidence=args.min_tracking_confidence,
-    )
+    # Imported after argument parsing so --help does not load OpenCV, MediaPipe or PyArrow.
+    from roboticsdatacolleciton.detection import DetectionCache, create_hand_detector
+    from roboticsdatacolleciton.pipelines import VideoProcessingPipeline
+    from roboticsdatacolleciton.video import VideoFileStream
+    from roboticsdatacolleciton.visualization import HandPreviewRenderer
+
     preview = HandPreviewRenderer(window_name="Video Preview")
-    stream = VideoFileStream(args.video_path)
+    stream = VideoFileStream(args.video_path, prefetch=args.prefetch)
+    try:
+        detector = create_hand_detector(
+            args.backend,
+            running_mode="video",
+            model_path=args.model_path,
+            model_complexity=args.model_complexity,
+            max_num_hands=args.max_num_hands,
+            min_detection_confidence=args.min_detection_confidence,
+            min_tracking_confidence=args.min_tracking_confidence,
+            fps=stream.fps or 30.0,
+        )
+    except (VideoFileOpenError, FileNotFoundError) as exc:
+        raise SystemExit(str(exc)) from exc
+    cache = (
+        DetectionCache(args.cache_dir, max_bytes=int(args.cache_max_gb * 1024**3))
+        if args.cache_dir and not args.no_cache
+        else None
+    )
     pipeline = VideoProcessingPipeline(
         video_stream=stream,
         detector=detector,
+        cache=cache,
         logger=None,
         visualizer=preview,
     )
     try:
-        pipeline.run()
+        stats = pipeline.run()
     except VideoFileOpenError as exc:
         raise SystemExit(str(exc)) from exc
+    if cache:
+        entries, size = cache.usage()
+        source = "replayed from" if stats.cache_hit else "stored in"
+        print(f"Detections {source} {cache.root}: {entries} videos, {size / 1e9:.2f} of {args.cache_max_gb:.1f} GB")
 
 
 if __name__ == "__main__":
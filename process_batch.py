@@ -0,0 +1,82 @@
+"""Process a directory (or glob) of videos in parallel worker processes."""
+from __future__ import annotations
+
+import argparse
+
+from roboticsdatacolleciton.config import BatchProcessingConfig
+from roboticsdatacolleciton.detection import DETECTOR_BACKENDS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Detect hands in many videos using a process pool")
+    parser.add_argument(
+        "--input",
+        type=str,
+        default="data/videos",
+        help="Directory, glob expression, or single video to process",
+    )
+    parser.add_argument(
+        "--output-dir",
+        type=str,
+        default="logs",
+        help="Directory that receives one Parquet log per video",
+    )
+    parser.add_argument(
+        "--pattern",
+        type=str,
+        default=None,
+        help="Optional glob applied inside --input (defaults to common video extensions, recursive)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (defaults to CPU count)")
+    parser.add_argument("--max-num-hands", type=int, default=2, help="Maximum hands to track")
+    parser.add_argument("--min-detection-confidence", type=float, default=0.5)
+    parser.add_argument("--min-tracking-confidence", type=float, default=0.5)
+    parser.add_argument("--backend", choices=DETECTOR_BACKENDS, default="solutions", help="MediaPipe API to run")
+    parser.add_argument("--model-complexity", type=int, choices=(0, 1), default=1, help="Hands model size for --backend solutions")
+    parser.add_argument("--model-path", type=str, default=None, help="HandLandmarker .task model for --backend tasks")
+    parser.add_argument(
+        "--skip-existing",
+        action="store_true",
+        help="Skip videos whose Parquet log already exists (logs only appear once a video is fully processed)",
+    )
+    return parser.parse_args()
+
+
+def print_progress(result, completed: int, total: int) -> None:  # noqa: ANN001
+    from roboticsdatacolleciton.batch import format_result
+
+    print(format_result(result, completed, total), flush=True)
+
+
+def main() -> None:
+    args = parse_args()
+    # Imported after argument parsing so --help does not load OpenCV, MediaPipe or PyArrow.
+    from roboticsdatacolleciton.batch import BatchVideoProcessor, summarize
+
+    config = BatchProcessingConfig(
+        input_path=args.input,
+        output_path=args.output_dir,
+        pattern=args.pattern,
+        num_workers=args.workers,
+        max_num_hands=args.max_num_hands,
+        min_detection_confidence=args.min_detection_confidence,
+        min_tracking_confidence=args.min_tracking_confidence,
+        detector_backend=args.backend,
+        model_complexity=args.model_complexity,
+        model_path=args.model_path,
+        skip_existing=args.skip_existing,
+    )
+    processor = BatchVideoProcessor(config, progress_fn=print_progress)
+    jobs = processor.plan()
+    if not jobs:
+        raise SystemExit(f"No videos found under {args.input}")
+
+    print(f"Processing {len(jobs)} videos with {processor.num_workers} workers...", flush=True)
+    report = processor.run()
+    print(summarize(report))
+    if report.failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
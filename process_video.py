@@ -4,11 +4,10 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
-from roboticsdatacolleciton.detection import MediaPipeHandTracker
-from roboticsdatacolleciton.loggers import HandLogWriter
-from roboticsdatacolleciton.pipelines import VideoProcessingPipeline
-from roboticsdatacolleciton.video import VideoFileOpenError, VideoFileStream
-from roboticsdatacolleciton.visualization import HandPreviewRenderer
+from roboticsdatacolleciton.detection import DEFAULT_CACHE_DIR, DETECTOR_BACKENDS
+from roboticsdatacolleciton.video import VideoFileOpenError
+
+DEFAULT_CHECKPOINT_INTERVAL = 1000
 
 
 def parse_args() -> argparse.Namespace:
@@ -34,38 +33,290 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--max-num-hands", type=int, default=2, help="Maximum hands to track")
     parser.add_argument("--min-detection-confidence", type=float, default=0.5)
     parser.add_argument("--min-tracking-confidence", type=float, default=0.5)
+    parser.add_argument(
+        "--backend",
+        choices=DETECTOR_BACKENDS,
+        default="solutions",
+        help="MediaPipe API to run: the legacy Hands solution or the Tasks HandLandmarker (VIDEO mode)",
+    )
+    parser.add_argument("--model-path", type=str, default=None, help="HandLandmarker .task model for --backend tasks")
+    parser.add_argument("--model-complexity", type=int, choices=(0, 1), default=1, help="Hands model size for --backend solutions")
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=0,
+        help="Decode up to this many frames ahead on a background thread (0 disables prefetching)",
+    )
+    parser.add_argument(
+        "--buffer-pool",
+        action="store_true",
+        help="Reuse frame buffers for decoding, color conversion and preview instead of allocating per frame",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="logs/profile.json",
+        default=None,
+        metavar="JSON_PATH",
+        help="Time every pipeline stage and write the results as JSON at exit (default path: logs/profile.json)",
+    )
+    parser.add_argument(
+        "--prometheus-file",
+        type=str,
+        default=None,
+        help="Also rewrite stage metrics in Prometheus text format to this file while running",
+    )
+    parser.add_argument("--prometheus-interval", type=float, default=10.0, help="Seconds between Prometheus file updates")
+    parser.add_argument(
+        "--cache-dir",
+        nargs="?",
+        const=str(DEFAULT_CACHE_DIR),
+        default=None,
+        metavar="DIR",
+        help=(
+            "Cache detections in DIR and replay them on later runs over the same video "
+            f"(off by default; DIR defaults to {DEFAULT_CACHE_DIR})"
+        ),
+    )
+    parser.add_argument("--cache-max-gb", type=float, default=10.0, help="Evict cached detections above this size")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore --cache-dir and always run inference")
     parser.add_argument(
         "--preview",
         action="store_true",
         help="Show the OpenCV preview window while processing",
     )
+    parser.add_argument(
+        "--preview-fps",
+        type=float,
+        default=30.0,
+        help="Refresh the preview window at most this often; frames in between are not drawn",
+    )
+    parser.add_argument(
+        "--row-group-size",
+        type=int,
+        default=65536,
+        help="Rows buffered in memory before a Parquet row group is written",
+    )
+    parser.add_argument(
+        "--compression",
+        type=str,
+        default="zstd",
+        help="Parquet compression codec (zstd, snappy, gzip, lz4, brotli, none)",
+    )
+    parser.add_argument(
+        "--roi",
+        action="store_true",
+        help="Run inference on a crop around the previous frame's hands, falling back to the full frame when tracking is lost",
+    )
+    parser.add_argument("--roi-margin", type=float, default=0.25, help="Crop padding as a fraction of the hands' bounding box")
+    parser.add_argument(
+        "--max-inference-width",
+        type=int,
+        default=None,
+        help="Downscale the image handed to MediaPipe to at most this many pixels wide",
+    )
+    parser.add_argument(
+        "--motion-threshold",
+        type=float,
+        default=0.0,
+        help="Skip detection while the mean downscaled frame difference stays below this many gray levels (0 disables)",
+    )
+    parser.add_argument(
+        "--motion-refresh",
+        type=int,
+        default=30,
+        help="With --motion-threshold, force a fresh detection at least every N frames",
+    )
+    parser.add_argument(
+        "--checkpoint-interval",
+        type=int,
+        default=0,
+        help="Commit the log every N frames so an interrupted run can be resumed (0 disables)",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Continue from the last checkpoint of --log-path instead of starting over; implies "
+            f"--checkpoint-interval {DEFAULT_CHECKPOINT_INTERVAL} unless one is given. Exits if the log is already "
+            "complete"
+        ),
+    )
+    parser.add_argument(
+        "--shards",
+        type=int,
+        default=1,
+        help="Split the video into this many frame ranges processed in parallel worker processes",
+    )
+    parser.add_argument(
+        "--warmup-frames",
+        type=int,
+        default=30,
+        help="Frames decoded (and discarded) before each shard so tracking can settle",
+    )
     return parser.parse_args()
 
 
-def main() -> None:
-    args = parse_args()
-    detector = MediaPipeHandTracker(
+def run_sharded(args: argparse.Namespace) -> None:
+    from roboticsdatacolleciton.batch import ShardedVideoProcessor
+
+    processor = ShardedVideoProcessor(
+        video_path=args.video_path,
+        log_path=args.log_path,
+        summary_path=args.summary_path,
+        num_shards=args.shards,
+        num_workers=args.shards,
+        warmup_frames=args.warmup_frames,
         max_num_hands=args.max_num_hands,
         min_detection_confidence=args.min_detection_confidence,
         min_tracking_confidence=args.min_tracking_confidence,
+        backend=args.backend,
+        model_complexity=args.model_complexity,
+        model_path=args.model_path,
     )
+    try:
+        report = processor.run()
+    except VideoFileOpenError as exc:
+        raise SystemExit(str(exc)) from exc
+    if report.failures:
+        errors = "; ".join(f"{shard.log_path.name}: {shard.error}" for shard in report.failures)
+        raise SystemExit(f"Sharded processing failed ({errors})")
+    print(f"Wrote {report.rows_written} rows to {report.log_path} in {report.elapsed_seconds:.1f}s")
+
+
+def main() -> None:
+    args = parse_args()
+    # Imported after argument parsing so --help does not load OpenCV, MediaPipe or PyArrow.
+    from roboticsdatacolleciton.detection import DetectionCache, MotionGate, RegionOfInterestDetector, create_hand_detector
+    from roboticsdatacolleciton.loggers import HandLogWriter
+    from roboticsdatacolleciton.pipelines import VideoProcessingPipeline
+    from roboticsdatacolleciton.profiling import PrometheusTextfileWriter, StageProfiler
+    from roboticsdatacolleciton.video import FrameBufferPool, VideoFileStream
+    from roboticsdatacolleciton.visualization import HandPreviewRenderer
+
+    if args.shards > 1:
+        if args.preview or args.resume:
+            raise SystemExit("--preview and --resume are not supported together with --shards")
+        run_sharded(args)
+        return
+
+    checkpoint_interval = args.checkpoint_interval
+    if args.resume and not checkpoint_interval:
+        checkpoint_interval = DEFAULT_CHECKPOINT_INTERVAL
+    buffer_pool = FrameBufferPool() if args.buffer_pool else None
+    profiler = StageProfiler() if args.profile or args.prometheus_file else None
     logger = HandLogWriter(
         output_path=Path(args.log_path),
         summary_path=Path(args.summary_path) if args.summary_path else None,
+        row_group_size=args.row_group_size,
+        compression=args.compression,
+        checkpoint_interval=checkpoint_interval or None,
+        resume=args.resume,
     )
-    visualizer = HandPreviewRenderer(window_name="Video Processing Preview") if args.preview else None
-    stream = VideoFileStream(args.video_path)
+    if args.resume and not logger.resumed and logger.output_path.exists():
+        # A finished log has no checkpoint; starting over would silently overwrite it.
+        raise SystemExit(f"{args.log_path} is already complete; nothing to resume (delete it to process the video again)")
+    if logger.resume_frame:
+        print(f"Resuming {args.log_path} from frame {logger.resume_frame}")
+    visualizer = (
+        HandPreviewRenderer(
+            window_name="Video Processing Preview", buffer_pool=buffer_pool, max_display_fps=args.preview_fps
+        )
+        if args.preview
+        else None
+    )
+    stream = VideoFileStream(
+        args.video_path, start_frame=logger.resume_frame, prefetch=args.prefetch, buffer_pool=buffer_pool
+    )
+    try:
+        fps = stream.fps or 30.0
+        detector = create_hand_detector(
+            args.backend,
+            running_mode="video",
+            model_path=args.model_path,
+            model_complexity=args.model_complexity,
+            max_num_hands=args.max_num_hands,
+            min_detection_confidence=args.min_detection_confidence,
+            min_tracking_confidence=args.min_tracking_confidence,
+            fps=fps,
+            buffer_pool=buffer_pool,
+            profiler=profiler,
+        )
+    except (VideoFileOpenError, FileNotFoundError) as exc:
+        raise SystemExit(str(exc)) from exc
+    if args.roi or args.max_inference_width:
+        detector = RegionOfInterestDetector(
+            detector,
+            margin=args.roi_margin,
+            max_inference_width=args.max_inference_width,
+            full_frame_interval=30 if args.roi else 1,
+        )
 
+    motion_gate = (
+        MotionGate(threshold=args.motion_threshold, refresh_interval=args.motion_refresh)
+        if args.motion_threshold > 0
+        else None
+    )
+    cache = (
+        DetectionCache(args.cache_dir, max_bytes=int(args.cache_max_gb * 1024**3))
+        if args.cache_dir and not args.no_cache
+        else None
+    )
     pipeline = VideoProcessingPipeline(
         video_stream=stream,
         detector=detector,
+        cache=cache,
+        motion_gate=motion_gate,
         logger=logger,
         visualizer=visualizer,
+        profiler=profiler,
     )
+    exporter = (
+        PrometheusTextfileWriter(profiler, args.prometheus_file, interval=args.prometheus_interval)
+        if args.prometheus_file
+        else None
+    )
+    if exporter:
+        exporter.start()
     try:
-        pipeline.run()
+        stats = pipeline.run()
     except VideoFileOpenError as exc:
         raise SystemExit(str(exc)) from exc
+    finally:
+        if exporter:
+            exporter.stop()
+        if profiler and args.profile:
+            profiler.dump_json(args.profile)
+    source = "replayed from cache" if stats.cache_hit else "processed"
+    print(f"{source.capitalize()} {stats.frames} frames ({stats.detections} hands) at {stats.fps:.1f} fps")
+    if isinstance(detector, RegionOfInterestDetector) and not stats.cache_hit:
+        roi = detector.stats
+        print(
+            f"ROI inference on {roi.roi_frames}/{roi.frames} frames ({roi.fallbacks} fallbacks, {roi.resets} tracker resets), "
+            f"{roi.pixel_ratio:.1%} of pixels inferred"
+        )
+    if motion_gate and not stats.cache_hit:
+        print(f"Motion gate skipped {stats.skipped_frames} frames ({stats.skip_ratio:.1%})")
+    if cache:
+        entries, size = cache.usage()
+        print(f"Detection cache {cache.root}: {entries} videos, {size / 1e9:.2f} of {args.cache_max_gb:.1f} GB")
+    if args.prefetch:
+        prefetch = stream.prefetch_stats
+        print(
+            f"Prefetch queue: mean occupancy {prefetch.mean_occupancy:.1f}/{args.prefetch}, "
+            f"detector waited {prefetch.consumer_stall_seconds:.2f}s, decoder waited {prefetch.decoder_stall_seconds:.2f}s"
+        )
+    if buffer_pool:
+        pool = buffer_pool.stats
+        print(
+            f"Buffer pool: {pool.allocations} allocations, {pool.reuses} reuses ({pool.reuse_ratio:.1%}), "
+            f"{pool.bytes_reused / 1024**2:.1f} MiB not reallocated"
+        )
+
+    if profiler:
+        print(profiler.format_table())
+        if args.profile:
+            print(f"Stage profile written to {args.profile}")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,11 @@
 """Core package for robotics data collection utilities."""
 
+from roboticsdatacolleciton._lazy import lazy_exports
+
 __all__ = [
     "config",
     "types",
 ]
+
+# Subpackages (``roboticsdatacolleciton.detection`` etc.) import on first attribute access.
+__getattr__, __dir__ = lazy_exports(__name__, {})
@@ -0,0 +1,41 @@
+"""PEP 562 lazy exports for package ``__init__`` modules."""
+from __future__ import annotations
+
+import importlib
+from typing import Any, Callable, Dict, List, Mapping, Sequence, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Mapping[str, Sequence[str]],
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """Build module ``__getattr__``/``__dir__`` that import submodules on first use.
+
+    ``exports`` maps a relative submodule (``".hand_tracker"``) to the names
+    it provides. ``from package import Name`` then only imports the submodule
+    defining ``Name`` (and whatever that one needs), so OpenCV, MediaPipe and
+    PyArrow load when a class needing them is first touched rather than when
+    the package is imported. Resolved names are cached in the package.
+    Submodules not listed can still be reached as attributes.
+    """
+
+    owners: Dict[str, str] = {name: module for module, names in exports.items() for name in names}
+    namespace = importlib.import_module(package).__dict__
+
+    def __getattr__(name: str) -> Any:
+        module = owners.get(name)
+        if module is None:
+            try:
+                return importlib.import_module(f".{name}", package)
+            except ModuleNotFoundError as exc:
+                if exc.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(f"module {package!r} has no attribute {name!r}") from None
+        value = getattr(importlib.import_module(module, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(owners))
+
+    return __getattr__, __dir__
@@ -1,6 +1,50 @@
-"""Placeholder package for future batch video ingestion pipelines."""
+"""Batch ingestion and processing of many videos."""
 
-# Future modules will live here, such as:
-# - video importers for directories/S3
-# - batch processing orchestrators
-# - result serialization utilities
+from typing import TYPE_CHECKING
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .orchestrator import (
+        BatchReport,
+        BatchVideoProcessor,
+        VideoJobResult,
+        discover_videos,
+        format_result,
+        summarize,
+    )
+    from .sharding import ShardedVideoProcessor, ShardedVideoReport, VideoShard, plan_shards
+    from .video_export import AnnotatedVideoExporter, AnnotatedVideoReport, SegmentResult, concat_videos
+
+__all__ = [
+    "AnnotatedVideoExporter",
+    "AnnotatedVideoReport",
+    "BatchReport",
+    "BatchVideoProcessor",
+    "SegmentResult",
+    "ShardedVideoProcessor",
+    "ShardedVideoReport",
+    "VideoJobResult",
+    "VideoShard",
+    "concat_videos",
+    "discover_videos",
+    "format_result",
+    "plan_shards",
+    "summarize",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".orchestrator": (
+            "BatchReport",
+            "BatchVideoProcessor",
+            "VideoJobResult",
+            "discover_videos",
+            "format_result",
+            "summarize",
+        ),
+        ".sharding": ("ShardedVideoProcessor", "ShardedVideoReport", "VideoShard", "plan_shards"),
+        ".video_export": ("AnnotatedVideoExporter", "AnnotatedVideoReport", "SegmentResult", "concat_videos"),
+    },
+)
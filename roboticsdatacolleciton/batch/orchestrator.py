@@ -0,0 +1,243 @@
+"""Multi-process orchestration for processing many videos at once."""
+from __future__ import annotations
+
+import atexit
+import glob
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from roboticsdatacolleciton.config import BatchProcessingConfig
+from roboticsdatacolleciton.detection import HandDetector, create_hand_detector
+from roboticsdatacolleciton.loggers import HandLogWriter
+from roboticsdatacolleciton.pipelines import VideoProcessingPipeline
+from roboticsdatacolleciton.video import VideoFileStream
+
+VIDEO_EXTENSIONS = (".mp4", ".mov", ".avi", ".mkv", ".m4v", ".webm")
+
+
+@dataclass(slots=True)
+class VideoJobResult:
+    """Outcome of processing a single video inside a worker."""
+
+    video_path: Path
+    log_path: Path
+    frames: int = 0
+    detections: int = 0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+    worker_pid: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def fps(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.frames / self.elapsed_seconds
+
+
+@dataclass(slots=True)
+class BatchReport:
+    """Aggregated results for a whole batch run."""
+
+    results: List[VideoJobResult] = field(default_factory=list)
+    skipped: List[Path] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failures(self) -> List[VideoJobResult]:
+        return [result for result in self.results if not result.ok]
+
+    @property
+    def total_frames(self) -> int:
+        return sum(result.frames for result in self.results)
+
+    @property
+    def fps(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.total_frames / self.elapsed_seconds
+
+
+def discover_videos(source: str | Path, pattern: str | None = None) -> List[Path]:
+    """Expand a directory, glob expression, or single file into video paths."""
+
+    source_str = str(source)
+    if glob.has_magic(source_str):
+        return sorted(Path(match) for match in glob.glob(source_str, recursive=True) if Path(match).is_file())
+
+    path = Path(source)
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        return []
+    if pattern:
+        return sorted(match for match in path.glob(pattern) if match.is_file())
+    return sorted(
+        match for match in path.rglob("*") if match.is_file() and match.suffix.lower() in VIDEO_EXTENSIONS
+    )
+
+
+class BatchVideoProcessor:
+    """Runs VideoProcessingPipeline over many videos using a process pool."""
+
+    def __init__(
+        self,
+        config: BatchProcessingConfig,
+        progress_fn: Optional[Callable[[VideoJobResult, int, int], None]] = None,
+    ) -> None:
+        if not config.input_path:
+            raise ValueError("BatchProcessingConfig.input_path is required")
+        if not config.output_path:
+            raise ValueError("BatchProcessingConfig.output_path is required")
+        self.config = config
+        self.progress_fn = progress_fn
+
+    @property
+    def num_workers(self) -> int:
+        return max(1, self.config.num_workers or os.cpu_count() or 1)
+
+    def plan(self) -> List[Tuple[Path, Path]]:
+        """Return (video, log) pairs that the batch would process."""
+
+        root = Path(self.config.input_path)
+        output_root = Path(self.config.output_path)
+        jobs: List[Tuple[Path, Path]] = []
+        for video in discover_videos(root, self.config.pattern):
+            relative = video.relative_to(root) if root.is_dir() else Path(video.name)
+            jobs.append((video, (output_root / relative).with_suffix(".parquet")))
+        return jobs
+
+    def run(self) -> BatchReport:
+        report = BatchReport()
+        jobs = []
+        for video, log_path in self.plan():
+            if self.config.skip_existing and log_path.exists():
+                report.skipped.append(video)
+            else:
+                jobs.append((video, log_path))
+
+        started = time.perf_counter()
+        if jobs:
+            detector_kwargs = {
+                "max_num_hands": self.config.max_num_hands,
+                "min_detection_confidence": self.config.min_detection_confidence,
+                "min_tracking_confidence": self.config.min_tracking_confidence,
+                "backend": self.config.detector_backend,
+                "model_complexity": self.config.model_complexity,
+                "model_path": self.config.model_path,
+            }
+            # MediaPipe graphs are not fork-safe, so always start clean interpreters.
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=min(self.num_workers, len(jobs)),
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(detector_kwargs,),
+            ) as executor:
+                futures = {
+                    executor.submit(_process_video, video, log_path): (video, log_path)
+                    for video, log_path in jobs
+                }
+                for future in as_completed(futures):
+                    video, log_path = futures[future]
+                    try:
+                        result = future.result()
+                    except Exception as exc:  # worker crashed before reporting
+                        result = VideoJobResult(video_path=video, log_path=log_path, error=repr(exc))
+                    report.results.append(result)
+                    if self.progress_fn:
+                        self.progress_fn(result, len(report.results), len(jobs))
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+
+_worker_detector: HandDetector | None = None
+
+
+def _init_worker(detector_kwargs: dict) -> None:
+    """Create and warm up the long-lived detector owned by this worker process."""
+
+    global _worker_detector
+    _worker_detector = create_hand_detector(**detector_kwargs)
+    atexit.register(_worker_detector.close)
+    _worker_detector.warm_up()
+
+
+def _process_video(
+    video_path: Path,
+    log_path: Path,
+    start_frame: int = 0,
+    end_frame: int | None = None,
+) -> VideoJobResult:
+    """Process one video (or frame range) into ``log_path``.
+
+    The log and its summary are written under hidden ``.partial`` names and
+    only moved into place once the run finished, so ``log_path`` existing
+    means the video was processed completely (which ``skip_existing`` relies
+    on). Failed or interrupted runs remove their partial files.
+    """
+
+    assert _worker_detector is not None, "worker initializer did not run"
+    result = VideoJobResult(video_path=video_path, log_path=log_path, worker_pid=os.getpid())
+    summary_path = log_path.with_suffix(".summary.json")
+    partial_log, partial_summary = _partial_path(log_path), _partial_path(summary_path)
+    _worker_detector.reset()
+    pipeline = VideoProcessingPipeline(
+        video_stream=VideoFileStream(video_path, start_frame=start_frame, end_frame=end_frame),
+        detector=_worker_detector,
+        logger=HandLogWriter(output_path=partial_log, summary_path=partial_summary),
+        close_detector=False,
+    )
+    try:
+        stats = pipeline.run()
+        if stats.interrupted:
+            result.error = "interrupted"
+    except Exception as exc:
+        result.error = repr(exc)
+        stats = pipeline.stats
+    if result.ok:
+        # Summary first: a log at log_path always has its summary next to it.
+        os.replace(partial_summary, summary_path)
+        os.replace(partial_log, log_path)
+    else:
+        partial_log.unlink(missing_ok=True)
+        partial_summary.unlink(missing_ok=True)
+    result.frames = stats.frames
+    result.detections = stats.detections
+    result.elapsed_seconds = stats.elapsed_seconds
+    return result
+
+
+def _partial_path(path: Path) -> Path:
+    return path.with_name(f".{path.stem}.partial{path.suffix}")
+
+
+def format_result(result: VideoJobResult, completed: int, total: int) -> str:
+    """Human-readable progress line for a finished video."""
+
+    prefix = f"[{completed}/{total}] {result.video_path}"
+    if not result.ok:
+        return f"{prefix} FAILED: {result.error}"
+    return (
+        f"{prefix} -> {result.log_path} "
+        f"({result.frames} frames, {result.detections} hands, {result.fps:.1f} fps)"
+    )
+
+
+def summarize(report: BatchReport) -> str:
+    """One-line summary of a finished batch."""
+
+    failed = len(report.failures)
+    return (
+        f"Processed {len(report.results) - failed}/{len(report.results)} videos "
+        f"({report.total_frames} frames in {report.elapsed_seconds:.1f}s, {report.fps:.1f} fps overall); "
+        f"{failed} failed, {len(report.skipped)} skipped"
+    )
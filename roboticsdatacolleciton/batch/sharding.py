@@ -0,0 +1,153 @@
+"""Parallel processing of a single long video split into frame-range shards."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Optional
+
+from roboticsdatacolleciton.loggers import HandLogPart, merge_hand_logs
+from roboticsdatacolleciton.video import VideoFileStream
+
+from .orchestrator import VideoJobResult, _init_worker, _process_video
+
+
+@dataclass(slots=True)
+class VideoShard:
+    """Frame range owned by one shard plus the warm-up frames decoded before it."""
+
+    index: int
+    start_frame: int
+    end_frame: Optional[int]
+    warmup_frames: int = 0
+
+    @property
+    def decode_start(self) -> int:
+        return max(0, self.start_frame - self.warmup_frames)
+
+
+@dataclass(slots=True)
+class ShardedVideoReport:
+    """Per-shard results and the merged output of a sharded run."""
+
+    log_path: Path
+    shards: List[VideoJobResult] = field(default_factory=list)
+    rows_written: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failures(self) -> List[VideoJobResult]:
+        return [shard for shard in self.shards if not shard.ok]
+
+
+def plan_shards(frame_count: int, num_shards: int, warmup_frames: int = 0) -> List[VideoShard]:
+    """Split ``frame_count`` frames into contiguous shards of near-equal size.
+
+    The last shard is open-ended so frames beyond an inaccurate container
+    frame count are still processed.
+    """
+
+    num_shards = max(1, min(num_shards, frame_count or 1))
+    base, extra = divmod(frame_count, num_shards)
+    shards: List[VideoShard] = []
+    start = 0
+    for index in range(num_shards):
+        end = start + base + (1 if index < extra else 0)
+        shards.append(
+            VideoShard(
+                index=index,
+                start_frame=start,
+                end_frame=None if index == num_shards - 1 else end,
+                warmup_frames=warmup_frames if index > 0 else 0,
+            )
+        )
+        start = end
+    return shards
+
+
+class ShardedVideoProcessor:
+    """Processes one video as overlapping shards in parallel, then merges the logs.
+
+    Each shard seeks to ``start_frame - warmup_frames`` so MediaPipe's tracker
+    has settled by the time the shard's own frames begin; warm-up rows are
+    discarded during the merge.
+    """
+
+    def __init__(
+        self,
+        video_path: str | Path,
+        log_path: str | Path,
+        summary_path: str | Path | None = None,
+        num_workers: int | None = None,
+        num_shards: int | None = None,
+        warmup_frames: int = 30,
+        max_num_hands: int = 2,
+        min_detection_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+        backend: str = "solutions",
+        model_complexity: int = 1,
+        model_path: str | Path | None = None,
+        keep_shards: bool = False,
+    ) -> None:
+        self.video_path = Path(video_path)
+        self.log_path = Path(log_path)
+        self.summary_path = Path(summary_path) if summary_path else self.log_path.with_suffix(".summary.json")
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.num_shards = num_shards or self.num_workers
+        self.warmup_frames = warmup_frames
+        self.detector_kwargs = {
+            "max_num_hands": max_num_hands,
+            "min_detection_confidence": min_detection_confidence,
+            "min_tracking_confidence": min_tracking_confidence,
+            "backend": backend,
+            "model_complexity": model_complexity,
+            "model_path": model_path,
+        }
+        self.keep_shards = keep_shards
+
+    @property
+    def shard_dir(self) -> Path:
+        return self.log_path.with_name(f"{self.log_path.name}.shards")
+
+    def plan(self) -> List[VideoShard]:
+        frame_count = VideoFileStream(self.video_path).frame_count
+        return plan_shards(frame_count, self.num_shards, self.warmup_frames)
+
+    def run(self) -> ShardedVideoReport:
+        report = ShardedVideoReport(log_path=self.log_path)
+        started = time.perf_counter()
+        shards = self.plan()
+        self.shard_dir.mkdir(parents=True, exist_ok=True)
+        shard_logs = [self.shard_dir / f"shard-{shard.index:04d}.parquet" for shard in shards]
+
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=min(self.num_workers, len(shards)),
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(self.detector_kwargs,),
+        ) as executor:
+            futures = [
+                executor.submit(_process_video, self.video_path, log, shard.decode_start, shard.end_frame)
+                for shard, log in zip(shards, shard_logs)
+            ]
+            for future, log in zip(futures, shard_logs):
+                try:
+                    report.shards.append(future.result())
+                except Exception as exc:  # worker crashed before reporting
+                    report.shards.append(VideoJobResult(video_path=self.video_path, log_path=log, error=repr(exc)))
+
+        if not report.failures:
+            parts = [
+                HandLogPart(log_path=log, start_frame=shard.start_frame, end_frame=shard.end_frame)
+                for shard, log in zip(shards, shard_logs)
+            ]
+            report.rows_written = merge_hand_logs(parts, self.log_path, self.summary_path)
+            if not self.keep_shards:
+                shutil.rmtree(self.shard_dir, ignore_errors=True)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
@@ -0,0 +1,262 @@
+"""Annotated video export from existing hand logs, rendered in parallel segments."""
+from __future__ import annotations
+
+import multiprocessing
+import os
+import shutil
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from roboticsdatacolleciton.loggers import HandLogReader
+from roboticsdatacolleciton.types import HandPosition
+from roboticsdatacolleciton.video import VideoFileOpenError, VideoFileStream
+from roboticsdatacolleciton.visualization import HandPreviewRenderer
+
+from .sharding import VideoShard, plan_shards
+
+
+@dataclass(slots=True)
+class SegmentResult:
+    """Outcome of rendering one frame range into a segment file."""
+
+    index: int
+    path: Path
+    frames: int = 0
+    annotated_frames: int = 0
+    elapsed_seconds: float = 0.0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass(slots=True)
+class AnnotatedVideoReport:
+    """Per-segment results and the concatenated output of an export."""
+
+    output_path: Path
+    segments: List[SegmentResult] = field(default_factory=list)
+    concat_method: str | None = None
+    elapsed_seconds: float = 0.0
+
+    @property
+    def failures(self) -> List[SegmentResult]:
+        return [segment for segment in self.segments if not segment.ok]
+
+    @property
+    def frames(self) -> int:
+        return sum(segment.frames for segment in self.segments)
+
+    @property
+    def fps(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.frames / self.elapsed_seconds
+
+
+class AnnotatedVideoExporter:
+    """Draws logged detections onto a video and encodes the result, without re-running inference.
+
+    The video is split into contiguous frame ranges; each worker process
+    decodes its range, overlays the hands recorded for those frames in the
+    HandLogWriter Parquet log and encodes a segment with cv2.VideoWriter.
+    Segments are then joined in order: with ``ffmpeg`` on PATH they are
+    stream-copied (no re-encoding), otherwise they are decoded and re-encoded
+    through cv2, which is slower but needs nothing beyond OpenCV.
+    """
+
+    def __init__(
+        self,
+        video_path: str | Path,
+        log_path: str | Path,
+        output_path: str | Path,
+        num_workers: int | None = None,
+        num_segments: int | None = None,
+        codec: str = "mp4v",
+        min_confidence: float | None = None,
+        keep_segments: bool = False,
+    ) -> None:
+        if len(codec) != 4:
+            raise ValueError(f"codec must be a four-character code, got {codec!r}")
+        self.video_path = Path(video_path)
+        self.log_path = Path(log_path)
+        self.output_path = Path(output_path)
+        self.num_workers = max(1, num_workers or os.cpu_count() or 1)
+        self.num_segments = num_segments or self.num_workers
+        self.codec = codec
+        self.min_confidence = min_confidence
+        self.keep_segments = keep_segments
+
+    @property
+    def segment_dir(self) -> Path:
+        return self.output_path.with_name(f"{self.output_path.name}.segments")
+
+    def plan(self) -> List[VideoShard]:
+        frame_count = VideoFileStream(self.video_path).frame_count
+        return plan_shards(frame_count, self.num_segments)
+
+    def run(self) -> AnnotatedVideoReport:
+        if not self.log_path.exists():
+            raise FileNotFoundError(f"Hand log not found: {self.log_path}")
+        report = AnnotatedVideoReport(output_path=self.output_path)
+        started = time.perf_counter()
+        segments = self.plan()
+        self.segment_dir.mkdir(parents=True, exist_ok=True)
+        segment_paths = [
+            self.segment_dir / f"segment-{segment.index:04d}{self.output_path.suffix}" for segment in segments
+        ]
+        jobs = [
+            (
+                segment.index,
+                self.video_path,
+                self.log_path,
+                path,
+                segment.start_frame,
+                segment.end_frame,
+                self.codec,
+                self.min_confidence,
+            )
+            for segment, path in zip(segments, segment_paths)
+        ]
+
+        if len(jobs) == 1:
+            report.segments.append(_export_segment(*jobs[0]))
+        else:
+            context = multiprocessing.get_context("spawn")
+            with ProcessPoolExecutor(
+                max_workers=min(self.num_workers, len(jobs)),
+                mp_context=context,
+                initializer=_init_export_worker,
+            ) as executor:
+                futures = [executor.submit(_export_segment, *job) for job in jobs]
+                for future, (index, *_), path in zip(futures, jobs, segment_paths):
+                    try:
+                        report.segments.append(future.result())
+                    except Exception as exc:  # worker crashed before reporting
+                        report.segments.append(SegmentResult(index=index, path=path, error=repr(exc)))
+
+        if not report.failures:
+            written = [segment.path for segment in report.segments if segment.frames]
+            report.concat_method = concat_videos(written, self.output_path, self.codec)
+            if not self.keep_segments:
+                shutil.rmtree(self.segment_dir, ignore_errors=True)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+
+def concat_videos(paths: Sequence[Path], output_path: Path, codec: str = "mp4v") -> str:
+    """Join video files in order into ``output_path``; returns the method used.
+
+    ``ffmpeg`` stream-copies the segments when available. Otherwise frames are
+    decoded and re-encoded with cv2.VideoWriter using ``codec``.
+    """
+
+    if not paths:
+        raise ValueError("No video segments to concatenate")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    partial = output_path.with_name(f".{output_path.stem}.partial{output_path.suffix}")
+    if len(paths) == 1:
+        shutil.copyfile(paths[0], partial)
+        method = "copy"
+    elif shutil.which("ffmpeg"):
+        listing = partial.with_suffix(".txt")
+        listing.write_text("".join(f"file '{path.resolve()}'\n" for path in paths), encoding="utf-8")
+        try:
+            subprocess.run(
+                ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", str(listing),
+                 "-c", "copy", str(partial)],
+                check=True,
+            )
+        finally:
+            listing.unlink(missing_ok=True)
+        method = "ffmpeg"
+    else:
+        _reencode(paths, partial, codec)
+        method = "reencode"
+    os.replace(partial, output_path)
+    return method
+
+
+def _init_export_worker() -> None:
+    # Segments already run one per process; OpenCV's own thread pool would oversubscribe the CPUs.
+    cv2.setNumThreads(1)
+
+
+def _reencode(paths: Sequence[Path], output_path: Path, codec: str) -> None:
+    writer: Optional[cv2.VideoWriter] = None
+    try:
+        for path in paths:
+            with VideoFileStream(path) as stream:
+                for _, frame in stream.frames():
+                    if writer is None:
+                        writer = _open_writer(output_path, codec, stream.fps, frame)
+                    writer.write(frame)
+    finally:
+        if writer is not None:
+            writer.release()
+
+
+def _open_writer(path: Path, codec: str, fps: float, frame: np.ndarray) -> cv2.VideoWriter:
+    height, width = frame.shape[:2]
+    writer = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*codec), fps or 30.0, (width, height))
+    if not writer.isOpened():
+        raise VideoFileOpenError(path, reason=f"writer-open-failed:{codec}")
+    return writer
+
+
+def _logged_frames(
+    reader: HandLogReader, start_frame: int, end_frame: Optional[int], min_confidence: Optional[float]
+) -> Iterator[Tuple[int, List[HandPosition]]]:
+    if min_confidence is None:
+        yield from reader.iter_frames(start_frame, end_frame)
+        return
+    for frame_index, positions in reader.iter_frames(start_frame, end_frame):
+        positions = [position for position in positions if position.confidence >= min_confidence]
+        if positions:
+            yield frame_index, positions
+
+
+def _export_segment(
+    index: int,
+    video_path: Path,
+    log_path: Path,
+    segment_path: Path,
+    start_frame: int,
+    end_frame: Optional[int],
+    codec: str,
+    min_confidence: Optional[float],
+) -> SegmentResult:
+    result = SegmentResult(index=index, path=segment_path)
+    started = time.perf_counter()
+    renderer = HandPreviewRenderer(threaded=False)
+    writer: Optional[cv2.VideoWriter] = None
+    try:
+        with HandLogReader(log_path) as reader, VideoFileStream(
+            video_path, start_frame=start_frame, end_frame=end_frame, prefetch=4
+        ) as stream:
+            detections = _logged_frames(reader, start_frame, end_frame, min_confidence)
+            pending = next(detections, None)
+            for frame_index, frame in stream.frames():
+                while pending is not None and pending[0] < frame_index:
+                    pending = next(detections, None)
+                positions = pending[1] if pending is not None and pending[0] == frame_index else []
+                if writer is None:
+                    writer = _open_writer(segment_path, codec, stream.fps, frame)
+                writer.write(renderer.annotate(frame, positions) if positions else frame)
+                result.frames += 1
+                result.annotated_frames += bool(positions)
+    except Exception as exc:  # reported per segment instead of killing the export
+        result.error = repr(exc)
+    finally:
+        if writer is not None:
+            writer.release()
+    result.elapsed_seconds = time.perf_counter() - started
+    return result
@@ -1,7 +1,8 @@
 """Configuration objects shared across the app."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import List
 
 
 @dataclass(slots=True)
@@ -14,11 +15,51 @@ class RealtimeTrackingConfig:
     max_num_hands: int = 2
     min_detection_confidence: float = 0.5
     min_tracking_confidence: float = 0.5
+    detector_backend: str = "solutions"
+    model_complexity: int = 1
+    model_path: str | None = None
+    latest_frame_only: bool = False
+    roi_tracking: bool = False
+    roi_margin: float = 0.25
+    max_inference_width: int | None = None
+    reuse_frame_buffers: bool = False
 
 
 @dataclass(slots=True)
 class BatchProcessingConfig:
-    """Placeholder for future batch processing configuration."""
+    """Settings for processing many videos across a pool of worker processes."""
 
     input_path: str | None = None
     output_path: str | None = None
+    pattern: str | None = None
+    num_workers: int | None = None
+    max_num_hands: int = 2
+    min_detection_confidence: float = 0.5
+    min_tracking_confidence: float = 0.5
+    detector_backend: str = "solutions"
+    model_complexity: int = 1
+    model_path: str | None = None
+    skip_existing: bool = False
+
+
+@dataclass(slots=True)
+class MultiCameraConfig:
+    """Settings for capturing from several cameras at once and aligning their detections.
+
+    ``sources`` holds device indices and/or video file paths; files are played
+    back as live cameras at their native frame rate.
+    """
+
+    sources: List[int | str] = field(default_factory=list)
+    frame_width: int | None = None
+    frame_height: int | None = None
+    latest_frame_only: bool = True
+    max_num_hands: int = 2
+    min_detection_confidence: float = 0.5
+    min_tracking_confidence: float = 0.5
+    detector_backend: str = "solutions"
+    model_complexity: int = 1
+    model_path: str | None = None
+    sync_tolerance_ms: float = 20.0
+    max_wait_ms: float = 250.0
+    loop_files: bool = False
@@ -1,5 +1,46 @@
 """Detection backends for extracting structured data from frames."""
 
-from .hand_tracker import MediaPipeHandTracker
+from typing import TYPE_CHECKING
 
-__all__ = ["MediaPipeHandTracker"]
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .backends import DETECTOR_BACKENDS, create_hand_detector
+    from .base import AsyncHandDetector, DetectionResult, HandDetector, build_positions
+    from .cache import DEFAULT_CACHE_DIR, CacheEntry, DetectionCache, video_fingerprint
+    from .hand_tracker import MediaPipeHandTracker
+    from .motion_gate import MotionGate
+    from .roi import RegionOfInterestDetector, RoiStats
+    from .tasks_landmarker import DEFAULT_HAND_LANDMARKER_MODEL, TasksHandLandmarker
+
+__all__ = [
+    "DEFAULT_CACHE_DIR",
+    "DEFAULT_HAND_LANDMARKER_MODEL",
+    "DETECTOR_BACKENDS",
+    "AsyncHandDetector",
+    "CacheEntry",
+    "DetectionCache",
+    "DetectionResult",
+    "HandDetector",
+    "MediaPipeHandTracker",
+    "MotionGate",
+    "RegionOfInterestDetector",
+    "RoiStats",
+    "TasksHandLandmarker",
+    "build_positions",
+    "create_hand_detector",
+    "video_fingerprint",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".backends": ("DETECTOR_BACKENDS", "create_hand_detector"),
+        ".base": ("AsyncHandDetector", "DetectionResult", "HandDetector", "build_positions"),
+        ".cache": ("DEFAULT_CACHE_DIR", "CacheEntry", "DetectionCache", "video_fingerprint"),
+        ".hand_tracker": ("MediaPipeHandTracker",),
+        ".motion_gate": ("MotionGate",),
+        ".roi": ("RegionOfInterestDetector", "RoiStats"),
+        ".tasks_landmarker": ("DEFAULT_HAND_LANDMARKER_MODEL", "TasksHandLandmarker"),
+    },
+)
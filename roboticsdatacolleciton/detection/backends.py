@@ -0,0 +1,60 @@
+"""Construct a hand detector for a named backend."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from roboticsdatacolleciton.profiling import StageProfiler
+    from roboticsdatacolleciton.video import FrameBufferPool
+
+    from .base import AsyncHandDetector, HandDetector
+
+DETECTOR_BACKENDS = ("solutions", "tasks")
+
+
+def create_hand_detector(
+    backend: str = "solutions",
+    *,
+    running_mode: str = "video",
+    model_path: Optional[str | Path] = None,
+    model_complexity: int = 1,
+    max_num_hands: int = 2,
+    min_detection_confidence: float = 0.5,
+    min_tracking_confidence: float = 0.5,
+    fps: float = 30.0,
+    buffer_pool: Optional[FrameBufferPool] = None,
+    profiler: Optional[StageProfiler] = None,
+) -> HandDetector | AsyncHandDetector:
+    """Build the ``solutions`` (legacy Hands) or ``tasks`` (HandLandmarker) detector.
+
+    ``model_complexity`` only applies to ``solutions``; ``model_path``,
+    ``running_mode`` and ``fps`` only apply to ``tasks``. MediaPipe is only
+    imported here, so listing ``DETECTOR_BACKENDS`` stays cheap.
+    """
+
+    if backend == "solutions":
+        from .hand_tracker import MediaPipeHandTracker
+
+        return MediaPipeHandTracker(
+            max_num_hands=max_num_hands,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            model_complexity=model_complexity,
+            buffer_pool=buffer_pool,
+            profiler=profiler,
+        )
+    if backend == "tasks":
+        from .tasks_landmarker import DEFAULT_HAND_LANDMARKER_MODEL, TasksHandLandmarker
+
+        return TasksHandLandmarker(
+            model_path=model_path or DEFAULT_HAND_LANDMARKER_MODEL,
+            running_mode=running_mode,
+            max_num_hands=max_num_hands,
+            min_detection_confidence=min_detection_confidence,
+            min_tracking_confidence=min_tracking_confidence,
+            fps=fps,
+            buffer_pool=buffer_pool,
+            profiler=profiler,
+        )
+    raise ValueError(f"Unknown detector backend {backend!r}; expected one of {', '.join(DETECTOR_BACKENDS)}")
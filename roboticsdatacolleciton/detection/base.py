@@ -0,0 +1,111 @@
+"""Detector interfaces shared by the pipelines and detection backends."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, List, Optional, Protocol, Sequence, Tuple
+
+import numpy as np
+
+from roboticsdatacolleciton.types import NUM_LANDMARKS, HandPosition
+
+WARM_UP_FRAME_SHAPE = (480, 640, 3)
+
+
+class HandDetector(Protocol):
+    """Synchronous detector: one BGR frame in, the hands found in it out."""
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters that change detector output, used to key cached detections."""
+
+    def detect(self, frame: np.ndarray) -> List[HandPosition]:
+        ...
+
+    def reset(self) -> None:
+        """Drop tracking state so the next frame starts a fresh detection."""
+
+    def warm_up(self, frame_shape: Tuple[int, int, int] = WARM_UP_FRAME_SHAPE) -> None:
+        """Run a throwaway inference on a blank frame, leaving no tracking state behind.
+
+        The first inference pays for graph start-up and delegate
+        initialization; warming up moves that cost off the first real frame.
+        """
+
+    def close(self) -> None:
+        ...
+
+
+@dataclass(slots=True)
+class DetectionResult:
+    """Hands detected in the frame submitted at ``timestamp_ms``."""
+
+    timestamp_ms: int
+    positions: List[HandPosition]
+
+
+class AsyncHandDetector(Protocol):
+    """Detector that accepts frames without waiting for their results.
+
+    Pipelines take the asynchronous path when ``asynchronous`` is true.
+    ``submit`` queues a frame stamped with a strictly increasing
+    ``timestamp_ms``; ``latest`` returns the newest result that completed
+    since the previous call, or None. Backends may drop submitted frames
+    while inference is busy, so not every submission produces a result.
+    """
+
+    @property
+    def asynchronous(self) -> bool:
+        ...
+
+    def submit(self, frame: np.ndarray, timestamp_ms: int) -> None:
+        ...
+
+    def latest(self) -> Optional[DetectionResult]:
+        ...
+
+    def warm_up(self, frame_shape: Tuple[int, int, int] = WARM_UP_FRAME_SHAPE) -> None:
+        """Run a throwaway inference and discard its result."""
+
+    def close(self) -> None:
+        ...
+
+
+def build_positions(
+    hand_landmarks: Sequence[Sequence[Any]],
+    labels: Sequence[str],
+    scores: Sequence[float],
+    image_width: int,
+    image_height: int,
+) -> List[HandPosition]:
+    """Convert per-hand landmark lists (objects with ``x``, ``y``, ``z``) into HandPositions."""
+
+    hand_count = len(hand_landmarks)
+    if hand_count == 0:
+        return []
+
+    # One (hands, 21, 3) block per frame; each HandPosition holds a view into it.
+    frame_landmarks = np.fromiter(
+        chain.from_iterable(
+            (landmark.x, landmark.y, landmark.z) for landmarks in hand_landmarks for landmark in landmarks
+        ),
+        dtype=np.float32,
+        count=hand_count * NUM_LANDMARKS * 3,
+    ).reshape(hand_count, NUM_LANDMARKS, 3)
+    palms = frame_landmarks[:, :, :2].mean(axis=1, dtype=np.float64)
+    pixel_palms = (palms * (image_width, image_height)).astype(np.int64)
+
+    positions: List[HandPosition] = []
+    for idx in range(hand_count):
+        palm_x, palm_y = palms[idx].tolist()
+        pixel_x, pixel_y = pixel_palms[idx].tolist()
+        positions.append(
+            HandPosition(
+                label=labels[idx] if idx < len(labels) else "UNKNOWN",
+                confidence=scores[idx] if idx < len(scores) else 0.0,
+                normalized_palm=(palm_x, palm_y),
+                pixel_palm=(pixel_x, pixel_y),
+                landmark_array=frame_landmarks[idx],
+            )
+        )
+    return positions
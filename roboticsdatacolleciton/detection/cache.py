@@ -0,0 +1,154 @@
+"""On-disk cache of detections keyed by video content and detector parameters."""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from roboticsdatacolleciton.loggers import HandLogWriter
+    from roboticsdatacolleciton.types import HandPosition
+
+DEFAULT_CACHE_DIR = Path("~/.cache/roboticsdatacolleciton/detections").expanduser()
+_SAMPLE_BYTES = 1 << 20
+
+
+def video_fingerprint(path: str | Path, sample_bytes: int = _SAMPLE_BYTES) -> str:
+    """Fast content hash: file size plus samples from the start, middle and end.
+
+    Reading three fixed-size windows keeps hashing cheap for multi-gigabyte
+    recordings while still changing whenever the file is re-encoded or trimmed.
+    """
+
+    path = Path(path)
+    size = path.stat().st_size
+    digest = hashlib.blake2b(str(size).encode("ascii"), digest_size=20)
+    with path.open("rb") as fp:
+        for offset in sorted({0, max(0, size // 2 - sample_bytes // 2), max(0, size - sample_bytes)}):
+            fp.seek(offset)
+            digest.update(fp.read(sample_bytes))
+    return digest.hexdigest()
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A committed set of detections for one video."""
+
+    key: str
+    path: Path
+    frame_count: int
+
+    @property
+    def log_path(self) -> Path:
+        return self.path / "detections.parquet"
+
+    def iter_frames(
+        self, start_frame: int = 0, end_frame: Optional[int] = None
+    ) -> Iterator[Tuple[int, List[HandPosition]]]:
+        """Yield ``(frame_index, positions)`` for every frame, including empty ones."""
+
+        from roboticsdatacolleciton.loggers import HandLogReader
+
+        end_frame = self.frame_count if end_frame is None else min(end_frame, self.frame_count)
+        reader = HandLogReader(self.log_path) if self.log_path.exists() else None
+        try:
+            detections = reader.iter_frames(start_frame, end_frame) if reader else iter(())
+            pending = next(detections, None)
+            for frame_index in range(start_frame, end_frame):
+                if pending is not None and pending[0] == frame_index:
+                    yield pending
+                    pending = next(detections, None)
+                else:
+                    yield frame_index, []
+        finally:
+            if reader is not None:
+                reader.close()
+
+
+class DetectionCache:
+    """Size-bounded LRU cache of detection logs stored under ``root``.
+
+    Each entry is a directory named after the cache key containing a
+    HandLogWriter Parquet log and ``meta.json``. Lookups refresh the entry's
+    modification time, and commits evict the least recently used entries
+    until the cache fits in ``max_bytes``.
+    """
+
+    def __init__(self, root: str | Path = DEFAULT_CACHE_DIR, max_bytes: int = 10 * 1024**3) -> None:
+        self.root = Path(root).expanduser()
+        self.max_bytes = max_bytes
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def key_for(self, video_path: str | Path, detector_params: dict) -> str:
+        payload = json.dumps(
+            {"video": video_fingerprint(video_path), "detector": detector_params}, sort_keys=True
+        )
+        return hashlib.blake2b(payload.encode("utf-8"), digest_size=20).hexdigest()
+
+    def lookup(self, key: str) -> Optional[CacheEntry]:
+        entry_dir = self.root / key
+        meta_path = entry_dir / "meta.json"
+        if not meta_path.exists():
+            return None
+        with meta_path.open("r", encoding="utf-8") as fp:
+            meta = json.load(fp)
+        os.utime(meta_path)
+        return CacheEntry(key=key, path=entry_dir, frame_count=meta["frame_count"])
+
+    def writer(self, key: str) -> HandLogWriter:
+        """Return a writer into a private staging directory for ``key``."""
+
+        from roboticsdatacolleciton.loggers import HandLogWriter
+
+        staging = self.root / f".staging-{key}-{uuid.uuid4().hex}"
+        return HandLogWriter(output_path=staging / "detections.parquet")
+
+    def commit(self, key: str, writer: HandLogWriter, frame_count: int, metadata: dict | None = None) -> CacheEntry:
+        """Close ``writer`` and publish its output as the entry for ``key``."""
+
+        writer.close()
+        staging = Path(writer.output_path).parent
+        with (staging / "meta.json").open("w", encoding="utf-8") as fp:
+            json.dump({"frame_count": frame_count, **(metadata or {})}, fp)
+        entry_dir = self.root / key
+        if entry_dir.exists():
+            shutil.rmtree(entry_dir, ignore_errors=True)
+        os.replace(staging, entry_dir)
+        self.evict()
+        return CacheEntry(key=key, path=entry_dir, frame_count=frame_count)
+
+    def discard(self, writer: HandLogWriter) -> None:
+        writer.close()
+        shutil.rmtree(Path(writer.output_path).parent, ignore_errors=True)
+
+    def usage(self) -> Tuple[int, int]:
+        """Number of committed entries and their total size in bytes."""
+
+        entries = self._entries()
+        return len(entries), sum(size for _, size, _ in entries)
+
+    def evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry_dir in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry_dir, ignore_errors=True)
+            total -= size
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """``(last use, bytes, directory)`` of every committed entry."""
+
+        entries = []
+        for entry_dir in self.root.iterdir():
+            meta_path = entry_dir / "meta.json"
+            if entry_dir.name.startswith(".") or not meta_path.exists():
+                continue
+            size = sum(item.stat().st_size for item in entry_dir.rglob("*") if item.is_file())
+            entries.append((meta_path.stat().st_mtime, size, entry_dir))
+        return entries
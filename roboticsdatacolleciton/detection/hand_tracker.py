@@ -1,89 +1,101 @@
 """MediaPipe-based hand detection module."""
 from __future__ import annotations
 
-from typing import List
+from typing import List, Optional, Tuple
 
 import cv2
 import mediapipe as mp
+import numpy as np
 
-from roboticsdatacolleciton.types import HandPosition, Landmark
+from roboticsdatacolleciton.profiling import NULL_PROFILER, StageProfiler
+from roboticsdatacolleciton.types import HandPosition
+from roboticsdatacolleciton.video import FrameBufferPool
+
+from .base import WARM_UP_FRAME_SHAPE, build_positions
 
 
 class MediaPipeHandTracker:
-    """Thin wrapper around MediaPipe Hands that returns HandPosition items."""
+    """Thin wrapper around the legacy MediaPipe Hands solution that returns HandPosition items."""
 
     def __init__(
         self,
         max_num_hands: int = 2,
         min_detection_confidence: float = 0.5,
         min_tracking_confidence: float = 0.5,
+        model_complexity: int = 1,
+        buffer_pool: Optional[FrameBufferPool] = None,
+        profiler: Optional[StageProfiler] = None,
     ) -> None:
+        self.max_num_hands = max_num_hands
+        self.min_detection_confidence = min_detection_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.model_complexity = model_complexity
+        self.buffer_pool = buffer_pool
+        self.profiler = profiler or NULL_PROFILER
         self._mp_hands = mp.solutions.hands.Hands(
             max_num_hands=max_num_hands,
             min_detection_confidence=min_detection_confidence,
             min_tracking_confidence=min_tracking_confidence,
-            model_complexity=1,
+            model_complexity=model_complexity,
         )
-        self._mp_landmarks = mp.solutions.hands.HandLandmark
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters that change detector output, used to key cached detections."""
+
+        return {
+            "backend": "mediapipe-solutions",
+            "version": getattr(mp, "__version__", "unknown"),
+            "max_num_hands": self.max_num_hands,
+            "min_detection_confidence": self.min_detection_confidence,
+            "min_tracking_confidence": self.min_tracking_confidence,
+            "model_complexity": self.model_complexity,
+        }
 
     def detect(self, frame) -> List[HandPosition]:  # type: ignore[override]
         """Run detection on a BGR frame and return structured hand positions."""
 
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        profiler = self.profiler
+        with profiler.stage("convert"):
+            rgb_frame = self.buffer_pool.acquire(frame.shape, frame.dtype) if self.buffer_pool else None
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
         rgb_frame.flags.writeable = False
-        results = self._mp_hands.process(rgb_frame)
-        rgb_frame.flags.writeable = True
+        try:
+            with profiler.stage("inference"):
+                results = self._mp_hands.process(rgb_frame)
+        finally:
+            rgb_frame.flags.writeable = True
+            if self.buffer_pool:
+                self.buffer_pool.release(rgb_frame)
 
         if not results.multi_hand_landmarks:
             return []
 
-        image_height, image_width = frame.shape[:2]
-        positions: List[HandPosition] = []
-
-        hand_labels: List[str] = []
-        confidences: List[float] = []
-        if results.multi_handedness:
-            hand_labels = [classification.classification[0].label for classification in results.multi_handedness]
-            confidences = [classification.classification[0].score for classification in results.multi_handedness]
-        else:
-            hand_labels = ["UNKNOWN"] * len(results.multi_hand_landmarks)
-            confidences = [0.0] * len(results.multi_hand_landmarks)
-
-        for idx, hand_landmarks in enumerate(results.multi_hand_landmarks):
-            label = hand_labels[idx] if idx < len(hand_labels) else "UNKNOWN"
-            score = confidences[idx] if idx < len(confidences) else 0.0
-
-            landmark_list: List[Landmark] = []
-            xs, ys = [], []
-            for landmark_enum in self._mp_landmarks:
-                landmark = hand_landmarks.landmark[landmark_enum.value]
-                xs.append(landmark.x)
-                ys.append(landmark.y)
-                landmark_list.append(
-                    Landmark(
-                        name=landmark_enum.name,
-                        x=landmark.x,
-                        y=landmark.y,
-                        z=landmark.z,
-                    )
-                )
-
-            palm_x = sum(xs) / len(xs)
-            palm_y = sum(ys) / len(ys)
-            pixel_x = int(palm_x * image_width)
-            pixel_y = int(palm_y * image_height)
-
-            positions.append(
-                HandPosition(
-                    label=label,
-                    confidence=score,
-                    normalized_palm=(palm_x, palm_y),
-                    pixel_palm=(pixel_x, pixel_y),
-                    landmarks=landmark_list,
-                )
+        with profiler.stage("postprocess"):
+            image_height, image_width = frame.shape[:2]
+            if results.multi_handedness:
+                hand_labels = [classification.classification[0].label for classification in results.multi_handedness]
+                confidences = [classification.classification[0].score for classification in results.multi_handedness]
+            else:
+                hand_labels, confidences = [], []
+            return build_positions(
+                [hand_landmarks.landmark for hand_landmarks in results.multi_hand_landmarks],
+                hand_labels,
+                confidences,
+                image_width,
+                image_height,
             )
 
-        return positions
+    def reset(self) -> None:
+        """Drop tracking state so the next frame starts a fresh detection."""
+
+        self._mp_hands.reset()
+
+    def warm_up(self, frame_shape: Tuple[int, int, int] = WARM_UP_FRAME_SHAPE) -> None:
+        """Run one inference on a blank frame so graph start-up happens before real frames."""
+
+        self._mp_hands.process(np.zeros(frame_shape, dtype=np.uint8))
+        self._mp_hands.reset()
 
     def close(self) -> None:
         """Release MediaPipe resources."""
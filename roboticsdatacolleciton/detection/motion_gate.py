@@ -0,0 +1,50 @@
+"""Cheap frame-difference gate for skipping detection on static scenes."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Optional
+
+import cv2
+import numpy as np
+
+
+@dataclass
+class MotionGate:
+    """Decides whether a frame differs enough from the last detected one.
+
+    Frames are shrunk to ``downscale_width`` pixels wide and converted to
+    grayscale; detection is requested when the mean absolute difference to
+    the last keyframe (in 0-255 gray levels) exceeds ``threshold``, or when
+    ``refresh_interval`` frames have passed since the last detection.
+    """
+
+    threshold: float = 2.0
+    refresh_interval: int = 30
+    downscale_width: int = 64
+    _keyframe: Optional[np.ndarray] = field(init=False, default=None, repr=False)
+    _since_refresh: int = field(init=False, default=0, repr=False)
+
+    def should_detect(self, frame: np.ndarray) -> bool:
+        small = self._thumbnail(frame)
+        self._since_refresh += 1
+        if (
+            self._keyframe is None
+            or self._since_refresh >= self.refresh_interval
+            or cv2.mean(cv2.absdiff(small, self._keyframe))[0] > self.threshold
+        ):
+            self._keyframe = small
+            self._since_refresh = 0
+            return True
+        return False
+
+    def reset(self) -> None:
+        self._keyframe = None
+        self._since_refresh = 0
+
+    def _thumbnail(self, frame: np.ndarray) -> np.ndarray:
+        height, width = frame.shape[:2]
+        target_height = max(1, round(height * self.downscale_width / width))
+        small = cv2.resize(frame, (self.downscale_width, target_height), interpolation=cv2.INTER_AREA)
+        if small.ndim == 3:
+            small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        return small
@@ -0,0 +1,187 @@
+"""Region-of-interest and downscaled inference around another detector."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from roboticsdatacolleciton.types import HandPosition
+
+from .base import WARM_UP_FRAME_SHAPE, HandDetector
+
+
+@dataclass(slots=True)
+class RoiStats:
+    """How often the crop was used and how much of the image was inferred on."""
+
+    frames: int = 0
+    roi_frames: int = 0
+    fallbacks: int = 0
+    resets: int = 0
+    pixels_inferred: int = 0
+    pixels_total: int = 0
+
+    @property
+    def pixel_ratio(self) -> float:
+        if self.pixels_total == 0:
+            return 0.0
+        return self.pixels_inferred / self.pixels_total
+
+
+class RegionOfInterestDetector:
+    """Runs ``detector`` on a crop around the previous frame's hands.
+
+    The union of the previous hands' landmark bounding boxes is expanded by
+    ``margin`` (a fraction of the box size) and only that crop is converted
+    and passed to the wrapped detector. Results are mapped back to
+    full-frame normalized and pixel coordinates. A full-frame pass runs when
+    no hands were tracked, when the crop finds fewer hands than before, and
+    every ``full_frame_interval`` frames so new hands entering the scene are
+    picked up. ``max_inference_width`` additionally downscales whatever image
+    is inferred on; normalized coordinates are unaffected by the resize.
+
+    Video-mode detectors carry each hand's region forward in the normalized
+    coordinates of the previous input image, which no longer match once the
+    crop moves or the wrapper switches between crop and full frame. The
+    wrapped detector is therefore ``reset()`` whenever the inferred view
+    changes (counted in ``RoiStats.resets``). To keep that rare, a crop box
+    is reused while the hands stay at least half a margin inside it.
+    """
+
+    def __init__(
+        self,
+        detector: HandDetector,
+        margin: float = 0.25,
+        max_inference_width: Optional[int] = None,
+        full_frame_interval: int = 30,
+        min_crop_fraction: float = 0.15,
+    ) -> None:
+        self.detector = detector
+        self.margin = margin
+        self.max_inference_width = max_inference_width
+        self.full_frame_interval = full_frame_interval
+        self.min_crop_fraction = min_crop_fraction
+        self.stats = RoiStats()
+        self._previous: Sequence[HandPosition] = []
+        self._since_full_frame = 0
+        self._box: Optional[Tuple[int, int, int, int]] = None
+        # View the wrapped detector last ran on: a crop box, or None for the full frame.
+        self._view: Optional[Tuple[int, int, int, int]] = None
+
+    @property
+    def cache_params(self) -> dict:
+        return {
+            **self.detector.cache_params,
+            "roi_margin": self.margin,
+            "max_inference_width": self.max_inference_width,
+            "full_frame_interval": self.full_frame_interval,
+            "min_crop_fraction": self.min_crop_fraction,
+        }
+
+    def detect(self, frame: np.ndarray) -> List[HandPosition]:
+        height, width = frame.shape[:2]
+        self.stats.frames += 1
+        self.stats.pixels_total += width * height
+        self._since_full_frame += 1
+
+        box = None
+        if self._previous and self._since_full_frame < self.full_frame_interval:
+            box = self._crop_box(self._previous, width, height)
+
+        positions: List[HandPosition] = []
+        if box is not None:
+            x0, y0, x1, y1 = box
+            positions = self._infer(frame[y0:y1, x0:x1], box)
+            if len(positions) >= len(self._previous):
+                self.stats.roi_frames += 1
+                positions = [self._to_full_frame(position, box, width, height) for position in positions]
+            else:
+                self.stats.fallbacks += 1
+                box = None
+        if box is None:
+            positions = self._infer(frame, None)
+            self._since_full_frame = 0
+            self._box = None
+
+        self._previous = positions
+        return positions
+
+    def reset(self) -> None:
+        self._previous = []
+        self._since_full_frame = 0
+        self._box = self._view = None
+        self.detector.reset()
+
+    def warm_up(self, frame_shape: Tuple[int, int, int] = WARM_UP_FRAME_SHAPE) -> None:
+        height, width = frame_shape[:2]
+        if self.max_inference_width and width > self.max_inference_width:
+            height, width = max(1, round(height * self.max_inference_width / width)), self.max_inference_width
+        self.detector.warm_up((height, width, *frame_shape[2:]))
+
+    def close(self) -> None:
+        self.detector.close()
+
+    def _infer(self, image: np.ndarray, view: Optional[Tuple[int, int, int, int]]) -> List[HandPosition]:
+        if view != self._view:
+            # Tracking state refers to the previous view's coordinates; start over on the new one.
+            self.detector.reset()
+            self.stats.resets += 1
+            self._view = view
+        height, width = image.shape[:2]
+        if self.max_inference_width and width > self.max_inference_width:
+            scaled_height = max(1, round(height * self.max_inference_width / width))
+            image = cv2.resize(image, (self.max_inference_width, scaled_height), interpolation=cv2.INTER_AREA)
+            height, width = image.shape[:2]
+        self.stats.pixels_inferred += width * height
+        return self.detector.detect(image)
+
+    def _crop_box(
+        self, positions: Sequence[HandPosition], width: int, height: int
+    ) -> Optional[Tuple[int, int, int, int]]:
+        points = np.concatenate([position.landmark_array[:, :2] for position in positions])
+        points = points[np.isfinite(points).all(axis=1)]
+        if len(points) == 0:
+            return None
+        (x_min, y_min), (x_max, y_max) = points.min(axis=0), points.max(axis=0)
+        pad_x = max((x_max - x_min) * self.margin, self.min_crop_fraction / 2)
+        pad_y = max((y_max - y_min) * self.margin, self.min_crop_fraction / 2)
+        if self._box is not None:
+            bx0, by0, bx1, by1 = self._box
+            if (
+                bx0 / width <= max(0.0, x_min - pad_x / 2)
+                and by0 / height <= max(0.0, y_min - pad_y / 2)
+                and bx1 / width >= min(1.0, x_max + pad_x / 2)
+                and by1 / height >= min(1.0, y_max + pad_y / 2)
+            ):
+                return self._box
+        x0 = int(np.clip(x_min - pad_x, 0.0, 1.0) * width)
+        y0 = int(np.clip(y_min - pad_y, 0.0, 1.0) * height)
+        x1 = int(np.ceil(np.clip(x_max + pad_x, 0.0, 1.0) * width))
+        y1 = int(np.ceil(np.clip(y_max + pad_y, 0.0, 1.0) * height))
+        if x1 - x0 < 2 or y1 - y0 < 2 or (x1 - x0) * (y1 - y0) >= width * height:
+            return None
+        self._box = (x0, y0, x1, y1)
+        return self._box
+
+    @staticmethod
+    def _to_full_frame(
+        position: HandPosition, box: Tuple[int, int, int, int], width: int, height: int
+    ) -> HandPosition:
+        x0, y0, x1, y1 = box
+        crop_width, crop_height = x1 - x0, y1 - y0
+        landmarks = position.landmark_array.copy()
+        landmarks[:, 0] = (landmarks[:, 0] * crop_width + x0) / width
+        landmarks[:, 1] = (landmarks[:, 1] * crop_height + y0) / height
+        # MediaPipe's relative depth uses the same scale as x.
+        landmarks[:, 2] *= crop_width / width
+        palm_x = (position.normalized_palm[0] * crop_width + x0) / width
+        palm_y = (position.normalized_palm[1] * crop_height + y0) / height
+        return HandPosition(
+            label=position.label,
+            confidence=position.confidence,
+            normalized_palm=(palm_x, palm_y),
+            pixel_palm=(int(palm_x * width), int(palm_y * height)),
+            landmark_array=landmarks,
+        )
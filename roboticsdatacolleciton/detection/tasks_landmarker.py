@@ -0,0 +1,202 @@
+"""Hand detection on the MediaPipe Tasks HandLandmarker API."""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+import cv2
+import mediapipe as mp
+import numpy as np
+from mediapipe.tasks.python import BaseOptions, vision
+
+from roboticsdatacolleciton.profiling import NULL_PROFILER, StageProfiler
+from roboticsdatacolleciton.types import HandPosition
+from roboticsdatacolleciton.video import FrameBufferPool
+
+from .base import WARM_UP_FRAME_SHAPE, DetectionResult, build_positions
+
+DEFAULT_HAND_LANDMARKER_MODEL = Path("models/hand_landmarker.task")
+HAND_LANDMARKER_MODEL_URL = (
+    "https://storage.googleapis.com/mediapipe-models/hand_landmarker/hand_landmarker/float16/latest/hand_landmarker.task"
+)
+RUNNING_MODES = ("image", "video", "live_stream")
+
+
+class TasksHandLandmarker:
+    """MediaPipe Tasks ``HandLandmarker`` in IMAGE, VIDEO or LIVE_STREAM mode.
+
+    ``video`` mode tracks hands across frames of a file and needs strictly
+    increasing timestamps; ``detect`` derives them from ``fps`` and the
+    number of frames seen. ``live_stream`` mode is asynchronous: ``submit``
+    hands the frame to MediaPipe and returns immediately, results arrive on
+    MediaPipe's thread and are collected with ``latest``, and frames
+    submitted while the graph is busy may be dropped.
+    """
+
+    def __init__(
+        self,
+        model_path: str | Path = DEFAULT_HAND_LANDMARKER_MODEL,
+        running_mode: str = "video",
+        max_num_hands: int = 2,
+        min_detection_confidence: float = 0.5,
+        min_presence_confidence: float = 0.5,
+        min_tracking_confidence: float = 0.5,
+        fps: float = 30.0,
+        buffer_pool: Optional[FrameBufferPool] = None,
+        profiler: Optional[StageProfiler] = None,
+    ) -> None:
+        if running_mode not in RUNNING_MODES:
+            raise ValueError(f"running_mode must be one of {', '.join(RUNNING_MODES)}, got {running_mode!r}")
+        self.model_path = Path(model_path).expanduser()
+        if not self.model_path.exists():
+            raise FileNotFoundError(
+                f"HandLandmarker model not found at {self.model_path}; download it from {HAND_LANDMARKER_MODEL_URL}"
+            )
+        self.running_mode = running_mode
+        self.max_num_hands = max_num_hands
+        self.min_detection_confidence = min_detection_confidence
+        self.min_presence_confidence = min_presence_confidence
+        self.min_tracking_confidence = min_tracking_confidence
+        self.fps = fps
+        self.buffer_pool = buffer_pool
+        self.profiler = profiler or NULL_PROFILER
+        self._model_digest = hashlib.blake2b(self.model_path.read_bytes(), digest_size=16).hexdigest()
+        self._frames_seen = 0
+        self._last_timestamp_ms = -1
+        self._latest: Optional[DetectionResult] = None
+        self._lock = threading.Lock()
+        self._landmarker = self._create()
+
+    @property
+    def cache_params(self) -> dict:
+        """Parameters that change detector output, used to key cached detections."""
+
+        return {
+            "backend": "mediapipe-tasks",
+            "version": getattr(mp, "__version__", "unknown"),
+            "model": self._model_digest,
+            "running_mode": self.running_mode,
+            "max_num_hands": self.max_num_hands,
+            "min_detection_confidence": self.min_detection_confidence,
+            "min_presence_confidence": self.min_presence_confidence,
+            "min_tracking_confidence": self.min_tracking_confidence,
+        }
+
+    @property
+    def asynchronous(self) -> bool:
+        return self.running_mode == "live_stream"
+
+    def detect(self, frame: np.ndarray) -> List[HandPosition]:
+        """Run detection on a BGR frame and return structured hand positions."""
+
+        if self.running_mode == "live_stream":
+            raise RuntimeError("detect() is not available in live_stream mode; use submit() and latest()")
+        image = self._to_image(frame)
+        with self.profiler.stage("inference"):
+            if self.running_mode == "image":
+                result = self._landmarker.detect(image)
+            else:
+                timestamp_ms = self._next_timestamp(round(self._frames_seen * 1000.0 / self.fps))
+                result = self._landmarker.detect_for_video(image, timestamp_ms)
+        self._frames_seen += 1
+        with self.profiler.stage("postprocess"):
+            return self._positions(result, image.width, image.height)
+
+    def submit(self, frame: np.ndarray, timestamp_ms: int) -> None:
+        """Queue a BGR frame for asynchronous detection (``live_stream`` mode only)."""
+
+        if self.running_mode != "live_stream":
+            raise RuntimeError("submit() requires running_mode='live_stream'")
+        image = self._to_image(frame)
+        with self.profiler.stage("submit"):
+            self._landmarker.detect_async(image, self._next_timestamp(timestamp_ms))
+
+    def latest(self) -> Optional[DetectionResult]:
+        """Newest asynchronous result not yet returned, or None."""
+
+        with self._lock:
+            result, self._latest = self._latest, None
+        return result
+
+    def reset(self) -> None:
+        """Drop tracking state so the next frame starts a fresh detection."""
+
+        # HandLandmarker has no reset; a new graph also restarts the timestamp sequence.
+        self._landmarker.close()
+        self._frames_seen = 0
+        self._last_timestamp_ms = -1
+        with self._lock:
+            self._latest = None
+        self._landmarker = self._create()
+
+    def warm_up(self, frame_shape: Tuple[int, int, int] = WARM_UP_FRAME_SHAPE, timeout: float = 5.0) -> None:
+        """Run one inference on a blank frame so graph start-up happens before real frames.
+
+        In ``video`` and ``live_stream`` mode this consumes one timestamp, so
+        the next frame is stamped at least a millisecond later. An
+        asynchronous warm-up waits up to ``timeout`` seconds for its result
+        and discards it.
+        """
+
+        image = mp.Image(image_format=mp.ImageFormat.SRGB, data=np.zeros(frame_shape, dtype=np.uint8))
+        if self.running_mode == "image":
+            self._landmarker.detect(image)
+        elif self.running_mode == "video":
+            self._landmarker.detect_for_video(image, self._next_timestamp(0))
+        else:
+            self._landmarker.detect_async(image, self._next_timestamp(0))
+            deadline = time.monotonic() + timeout
+            while self.latest() is None and time.monotonic() < deadline:
+                time.sleep(0.005)
+
+    def close(self) -> None:
+        """Release MediaPipe resources."""
+
+        self._landmarker.close()
+
+    def _create(self) -> vision.HandLandmarker:
+        options = vision.HandLandmarkerOptions(
+            base_options=BaseOptions(model_asset_path=str(self.model_path)),
+            running_mode=vision.RunningMode[self.running_mode.upper()],
+            num_hands=self.max_num_hands,
+            min_hand_detection_confidence=self.min_detection_confidence,
+            min_hand_presence_confidence=self.min_presence_confidence,
+            min_tracking_confidence=self.min_tracking_confidence,
+            result_callback=self._on_result if self.running_mode == "live_stream" else None,
+        )
+        return vision.HandLandmarker.create_from_options(options)
+
+    def _to_image(self, frame: np.ndarray) -> mp.Image:
+        with self.profiler.stage("convert"):
+            rgb_frame = self.buffer_pool.acquire(frame.shape, frame.dtype) if self.buffer_pool else None
+            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+            try:
+                # mp.Image copies the pixels, so the RGB buffer can go straight back to the pool.
+                return mp.Image(image_format=mp.ImageFormat.SRGB, data=rgb_frame)
+            finally:
+                if self.buffer_pool:
+                    self.buffer_pool.release(rgb_frame)
+
+    def _next_timestamp(self, timestamp_ms: int) -> int:
+        timestamp_ms = max(int(timestamp_ms), self._last_timestamp_ms + 1)
+        self._last_timestamp_ms = timestamp_ms
+        return timestamp_ms
+
+    def _on_result(self, result: vision.HandLandmarkerResult, image: mp.Image, timestamp_ms: int) -> None:
+        positions = self._positions(result, image.width, image.height)
+        with self._lock:
+            self._latest = DetectionResult(timestamp_ms=timestamp_ms, positions=positions)
+
+    @staticmethod
+    def _positions(result: vision.HandLandmarkerResult, width: int, height: int) -> List[HandPosition]:
+        categories = [hand[0] for hand in result.handedness if hand]
+        return build_positions(
+            result.hand_landmarks,
+            [category.category_name or "UNKNOWN" for category in categories],
+            [float(category.score or 0.0) for category in categories],
+            width,
+            height,
+        )
@@ -0,0 +1,35 @@
+"""Features derived from detection logs (kinematics, ...)."""
+
+from typing import TYPE_CHECKING
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .kinematics import (
+        KinematicFeatureExtractor,
+        KinematicFeatureStats,
+        compute_kinematic_features,
+        feature_schema,
+        features_path_for,
+    )
+
+__all__ = [
+    "KinematicFeatureExtractor",
+    "KinematicFeatureStats",
+    "compute_kinematic_features",
+    "feature_schema",
+    "features_path_for",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".kinematics": (
+            "KinematicFeatureExtractor",
+            "KinematicFeatureStats",
+            "compute_kinematic_features",
+            "feature_schema",
+            "features_path_for",
+        ),
+    },
+)
@@ -0,0 +1,474 @@
+"""Vectorized per-hand kinematic features computed from HandLogWriter logs."""
+from __future__ import annotations
+
+import itertools
+import json
+import time
+import warnings
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from roboticsdatacolleciton.loggers import HandLogBatch, HandLogReader
+from roboticsdatacolleciton.types import LANDMARK_INDEX, NUM_LANDMARKS
+
+FEATURES_METADATA_KEY = b"kinematic_features"
+# Hands sharing a label within one frame get separate tracks; more than this is not expected.
+MAX_HANDS_PER_LABEL = 8
+# Rows held back at most while waiting for enough usable palms to infer the frame size.
+FRAME_SIZE_INFERENCE_ROWS = 262144
+
+_WRIST = LANDMARK_INDEX["WRIST"]
+_THUMB_TIP = LANDMARK_INDEX["THUMB_TIP"]
+_INDEX_TIP = LANDMARK_INDEX["INDEX_FINGER_TIP"]
+_INDEX_MCP = LANDMARK_INDEX["INDEX_FINGER_MCP"]
+_MIDDLE_MCP = LANDMARK_INDEX["MIDDLE_FINGER_MCP"]
+_PINKY_MCP = LANDMARK_INDEX["PINKY_MCP"]
+
+
+def feature_schema() -> pa.Schema:
+    """Arrow schema of the feature files written by ``compute_kinematic_features``.
+
+    One row per log row, in log order. Coordinates are rescaled so x, y and
+    z share one unit, the image height (see ``KinematicFeatureExtractor``).
+    ``velocity``/``acceleration`` are ``21 x 3`` blocks per landmark in
+    height units per second (squared); they are NaN where the track has no
+    usable predecessor.
+    """
+
+    landmark_block = pa.list_(pa.list_(pa.float32(), 3), NUM_LANDMARKS)
+    return pa.schema(
+        [
+            ("frame_index", pa.int32()),
+            ("hand_index", pa.int16()),
+            ("label", pa.string()),
+            ("track", pa.int16()),
+            ("time", pa.float64()),
+            ("dt", pa.float32()),
+            ("gap_frames", pa.int32()),
+            ("velocity", landmark_block),
+            ("acceleration", landmark_block),
+            ("palm_speed", pa.float32()),
+            ("grip_aperture", pa.float32()),
+            ("grip_aperture_ratio", pa.float32()),
+            ("inter_hand_distance", pa.float32()),
+            ("palm_normal", pa.list_(pa.float32(), 3)),
+            ("carried_over", pa.bool_()),
+        ]
+    )
+
+
+@dataclass(slots=True)
+class KinematicFeatureStats:
+    """Totals of one ``compute_kinematic_features`` run."""
+
+    log_path: Path
+    output_path: Path
+    rows: int = 0
+    frames: int = 0
+    tracks: int = 0
+    gaps: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+@dataclass(slots=True)
+class _TrackState:
+    frame: int
+    time: float
+    landmarks: np.ndarray
+    velocity: np.ndarray
+
+
+class KinematicFeatureExtractor:
+    """Streams HandLogBatch rows in and feature record batches out.
+
+    Hands are matched between frames by ``label``; when several hands in a
+    frame share a label they are assigned to that label's tracks by the
+    smallest total palm displacement from each track's last position.
+    Velocities and accelerations are backward differences along each track
+    and are NaN when the previous observation is more than
+    ``max_gap_frames`` frames back (or missing). Times come from
+    ``captured_at`` when the log has it and from ``frame_index / fps``
+    otherwise.
+
+    Normalized coordinates are scaled by the frame's aspect ratio so
+    distances are in image heights regardless of resolution; ``frame_size``
+    is ``(width, height)`` and is inferred from the palm pixel columns when
+    omitted. Output is held back until enough rows have arrived to infer it,
+    so every row of a log uses the same units; if inference still fails
+    after ``FRAME_SIZE_INFERENCE_ROWS`` rows (or at ``flush()``) the aspect
+    ratio falls back to 1.0 with a warning and ``frame_size_source`` is
+    ``"default"`` (otherwise ``"given"`` or ``"inferred"``).
+    Batches must arrive in frame order, as logs are written. The
+    rows of the last frame seen are held back until the next frame arrives,
+    so call ``flush()`` after the final batch.
+    """
+
+    def __init__(
+        self,
+        fps: float = 30.0,
+        max_gap_frames: int = 5,
+        frame_size: Optional[Tuple[int, int]] = None,
+    ) -> None:
+        if fps <= 0:
+            raise ValueError("fps must be positive")
+        self.fps = fps
+        self.max_gap_frames = max_gap_frames
+        self.frame_size = frame_size
+        self._infer_frame_size = frame_size is None
+        self.frame_size_source: Optional[str] = None if frame_size is None else "given"
+        self.rows = 0
+        self.frames = 0
+        self.gaps = 0
+        self._labels: Dict[str, int] = {}
+        self._tracks: Dict[int, _TrackState] = {}
+        self._last_palm: Dict[int, Tuple[int, np.ndarray]] = {}
+        self._pending: Optional[HandLogBatch] = None
+
+    @property
+    def track_count(self) -> int:
+        return len(self._tracks)
+
+    @property
+    def aspect(self) -> float:
+        if self.frame_size is None:
+            return 1.0
+        width, height = self.frame_size
+        return width / height
+
+    def process(self, batch: HandLogBatch) -> Optional[pa.RecordBatch]:
+        """Features for every complete frame received so far (None if there are none yet)."""
+
+        if self._pending is not None:
+            batch = _concat([self._pending, batch])
+            self._pending = None
+        if len(batch) == 0:
+            return None
+        if self._infer_frame_size:
+            self.frame_size = _infer_frame_size(batch)
+            if self.frame_size is None and len(batch) < FRAME_SIZE_INFERENCE_ROWS:
+                self._pending = batch
+                return None
+            self._settle_frame_size()
+        # The next batch may still hold rows of the last frame.
+        last = batch.frame_index[-1]
+        split = int(np.searchsorted(batch.frame_index, last, side="left"))
+        self._pending = _slice(batch, split, len(batch))
+        if split == 0:
+            return None
+        return self._compute(_slice(batch, 0, split))
+
+    def flush(self) -> Optional[pa.RecordBatch]:
+        pending, self._pending = self._pending, None
+        if pending is None or len(pending) == 0:
+            return None
+        if self._infer_frame_size:
+            self.frame_size = _infer_frame_size(pending)
+            self._settle_frame_size()
+        return self._compute(pending)
+
+    def _settle_frame_size(self) -> None:
+        self._infer_frame_size = False
+        if self.frame_size is not None:
+            self.frame_size_source = "inferred"
+            return
+        self.frame_size_source = "default"
+        warnings.warn(
+            "Could not infer the frame size from the log's palm positions; using an aspect ratio of 1.0, "
+            "so x distances are in image widths. Pass frame_size to fix the units.",
+            RuntimeWarning,
+            stacklevel=3,
+        )
+
+    def _compute(self, batch: HandLogBatch) -> pa.RecordBatch:
+        n = len(batch)
+        frames = batch.frame_index.astype(np.int64)
+        times = np.where(np.isfinite(batch.captured_at), batch.captured_at, frames / self.fps)
+        points = batch.landmarks.astype(np.float32, copy=True)
+        aspect = np.float32(self.aspect)
+        points[:, :, 0] *= aspect
+        points[:, :, 2] *= aspect
+        palms = points[:, :, :2].mean(axis=1)
+        tracks = self._assign_tracks(batch, frames, palms)
+
+        # Walk each track in frame order.
+        order = np.lexsort((frames, tracks))
+        track_sorted = tracks[order]
+        frame_sorted = frames[order]
+        time_sorted = times[order]
+        points_sorted = points[order]
+        first = np.ones(n, dtype=np.bool_)
+        first[1:] = track_sorted[1:] != track_sorted[:-1]
+
+        prev_frame = np.empty(n, dtype=np.int64)
+        prev_time = np.empty(n, dtype=np.float64)
+        prev_points = np.empty_like(points_sorted)
+        prev_velocity = np.full_like(points_sorted, np.nan)
+        prev_frame[1:], prev_time[1:], prev_points[1:] = frame_sorted[:-1], time_sorted[:-1], points_sorted[:-1]
+        has_prev = ~first
+        for row in np.flatnonzero(first).tolist():
+            state = self._tracks.get(int(track_sorted[row]))
+            if state is not None:
+                prev_frame[row], prev_time[row] = state.frame, state.time
+                prev_points[row], prev_velocity[row] = state.landmarks, state.velocity
+                has_prev[row] = True
+
+        gap_frames = np.where(has_prev, frame_sorted - prev_frame, 0)
+        dt = np.where(has_prev, time_sorted - prev_time, np.nan)
+        usable = has_prev & (gap_frames <= self.max_gap_frames) & (dt > 0)
+        self.gaps += int(np.count_nonzero(has_prev & (gap_frames > 1)))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            step = np.where(usable, dt, np.nan).astype(np.float32)[:, None, None]
+            velocity = (points_sorted - prev_points) / step
+            prev_velocity[1:][~first[1:]] = velocity[:-1][~first[1:]]
+            acceleration = (velocity - prev_velocity) / step
+
+        ends = np.flatnonzero(np.append(first[1:], True))
+        for row in ends.tolist():
+            self._tracks[int(track_sorted[row])] = _TrackState(
+                frame=int(frame_sorted[row]),
+                time=float(time_sorted[row]),
+                landmarks=points_sorted[row].copy(),
+                velocity=velocity[row].copy(),
+            )
+
+        # Back to log order.
+        inverse = np.empty(n, dtype=np.int64)
+        inverse[order] = np.arange(n)
+        velocity, acceleration = velocity[inverse], acceleration[inverse]
+        gap_frames, dt = gap_frames[inverse], dt[inverse]
+        palm_speed = np.linalg.norm(velocity[:, :, :2].mean(axis=1), axis=1)
+
+        grip = np.linalg.norm(points[:, _THUMB_TIP] - points[:, _INDEX_TIP], axis=1)
+        hand_size = np.linalg.norm(points[:, _MIDDLE_MCP] - points[:, _WRIST], axis=1)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            grip_ratio = grip / hand_size
+
+        normal = np.cross(points[:, _INDEX_MCP] - points[:, _WRIST], points[:, _PINKY_MCP] - points[:, _WRIST])
+        # Left and right hands are mirror images; flip one so normals mean the same side of the palm.
+        normal[batch.label == "Left"] *= -1.0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            normal /= np.linalg.norm(normal, axis=1, keepdims=True)
+
+        self.rows += n
+        self.frames += int(np.count_nonzero(np.diff(frames, prepend=frames[0] - 1)))
+        columns = [
+            pa.array(batch.frame_index.astype(np.int32, copy=False)),
+            pa.array(batch.hand_index.astype(np.int16, copy=False)),
+            pa.array(batch.label, type=pa.string()),
+            pa.array(tracks.astype(np.int16)),
+            pa.array(times),
+            pa.array(dt.astype(np.float32)),
+            pa.array(gap_frames.astype(np.int32)),
+            _landmark_block(velocity),
+            _landmark_block(acceleration),
+            pa.array(palm_speed.astype(np.float32)),
+            pa.array(grip.astype(np.float32)),
+            pa.array(grip_ratio.astype(np.float32)),
+            pa.array(_inter_hand_distance(frames, palms)),
+            pa.FixedSizeListArray.from_arrays(pa.array(normal.astype(np.float32).reshape(-1)), 3),
+            pa.array(batch.carried_over),
+        ]
+        return pa.RecordBatch.from_arrays(columns, schema=feature_schema())
+
+    def _assign_tracks(self, batch: HandLogBatch, frames: np.ndarray, palms: np.ndarray) -> np.ndarray:
+        names, inverse = np.unique(batch.label.astype(str), return_inverse=True)
+        codes = np.array([self._labels.setdefault(name, len(self._labels)) for name in names], dtype=np.int64)
+        label_codes = codes[inverse.reshape(-1)]
+        tracks = label_codes * MAX_HANDS_PER_LABEL
+
+        # Rows are in frame order; find (frame, label) groups with more than one hand.
+        order = np.lexsort((label_codes, frames))
+        keys = frames[order] * len(self._labels) + label_codes[order]
+        starts = np.flatnonzero(np.diff(keys, prepend=keys[0] - 1))
+        sizes = np.diff(np.append(starts, len(keys)))
+        duplicated = sizes > 1
+        if not duplicated.any():
+            self._remember_palms(tracks, frames, palms)
+            return tracks
+
+        single = np.ones(len(frames), dtype=np.bool_)
+        for start, size in zip(starts[duplicated].tolist(), sizes[duplicated].tolist()):
+            single[order[start:start + size]] = False
+        for start, size in zip(starts[duplicated].tolist(), sizes[duplicated].tolist()):
+            rows = order[start:start + size]
+            frame = int(frames[rows[0]])
+            base = int(tracks[rows[0]])
+            candidates = list(range(base, base + min(MAX_HANDS_PER_LABEL, max(size, 2))))
+            history = [self._palm_before(candidate, frame, tracks, frames, palms, single) for candidate in candidates]
+            best, best_cost = None, np.inf
+            for assignment in itertools.permutations(range(len(candidates)), len(rows)):
+                cost = sum(
+                    float(np.linalg.norm(palms[row] - history[slot])) if history[slot] is not None else 0.0
+                    for row, slot in zip(rows.tolist(), assignment)
+                )
+                if cost < best_cost:
+                    best, best_cost = assignment, cost
+            for row, slot in zip(rows.tolist(), best):
+                tracks[row] = candidates[slot]
+                self._last_palm[candidates[slot]] = (frame, palms[row])
+        self._remember_palms(tracks, frames, palms)
+        return tracks
+
+    def _palm_before(
+        self,
+        track: int,
+        frame: int,
+        tracks: np.ndarray,
+        frames: np.ndarray,
+        palms: np.ndarray,
+        single: np.ndarray,
+    ) -> Optional[np.ndarray]:
+        """Most recent palm of ``track`` before ``frame``, from this batch or earlier ones."""
+
+        latest = self._last_palm.get(track)
+        latest = latest if latest is not None and latest[0] < frame else None
+        # Single-hand rows of this label belong to the label's first track.
+        if track % MAX_HANDS_PER_LABEL == 0:
+            rows = np.flatnonzero(single & (tracks == track) & (frames < frame))
+            if len(rows) and (latest is None or frames[rows[-1]] > latest[0]):
+                latest = (int(frames[rows[-1]]), palms[rows[-1]])
+        return None if latest is None else latest[1]
+
+    def _remember_palms(self, tracks: np.ndarray, frames: np.ndarray, palms: np.ndarray) -> None:
+        order = np.lexsort((frames, tracks))
+        ends = order[np.flatnonzero(np.append(tracks[order][1:] != tracks[order][:-1], True))]
+        for row in ends.tolist():
+            self._last_palm[int(tracks[row])] = (int(frames[row]), palms[row].copy())
+
+
+def features_path_for(log_path: str | Path) -> Path:
+    """Sibling path of a log's feature file: ``<stem>.features.parquet``."""
+
+    log_path = Path(log_path)
+    return log_path.with_name(f"{log_path.stem}.features.parquet")
+
+
+def compute_kinematic_features(
+    log_path: str | Path,
+    output_path: str | Path | None = None,
+    fps: float = 30.0,
+    max_gap_frames: int = 5,
+    frame_size: Optional[Tuple[int, int]] = None,
+    batch_size: int = 65536,
+    compression: str | None = "zstd",
+) -> KinematicFeatureStats:
+    """Stream a log through ``KinematicFeatureExtractor`` into a Parquet file.
+
+    Memory stays bounded by ``batch_size`` rows regardless of log length;
+    each processed batch becomes one row group. The output defaults to
+    ``features_path_for(log_path)``.
+    """
+
+    started = time.perf_counter()
+    log_path = Path(log_path)
+    output_path = Path(output_path) if output_path is not None else features_path_for(log_path)
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    extractor = KinematicFeatureExtractor(fps=fps, max_gap_frames=max_gap_frames, frame_size=frame_size)
+    staging = output_path.with_name(f".{output_path.name}.tmp")
+    writer: Optional[pq.ParquetWriter] = None
+    try:
+        with HandLogReader(log_path) as reader:
+            for batch in reader.iter_batches(batch_size=batch_size):
+                features = extractor.process(batch)
+                if features is not None:
+                    writer = writer or _open_writer(staging, extractor, reader, compression)
+                    writer.write_batch(features)
+            features = extractor.flush()
+            writer = writer or _open_writer(staging, extractor, reader, compression)
+            if features is not None:
+                writer.write_batch(features)
+        writer.close()
+        writer = None
+        staging.replace(output_path)
+    finally:
+        if writer is not None:
+            writer.close()
+        staging.unlink(missing_ok=True)
+    return KinematicFeatureStats(
+        log_path=log_path,
+        output_path=output_path,
+        rows=extractor.rows,
+        frames=extractor.frames,
+        tracks=extractor.track_count,
+        gaps=extractor.gaps,
+        elapsed_seconds=time.perf_counter() - started,
+    )
+
+
+def _open_writer(
+    path: Path,
+    extractor: KinematicFeatureExtractor,
+    reader: HandLogReader,
+    compression: str | None,
+) -> pq.ParquetWriter:
+    settings = {
+        "fps": extractor.fps,
+        "max_gap_frames": extractor.max_gap_frames,
+        "frame_size": list(extractor.frame_size) if extractor.frame_size else None,
+        "frame_size_source": extractor.frame_size_source,
+        "units": "image heights",
+        "landmark_names": list(reader.landmark_names),
+        "monotonic_epoch": reader.monotonic_epoch,
+    }
+    schema = feature_schema().with_metadata({FEATURES_METADATA_KEY: json.dumps(settings).encode("utf-8")})
+    return pq.ParquetWriter(
+        str(path),
+        schema,
+        compression=compression or "none",
+        use_dictionary=["label"],
+    )
+
+
+def _landmark_block(values: np.ndarray) -> pa.Array:
+    flat = pa.array(np.ascontiguousarray(values, dtype=np.float32).reshape(-1))
+    return pa.FixedSizeListArray.from_arrays(pa.FixedSizeListArray.from_arrays(flat, 3), NUM_LANDMARKS)
+
+
+def _inter_hand_distance(frames: np.ndarray, palms: np.ndarray) -> np.ndarray:
+    """Distance from each hand's palm to the nearest other hand in the same frame (NaN if alone)."""
+
+    n = len(frames)
+    distance = np.full(n, np.nan, dtype=np.float32)
+    starts = np.flatnonzero(np.diff(frames, prepend=frames[0] - 1))
+    sizes = np.diff(np.append(starts, n))
+    pairs = starts[sizes == 2]
+    if len(pairs):
+        gap = np.linalg.norm(palms[pairs] - palms[pairs + 1], axis=1)
+        distance[pairs] = gap
+        distance[pairs + 1] = gap
+    for start, size in zip(starts[sizes > 2].tolist(), sizes[sizes > 2].tolist()):
+        group = palms[start:start + size]
+        matrix = np.linalg.norm(group[:, None, :] - group[None, :, :], axis=2)
+        np.fill_diagonal(matrix, np.inf)
+        distance[start:start + size] = matrix.min(axis=1)
+    return distance
+
+
+def _infer_frame_size(batch: HandLogBatch) -> Optional[Tuple[int, int]]:
+    # palm_pixel is palm_normalized * (width, height), truncated to whole pixels.
+    normalized = batch.palm_normalized.astype(np.float64)
+    pixel = batch.palm_pixel.astype(np.float64)
+    usable = (normalized > 0.2).all(axis=1)
+    if np.count_nonzero(usable) < 8:
+        return None
+    width, height = np.median((pixel[usable] + 0.5) / normalized[usable], axis=0)
+    return int(round(width)), int(round(height))
+
+
+def _slice(batch: HandLogBatch, start: int, stop: int) -> HandLogBatch:
+    return HandLogBatch(*(getattr(batch, field.name)[start:stop] for field in fields(HandLogBatch)))
+
+
+def _concat(batches: List[HandLogBatch]) -> HandLogBatch:
+    return HandLogBatch(
+        *(np.concatenate([getattr(batch, field.name) for batch in batches]) for field in fields(HandLogBatch))
+    )
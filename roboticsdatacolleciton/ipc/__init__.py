@@ -0,0 +1,35 @@
+"""Inter-process publishing of detections to local consumers."""
+
+from typing import TYPE_CHECKING
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .shared_hands import (
+        DEFAULT_SHM_NAME,
+        HAND_LABELS,
+        SharedHandsFrame,
+        SharedHandsPublisher,
+        SharedHandsReader,
+    )
+
+__all__ = [
+    "DEFAULT_SHM_NAME",
+    "HAND_LABELS",
+    "SharedHandsFrame",
+    "SharedHandsPublisher",
+    "SharedHandsReader",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".shared_hands": (
+            "DEFAULT_SHM_NAME",
+            "HAND_LABELS",
+            "SharedHandsFrame",
+            "SharedHandsPublisher",
+            "SharedHandsReader",
+        ),
+    },
+)
@@ -0,0 +1,345 @@
+"""Latest hand detections in a shared-memory ring buffer for local consumers.
+
+Layout: a 64-byte header followed by ``slots`` fixed-size records, one per
+published frame (frame ``n`` goes to slot ``n % slots``). Every record
+carries a seqlock sequence number: the publisher sets it to ``2n + 1``
+before writing frame ``n`` and to ``2n + 2`` once the record is complete,
+then advances the header's ``head`` to ``n + 1``. Readers take NumPy views
+straight over the shared buffer and check the sequence number to know
+whether a view still holds the frame they asked for; a slot is only
+overwritten after the publisher has lapped the whole ring.
+
+Timestamps are ``time.monotonic()`` seconds, which on Linux and macOS is a
+system-wide clock shared by all local processes.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from dataclasses import dataclass
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from roboticsdatacolleciton.types import NUM_LANDMARKS, HandPosition
+
+DEFAULT_SHM_NAME = "roboticsdatacolleciton-hands"
+LAYOUT_VERSION = 1
+HAND_LABELS = ("Left", "Right")
+
+_MAGIC = 0x53444E48  # "HNDS"
+_HEADER_SIZE = 64
+_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "<u4"),
+        ("version", "<u4"),
+        ("slots", "<u4"),
+        ("max_hands", "<u4"),
+        ("num_landmarks", "<u4"),
+        ("closed", "<u4"),
+        ("head", "<u8"),
+    ],
+    align=True,
+)
+_LABEL_CODES = {label: code for code, label in enumerate(HAND_LABELS)}
+# Segments created by publishers in this process (see ``_attach``).
+_OWNED_SEGMENTS: set[str] = set()
+
+
+def slot_dtype(max_hands: int) -> np.dtype:
+    """Record layout of one ring-buffer slot."""
+
+    return np.dtype(
+        [
+            ("seq", "<u8"),
+            ("frame_index", "<i8"),
+            ("captured_at", "<f8"),
+            ("published_at", "<f8"),
+            ("num_hands", "<u4"),
+            ("labels", "i1", (max_hands,)),
+            ("confidence", "<f4", (max_hands,)),
+            ("palm", "<f4", (max_hands, 2)),
+            ("landmarks", "<f4", (max_hands, NUM_LANDMARKS, 3)),
+        ],
+        align=True,
+    )
+
+
+def buffer_size(slots: int, max_hands: int) -> int:
+    return _HEADER_SIZE + slots * slot_dtype(max_hands).itemsize
+
+
+class SharedHandsPublisher:
+    """Publishes each frame's detections into the shared ring buffer.
+
+    The publisher owns the segment: it creates it (replacing a stale segment
+    left behind by a crashed run) and unlinks it on ``close``. Use one
+    publisher per segment name; readers may come and go at any time.
+    """
+
+    def __init__(self, name: str = DEFAULT_SHM_NAME, slots: int = 64, max_hands: int = 2) -> None:
+        if slots < 2:
+            raise ValueError("SharedHandsPublisher needs at least two slots")
+        self.name = name
+        self.slots = slots
+        self.max_hands = max_hands
+        size = buffer_size(slots, max_hands)
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        _OWNED_SEGMENTS.add(name)
+        self._header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._shm.buf)
+        records = np.ndarray((slots,), dtype=slot_dtype(max_hands), buffer=self._shm.buf, offset=_HEADER_SIZE)
+        records.fill(0)
+        self._seq = records["seq"]
+        self._frame_index = records["frame_index"]
+        self._captured_at = records["captured_at"]
+        self._published_at = records["published_at"]
+        self._num_hands = records["num_hands"]
+        self._labels = records["labels"]
+        self._confidence = records["confidence"]
+        self._palm = records["palm"]
+        self._landmarks = records["landmarks"]
+        self._header["magic"] = _MAGIC
+        self._header["version"] = LAYOUT_VERSION
+        self._header["slots"] = slots
+        self._header["max_hands"] = max_hands
+        self._header["num_landmarks"] = NUM_LANDMARKS
+        self._header["closed"] = 0
+        self._header["head"] = 0
+        self._published = 0
+
+    def __enter__(self) -> "SharedHandsPublisher":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self.close()
+
+    @property
+    def published(self) -> int:
+        return self._published
+
+    def publish(
+        self,
+        positions: Sequence[HandPosition],
+        captured_at: float,
+        frame_index: Optional[int] = None,
+    ) -> int:
+        """Write one frame; returns its sequence number ``n``.
+
+        Hands beyond ``max_hands`` are dropped. ``frame_index`` defaults to
+        ``n``.
+        """
+
+        number = self._published
+        slot = number % self.slots
+        hands = positions[: self.max_hands]
+        count = len(hands)
+        self._seq[slot] = 2 * number + 1
+        self._frame_index[slot] = number if frame_index is None else frame_index
+        self._captured_at[slot] = captured_at
+        self._published_at[slot] = time.monotonic()
+        self._num_hands[slot] = count
+        if count:
+            self._labels[slot, :count] = [_LABEL_CODES.get(hand.label, -1) for hand in hands]
+            self._confidence[slot, :count] = [hand.confidence for hand in hands]
+            self._palm[slot, :count] = [hand.normalized_palm for hand in hands]
+            self._landmarks[slot, :count] = [hand.landmark_array for hand in hands]
+        self._seq[slot] = 2 * number + 2
+        self._header["head"] = number + 1
+        self._published = number + 1
+        return number
+
+    def close(self) -> None:
+        """Mark the stream as finished and remove the segment."""
+
+        if self._shm is None:
+            return
+        self._header["closed"] = 1
+        # Drop our views before closing, or the mmap refuses to close.
+        self._header = self._seq = self._frame_index = self._captured_at = None
+        self._published_at = self._num_hands = self._labels = self._confidence = None
+        self._palm = self._landmarks = None
+        self._shm.close()
+        try:
+            self._shm.unlink()
+        except FileNotFoundError:
+            pass
+        _OWNED_SEGMENTS.discard(self.name)
+        self._shm = None
+
+
+@dataclass(slots=True)
+class SharedHandsFrame:
+    """One published frame as views over shared memory.
+
+    The arrays are zero-copy and cover only ``num_hands`` hands; ``labels``
+    holds indices into ``HAND_LABELS`` (-1 when unknown). They stay correct
+    until the publisher laps the ring, so check ``valid()`` after reading
+    them, or call ``copy()`` for a private snapshot.
+    """
+
+    number: int
+    frame_index: int
+    captured_at: float
+    published_at: float
+    labels: np.ndarray
+    confidence: np.ndarray
+    palm: np.ndarray
+    landmarks: np.ndarray
+    _seq: np.ndarray
+    _slot: int
+
+    @property
+    def num_hands(self) -> int:
+        return len(self.labels)
+
+    @property
+    def label_names(self) -> List[str]:
+        return [HAND_LABELS[code] if 0 <= code < len(HAND_LABELS) else "Unknown" for code in self.labels.tolist()]
+
+    def valid(self) -> bool:
+        """True while the slot still holds this frame."""
+
+        return int(self._seq[self._slot]) == 2 * self.number + 2
+
+    def copy(self) -> Optional["SharedHandsFrame"]:
+        """Detached snapshot, or None if the frame was overwritten while copying."""
+
+        snapshot = SharedHandsFrame(
+            number=self.number,
+            frame_index=self.frame_index,
+            captured_at=self.captured_at,
+            published_at=self.published_at,
+            labels=self.labels.copy(),
+            confidence=self.confidence.copy(),
+            palm=self.palm.copy(),
+            landmarks=self.landmarks.copy(),
+            _seq=np.array([2 * self.number + 2], dtype=np.uint64),
+            _slot=0,
+        )
+        return snapshot if self.valid() else None
+
+
+class SharedHandsReader:
+    """Client side of SharedHandsPublisher; attaches to an existing segment.
+
+    ``latest()`` returns the newest complete frame, ``recent(n)`` up to the
+    ``n`` newest ones (oldest first) and ``wait()`` polls until a frame newer
+    than a given sequence number is published.
+    """
+
+    def __init__(self, name: str = DEFAULT_SHM_NAME) -> None:
+        self.name = name
+        self._shm = _attach(name)
+        header = np.ndarray((), dtype=_HEADER_DTYPE, buffer=self._shm.buf)
+        if int(header["magic"]) != _MAGIC or int(header["version"]) != LAYOUT_VERSION:
+            self._shm.close()
+            raise ValueError(f"Shared memory segment {name!r} is not a hand-detections buffer (version {LAYOUT_VERSION})")
+        self._header = header
+        self.slots = int(header["slots"])
+        self.max_hands = int(header["max_hands"])
+        self._records = np.ndarray(
+            (self.slots,), dtype=slot_dtype(self.max_hands), buffer=self._shm.buf, offset=_HEADER_SIZE
+        )
+        self._seq = self._records["seq"]
+
+    def __enter__(self) -> "SharedHandsReader":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self.close()
+
+    @property
+    def head(self) -> int:
+        """Number of frames published so far."""
+
+        return int(self._header["head"])
+
+    @property
+    def closed(self) -> bool:
+        """True once the publisher has shut down."""
+
+        return bool(self._header["closed"])
+
+    def latest(self) -> Optional[SharedHandsFrame]:
+        while True:
+            head = self.head
+            if head == 0:
+                return None
+            frame = self._frame(head - 1)
+            if frame is not None:
+                return frame
+
+    def recent(self, count: int) -> List[SharedHandsFrame]:
+        head = self.head
+        frames = []
+        for number in range(max(0, head - min(count, self.slots - 1)), head):
+            frame = self._frame(number)
+            if frame is not None:
+                frames.append(frame)
+        return frames
+
+    def wait(
+        self,
+        newer_than: int = -1,
+        timeout: Optional[float] = None,
+        poll_interval: float = 0.0005,
+    ) -> Optional[SharedHandsFrame]:
+        """Block until a frame with ``number > newer_than`` exists; None on timeout or close."""
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self.head - 1 <= newer_than:
+            if self.closed or (deadline is not None and time.monotonic() >= deadline):
+                return None
+            time.sleep(poll_interval)
+        return self.latest()
+
+    def close(self) -> None:
+        if self._shm is None:
+            return
+        self._header = self._records = self._seq = None
+        try:
+            self._shm.close()
+        except BufferError:
+            pass  # frames handed out still reference the mapping; it is released with them
+        self._shm = None
+
+    def _frame(self, number: int) -> Optional[SharedHandsFrame]:
+        slot = number % self.slots
+        expected = 2 * number + 2
+        if int(self._seq[slot]) != expected:
+            return None
+        record = self._records[slot : slot + 1]
+        count = min(int(record["num_hands"][0]), self.max_hands)
+        frame = SharedHandsFrame(
+            number=number,
+            frame_index=int(record["frame_index"][0]),
+            captured_at=float(record["captured_at"][0]),
+            published_at=float(record["published_at"][0]),
+            labels=record["labels"][0, :count],
+            confidence=record["confidence"][0, :count],
+            palm=record["palm"][0, :count],
+            landmarks=record["landmarks"][0, :count],
+            _seq=self._seq,
+            _slot=slot,
+        )
+        # The scalar fields were read after the first check; make sure they belong to this frame.
+        return frame if frame.valid() else None
+
+
+def _attach(name: str) -> shared_memory.SharedMemory:
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    shm = shared_memory.SharedMemory(name=name)
+    # Before 3.13 attaching registers the segment with this process's resource
+    # tracker, which would unlink it when the reader exits. A publisher in the
+    # same process shares that registration, so leave it alone then.
+    if name not in _OWNED_SEGMENTS:
+        resource_tracker.unregister(shm._name, "shared_memory")  # noqa: SLF001
+    return shm
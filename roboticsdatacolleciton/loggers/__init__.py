@@ -1,5 +1,34 @@
 """Logging/recording utilities for detections."""
 
-from .hand_logger import HandLogWriter
+from typing import TYPE_CHECKING
 
-__all__ = ["HandLogWriter"]
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .background import OVERFLOW_POLICIES, BackgroundHandLogWriter, RecordingStats
+    from .hand_logger import FrameSummaryWriter, HandLogWriter, hand_log_schema
+    from .hand_reader import HandLogBatch, HandLogReader
+    from .merge import HandLogPart, merge_hand_logs
+
+__all__ = [
+    "OVERFLOW_POLICIES",
+    "BackgroundHandLogWriter",
+    "FrameSummaryWriter",
+    "HandLogBatch",
+    "HandLogPart",
+    "HandLogReader",
+    "HandLogWriter",
+    "RecordingStats",
+    "hand_log_schema",
+    "merge_hand_logs",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".background": ("OVERFLOW_POLICIES", "BackgroundHandLogWriter", "RecordingStats"),
+        ".hand_logger": ("FrameSummaryWriter", "HandLogWriter", "hand_log_schema"),
+        ".hand_reader": ("HandLogBatch", "HandLogReader"),
+        ".merge": ("HandLogPart", "merge_hand_logs"),
+    },
+)
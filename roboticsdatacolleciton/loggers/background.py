@@ -0,0 +1,193 @@
+"""HandLogWriter running on a background thread behind a bounded queue."""
+from __future__ import annotations
+
+import pickle
+import queue
+import tempfile
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, List, Optional, Sequence, Tuple
+
+from roboticsdatacolleciton.types import HandPosition
+
+if TYPE_CHECKING:
+    from .hand_logger import HandLogWriter
+
+OVERFLOW_POLICIES = ("block", "drop_oldest", "spill")
+
+_Record = Tuple[int, Optional[float], List[HandPosition]]
+
+
+@dataclass(slots=True)
+class RecordingStats:
+    """Queue health of a BackgroundHandLogWriter."""
+
+    frames: int = 0
+    written_frames: int = 0
+    dropped_frames: int = 0
+    spilled_frames: int = 0
+    max_queue_depth: int = 0
+    blocked_seconds: float = 0.0
+
+
+class BackgroundHandLogWriter:
+    """Records detections without doing Arrow conversion or disk IO on the caller's thread.
+
+    ``record`` only enqueues the frame; a writer thread feeds the wrapped
+    HandLogWriter, which batches rows into row groups (PyArrow and zstd
+    release the GIL while encoding and writing). When the queue is full the
+    ``overflow`` policy applies: ``block`` waits for the writer, ``drop_oldest``
+    discards the oldest queued frame, and ``spill`` appends frames to a
+    temporary file under ``spill_dir`` that the writer replays in order once
+    it catches up, so nothing is lost and the caller never waits on the
+    Parquet writer.
+    """
+
+    def __init__(
+        self,
+        writer: HandLogWriter,
+        queue_size: int = 1024,
+        overflow: str = "spill",
+        spill_dir: str | Path | None = None,
+    ) -> None:
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy {overflow!r}; expected one of {', '.join(OVERFLOW_POLICIES)}")
+        self.writer = writer
+        self.overflow = overflow
+        self.spill_dir = Path(spill_dir) if spill_dir else None
+        self.stats = RecordingStats()
+        self._queue: queue.Queue[_Record] = queue.Queue(maxsize=queue_size)
+        self._spill_lock = threading.Lock()
+        self._spill_writer: Optional[IO[bytes]] = None
+        self._spill_reader: Optional[IO[bytes]] = None
+        self._spilling = False
+        self._closing = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="hand-log-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self) -> "BackgroundHandLogWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self.close(finalize=exc_type is None)
+
+    def record(
+        self,
+        frame_index: int,
+        positions: Sequence[HandPosition],
+        captured_at: float | None = None,
+    ) -> bool:
+        """Queue one frame; returns False if the overflow policy had to drop a frame."""
+
+        if self._error is not None:
+            raise RuntimeError("Background hand log writer failed") from self._error
+        if self._closing.is_set():
+            raise RuntimeError("BackgroundHandLogWriter is closed")
+        self.stats.frames += 1
+        item: _Record = (frame_index, captured_at, list(positions))
+        if self.overflow == "spill" and self._spill(item):
+            return True
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            if self.overflow == "block":
+                started = time.perf_counter()
+                self._put_blocking(item)
+                self.stats.blocked_seconds += time.perf_counter() - started
+            elif self.overflow == "drop_oldest":
+                try:
+                    self._queue.get_nowait()
+                    self.stats.dropped_frames += 1
+                except queue.Empty:
+                    pass
+                self._queue.put_nowait(item)
+                self._update_depth()
+                return False
+            elif not self._spill(item, start=True):
+                self._put_blocking(item)
+        self._update_depth()
+        return True
+
+    def close(self, finalize: bool = True) -> None:
+        """Write everything still queued or spilled, then close the wrapped writer."""
+
+        if self._closing.is_set():
+            return
+        self._closing.set()
+        self._thread.join()
+        for handle in (self._spill_writer, self._spill_reader):
+            if handle is not None:
+                handle.close()
+        self.writer.close(finalize=finalize)
+        if self._error is not None:
+            raise RuntimeError("Background hand log writer failed") from self._error
+
+    def _put_blocking(self, item: _Record) -> None:
+        while True:
+            try:
+                self._queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                if self._error is not None:
+                    raise RuntimeError("Background hand log writer failed") from self._error
+
+    def _update_depth(self) -> None:
+        depth = self._queue.qsize()
+        if depth > self.stats.max_queue_depth:
+            self.stats.max_queue_depth = depth
+
+    def _spill(self, item: _Record, start: bool = False) -> bool:
+        # Once spilling has started every frame goes to the spill file until the
+        # writer has replayed it, so frames stay in order.
+        with self._spill_lock:
+            if not (self._spilling or start):
+                return False
+            if self._spill_writer is None:
+                if self.spill_dir:
+                    self.spill_dir.mkdir(parents=True, exist_ok=True)
+                spill = tempfile.NamedTemporaryFile(prefix="hand-log-", suffix=".spill", dir=self.spill_dir)
+                self._spill_writer = spill
+                self._spill_reader = open(spill.name, "rb")  # noqa: SIM115 - closed in close()
+            pickle.dump(item, self._spill_writer, protocol=pickle.HIGHEST_PROTOCOL)
+            self._spill_writer.flush()
+            self._spilling = True
+            self.stats.spilled_frames += 1
+            return True
+
+    def _unspill(self) -> Optional[_Record]:
+        """Next spilled frame, or None once the spill file is drained (which ends spilling)."""
+
+        with self._spill_lock:
+            if not self._spilling:
+                return None
+            if self._spill_reader.tell() < self._spill_writer.tell():
+                return pickle.load(self._spill_reader)
+            self._spill_writer.seek(0)
+            self._spill_writer.truncate()
+            self._spill_reader.seek(0)
+            self._spilling = False
+            return None
+
+    def _run(self) -> None:
+        try:
+            while True:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    # Queued frames are older than spilled ones, so the spill is replayed only once the queue is empty.
+                    item = self._unspill()
+                if item is None:
+                    if self._closing.is_set() and self._queue.empty():
+                        return
+                    try:
+                        item = self._queue.get(timeout=0.05)
+                    except queue.Empty:
+                        continue
+                frame_index, captured_at, positions = item
+                self.writer.record(frame_index, positions, captured_at=captured_at)
+                self.stats.written_frames += 1
+        except BaseException as exc:  # surfaced to the caller on the next record() or close()
+            self._error = exc
@@ -1,28 +1,143 @@
 """Columnar logging of detected hand positions."""
 from __future__ import annotations
 
+import json
+import os
+import shutil
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Sequence
-
-import json
+from typing import IO, List, Optional, Sequence
 
+import numpy as np
 import pyarrow as pa
 import pyarrow.parquet as pq
 
-from roboticsdatacolleciton.types import HandPosition
+from roboticsdatacolleciton.types import LANDMARK_NAMES, NUM_LANDMARKS, HandPosition
+
+LANDMARK_NAMES_KEY = b"landmark_names"
+MONOTONIC_EPOCH_KEY = b"monotonic_epoch"
+
+
+def hand_log_schema(timestamps: bool = False, monotonic_epoch: float | None = None) -> pa.Schema:
+    """Arrow schema of the Parquet logs written by HandLogWriter.
+
+    Landmarks are a fixed ``21 x 3`` float32 block per row in
+    ``LANDMARK_NAMES`` order; the names are stored once in the schema metadata.
+    ``carried_over`` marks rows reused from an earlier frame instead of
+    being detected on this one (see ``MotionGate``).
+
+    With ``timestamps`` a ``captured_at`` column holds each frame's capture
+    time in ``time.monotonic()`` seconds; ``monotonic_epoch`` (the Unix time
+    of monotonic zero) is stored in the metadata to convert it to wall time.
+    """
+
+    fields = [
+        ("frame_index", pa.int32()),
+        ("hand_index", pa.int16()),
+        ("label", pa.string()),
+        ("confidence", pa.float32()),
+        ("palm_normalized", pa.list_(pa.float32(), 2)),
+        ("palm_pixel", pa.list_(pa.float32(), 2)),
+        ("landmarks", pa.list_(pa.list_(pa.float32(), 3), NUM_LANDMARKS)),
+        ("carried_over", pa.bool_()),
+    ]
+    metadata = {LANDMARK_NAMES_KEY: json.dumps(LANDMARK_NAMES).encode("utf-8")}
+    if timestamps:
+        fields.append(("captured_at", pa.float64()))
+        if monotonic_epoch is not None:
+            metadata[MONOTONIC_EPOCH_KEY] = repr(monotonic_epoch).encode("ascii")
+    return pa.schema(fields, metadata=metadata)
+
+
+class FrameSummaryWriter:
+    """Streams ``{"frames": [...]}`` JSON one entry at a time.
+
+    Entries are written as they arrive, so memory stays flat no matter how
+    long the video is; the document is only valid JSON after ``close()``.
+    Passing ``offset``/``entries`` reopens a partially written summary,
+    truncating anything after ``offset`` (see ``HandLogWriter`` checkpoints).
+    """
+
+    def __init__(self, path: str | Path, offset: int | None = None, entries: int = 0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.entries = entries
+        if offset is None:
+            self._fp: Optional[IO[bytes]] = self.path.open("wb")
+            self._fp.write(b'{"frames": [')
+        else:
+            self._fp = self.path.open("r+b")
+            self._fp.truncate(offset)
+            self._fp.seek(offset)
+
+    def append(self, frame_index: int, hand_count: int, source: str | None = None) -> None:
+        if self._fp is None:
+            raise RuntimeError("FrameSummaryWriter is closed")
+        separator = "\n" if self.entries == 0 else ",\n"
+        extra = "" if source is None else f', "source": {json.dumps(source)}'
+        self._fp.write(
+            f'{separator}{{"frame_index": {frame_index}, "hand_count": {hand_count}{extra}}}'.encode("ascii")
+        )
+        self.entries += 1
+
+    def sync(self) -> int:
+        """Force written entries to disk and return the current byte offset."""
+
+        if self._fp is None:
+            raise RuntimeError("FrameSummaryWriter is closed")
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+        return self._fp.tell()
+
+    def close(self) -> None:
+        if self._fp is None:
+            return
+        self._fp.write(b"\n]}\n" if self.entries else b"]}\n")
+        self._fp.close()
+        self._fp = None
 
 
 @dataclass
 class HandLogWriter:
-    """Streams detections to a Parquet file and frame counts to JSON."""
+    """Streams detections to a Parquet file and frame counts to JSON.
+
+    Rows are buffered in preallocated column arrays and written as one row
+    group every ``row_group_size`` rows. ``use_dictionary`` accepts either a
+    bool or the column names to dictionary-encode.
+
+    With ``checkpoint_interval`` set, rows go to complete Parquet part files
+    under ``<output>.parts/`` and every ``checkpoint_interval`` frames the
+    writer commits the current part and records the last frame in
+    ``<output>.checkpoint.json``. ``resume=True`` restores that state,
+    discarding uncommitted work, and exposes the next frame to process as
+    ``resume_frame``; ``resumed`` tells whether a checkpoint was found.
+    ``close()`` stitches the parts into ``output_path``.
+
+    ``timestamps=True`` adds the ``captured_at`` column filled from
+    ``record(..., captured_at=...)``, as used for live recordings.
+    """
 
     output_path: str | Path
     summary_path: str | Path | None = None
+    row_group_size: int = 65536
+    compression: str | None = "zstd"
+    compression_level: int | None = None
+    use_dictionary: bool | Sequence[str] = ("label",)
+    checkpoint_interval: int | None = None
+    resume: bool = False
+    timestamps: bool = False
 
+    rows_written: int = field(init=False, default=0)
+    resume_frame: int = field(init=False, default=0)
+    resumed: bool = field(init=False, default=False)
     _schema: pa.Schema = field(init=False, repr=False)
     _writer: pq.ParquetWriter | None = field(init=False, default=None, repr=False)
-    _frame_counts: List[dict] = field(init=False, default_factory=list, repr=False)
+    _summary: FrameSummaryWriter | None = field(init=False, default=None, repr=False)
+    _rows: int = field(init=False, default=0, repr=False)
+    _parts: int = field(init=False, default=0, repr=False)
+    _last_frame: int | None = field(init=False, default=None, repr=False)
+    _frames_since_checkpoint: int = field(init=False, default=0, repr=False)
 
     def __post_init__(self) -> None:
         self.output_path = Path(self.output_path)
@@ -31,65 +146,208 @@ class HandLogWriter:
         self.summary_path = Path(self.summary_path)
         self.output_path.parent.mkdir(parents=True, exist_ok=True)
         self.summary_path.parent.mkdir(parents=True, exist_ok=True)
+        if self.row_group_size <= 0:
+            raise ValueError("row_group_size must be positive")
 
-        landmark_struct = pa.struct(
-            [
-                ("name", pa.string()),
-                ("x", pa.float32()),
-                ("y", pa.float32()),
-                ("z", pa.float32()),
-            ]
-        )
-        self._schema = pa.schema(
-            [
-                ("frame_index", pa.int32()),
-                ("hand_index", pa.int16()),
-                ("label", pa.string()),
-                ("confidence", pa.float32()),
-                ("palm_normalized", pa.list_(pa.float32(), 2)),
-                ("palm_pixel", pa.list_(pa.float32(), 2)),
-                ("landmarks", pa.list_(landmark_struct)),
-            ]
-        )
+        self._schema = hand_log_schema(self.timestamps, time.time() - time.monotonic() if self.timestamps else None)
+        size = self.row_group_size
+        self._frame_index = np.empty(size, dtype=np.int32)
+        self._hand_index = np.empty(size, dtype=np.int16)
+        self._labels: List[str] = []
+        self._confidence = np.empty(size, dtype=np.float32)
+        self._palm_normalized = np.empty((size, 2), dtype=np.float32)
+        self._palm_pixel = np.empty((size, 2), dtype=np.float32)
+        self._landmarks = np.empty((size, NUM_LANDMARKS, 3), dtype=np.float32)
+        self._carried_over = np.empty(size, dtype=np.bool_)
+        self._captured_at = np.empty(size, dtype=np.float64)
 
-    def record(self, frame_index: int, positions: Sequence[HandPosition]) -> None:
-        self._frame_counts.append({"frame_index": frame_index, "hand_count": len(positions)})
-        if not positions:
-            return
+        if self.resume and not self.checkpoint_interval:
+            raise ValueError("resume requires checkpoint_interval")
+        if self.resume and self.checkpoint_path.exists():
+            self._restore_checkpoint()
+        elif self.checkpoint_interval:
+            shutil.rmtree(self.parts_dir, ignore_errors=True)
+            self.checkpoint_path.unlink(missing_ok=True)
+
+    @property
+    def checkpoint_path(self) -> Path:
+        return self.output_path.with_name(f"{self.output_path.name}.checkpoint.json")
+
+    @property
+    def parts_dir(self) -> Path:
+        return self.output_path.with_name(f"{self.output_path.name}.parts")
+
+    def record(
+        self,
+        frame_index: int,
+        positions: Sequence[HandPosition],
+        carried_over: bool = False,
+        captured_at: float | None = None,
+    ) -> None:
+        if self._summary is None:
+            self._summary = FrameSummaryWriter(self.summary_path)
+        self._summary.append(frame_index, len(positions))
 
-        rows = []
         for hand_idx, position in enumerate(positions):
-            rows.append(
-                {
-                    "frame_index": frame_index,
-                    "hand_index": hand_idx,
-                    "label": position.label,
-                    "confidence": float(position.confidence),
-                    "palm_normalized": [float(position.normalized_palm[0]), float(position.normalized_palm[1])],
-                    "palm_pixel": [float(position.pixel_palm[0]), float(position.pixel_palm[1])],
-                    "landmarks": [
-                        {
-                            "name": lm.name,
-                            "x": float(lm.x),
-                            "y": float(lm.y),
-                            "z": float(lm.z) if lm.z is not None else float("nan"),
-                        }
-                        for lm in position.landmarks
-                    ],
-                }
-            )
-
-        self._write_rows(rows)
+            row = self._rows
+            self._frame_index[row] = frame_index
+            self._hand_index[row] = hand_idx
+            self._labels.append(position.label)
+            self._confidence[row] = position.confidence
+            self._palm_normalized[row] = position.normalized_palm
+            self._palm_pixel[row] = position.pixel_palm
+            self._landmarks[row] = position.landmark_array
+            self._carried_over[row] = carried_over
+            self._captured_at[row] = np.nan if captured_at is None else captured_at
+            self._rows += 1
+            if self._rows == self.row_group_size:
+                self.flush()
 
-    def close(self) -> None:
-        if self._writer:
+        self._last_frame = frame_index
+        self._frames_since_checkpoint += 1
+        if self.checkpoint_interval and self._frames_since_checkpoint >= self.checkpoint_interval:
+            self.checkpoint()
+
+    def flush(self) -> None:
+        """Write buffered rows as a single row group."""
+
+        if self._rows == 0:
+            return
+        if self._writer is None:
+            target = self._part_path(self._parts) if self.checkpoint_interval else self.output_path
+            self._writer = self._open_writer(target)
+        self._writer.write_table(self._buffered_table(), row_group_size=self._rows)
+        self.rows_written += self._rows
+        self._rows = 0
+        self._labels.clear()
+
+    def checkpoint(self) -> None:
+        """Commit everything recorded so far so a later run can resume after it."""
+
+        if not self.checkpoint_interval:
+            raise RuntimeError("HandLogWriter was created without checkpoint_interval")
+        self.flush()
+        if self._writer is not None:
             self._writer.close()
             self._writer = None
-        with self.summary_path.open("w", encoding="utf-8") as fp:
-            json.dump({"frames": self._frame_counts}, fp, indent=2)
+            self._parts += 1
+        if self._summary is None:
+            self._summary = FrameSummaryWriter(self.summary_path)
+        state = {
+            "parts": self._parts,
+            "rows_written": self.rows_written,
+            "last_frame": self._last_frame,
+            "summary_offset": self._summary.sync(),
+            "summary_entries": self._summary.entries,
+        }
+        staging = self.checkpoint_path.with_suffix(".tmp")
+        with staging.open("w", encoding="utf-8") as fp:
+            json.dump(state, fp)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(staging, self.checkpoint_path)
+        self._frames_since_checkpoint = 0
 
-    def _write_rows(self, rows: List[dict]) -> None:
-        table = pa.Table.from_pylist(rows, schema=self._schema)
-        if self._writer is None:
-            self._writer = pq.ParquetWriter(str(self.output_path), self._schema)
-        self._writer.write_table(table)
+    def close(self, finalize: bool = True) -> None:
+        """Finish the log.
+
+        In checkpoint mode ``finalize=False`` only commits a checkpoint and
+        leaves the parts in place so the run can be resumed later. A finished
+        log always exists afterwards: with no rows recorded it is an empty
+        file with the log schema, so "the log exists" means "the run ended".
+        """
+
+        self.flush()
+        if self.checkpoint_interval and not finalize:
+            self.checkpoint()
+        elif self.checkpoint_interval:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+                self._parts += 1
+            self._stitch_parts()
+        else:
+            if self._writer is None and finalize:
+                self._writer = self._open_writer(self.output_path)
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        if self._summary is None:
+            self._summary = FrameSummaryWriter(self.summary_path)
+        self._summary.close()
+
+    def _open_writer(self, path: Path) -> pq.ParquetWriter:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return pq.ParquetWriter(
+            str(path),
+            self._schema,
+            compression=self.compression or "none",
+            compression_level=self.compression_level,
+            use_dictionary=self.use_dictionary if isinstance(self.use_dictionary, bool) else list(self.use_dictionary),
+        )
+
+    def _part_path(self, index: int) -> Path:
+        return self.parts_dir / f"part-{index:05d}.parquet"
+
+    def _restore_checkpoint(self) -> None:
+        with self.checkpoint_path.open("r", encoding="utf-8") as fp:
+            state = json.load(fp)
+        self._parts = state["parts"]
+        self.rows_written = state["rows_written"]
+        self._last_frame = state["last_frame"]
+        self.resume_frame = 0 if self._last_frame is None else self._last_frame + 1
+        self.resumed = True
+        for part in self.parts_dir.glob("part-*.parquet"):
+            if int(part.stem.split("-")[1]) >= self._parts:
+                part.unlink()
+        self._summary = FrameSummaryWriter(
+            self.summary_path, offset=state["summary_offset"], entries=state["summary_entries"]
+        )
+
+    def _stitch_parts(self) -> None:
+        # Parts end at every checkpoint, so their row groups are regrouped into
+        # full ``row_group_size`` groups instead of being copied one by one.
+        writer: pq.ParquetWriter | None = None
+        pending: List[pa.RecordBatch] = []
+        pending_rows = 0
+        try:
+            for index in range(self._parts):
+                for batch in pq.ParquetFile(self._part_path(index)).iter_batches(batch_size=self.row_group_size):
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    while pending_rows >= self.row_group_size:
+                        table = pa.Table.from_batches(pending)
+                        if writer is None:
+                            writer = self._open_writer(self.output_path)
+                        writer.write_table(table.slice(0, self.row_group_size), row_group_size=self.row_group_size)
+                        rest = table.slice(self.row_group_size)
+                        pending, pending_rows = rest.to_batches(), rest.num_rows
+            if writer is None:
+                writer = self._open_writer(self.output_path)
+            if pending_rows:
+                writer.write_table(pa.Table.from_batches(pending), row_group_size=self.row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+        self.checkpoint_path.unlink(missing_ok=True)
+
+    def _buffered_table(self) -> pa.Table:
+        n = self._rows
+        landmarks = pa.FixedSizeListArray.from_arrays(
+            pa.FixedSizeListArray.from_arrays(pa.array(self._landmarks[:n].reshape(-1)), 3),
+            NUM_LANDMARKS,
+        )
+        columns = [
+            pa.array(self._frame_index[:n]),
+            pa.array(self._hand_index[:n]),
+            pa.array(self._labels, type=pa.string()),
+            pa.array(self._confidence[:n]),
+            pa.FixedSizeListArray.from_arrays(pa.array(self._palm_normalized[:n].reshape(-1)), 2),
+            pa.FixedSizeListArray.from_arrays(pa.array(self._palm_pixel[:n].reshape(-1)), 2),
+            landmarks,
+            pa.array(self._carried_over[:n]),
+        ]
+        if self.timestamps:
+            columns.append(pa.array(self._captured_at[:n]))
+        return pa.Table.from_arrays(columns, schema=self._schema)
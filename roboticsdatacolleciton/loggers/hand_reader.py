@@ -0,0 +1,315 @@
+"""Query API over Parquet logs written by HandLogWriter."""
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Collection, Iterator, List, Optional, Tuple
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from roboticsdatacolleciton.types import LANDMARK_NAMES, NUM_LANDMARKS, HandPosition
+
+from .hand_logger import LANDMARK_NAMES_KEY, MONOTONIC_EPOCH_KEY
+
+
+@dataclass(slots=True)
+class HandLogBatch:
+    """Column arrays for a contiguous set of log rows.
+
+    Numeric columns are NumPy views over Arrow buffers where possible;
+    ``landmarks`` has shape ``(rows, 21, 3)``. ``carried_over`` is all
+    False for logs written before the column existed, and ``captured_at``
+    (monotonic capture time in seconds) is NaN for logs written without
+    timestamps.
+    """
+
+    frame_index: np.ndarray
+    hand_index: np.ndarray
+    label: np.ndarray
+    confidence: np.ndarray
+    palm_normalized: np.ndarray
+    palm_pixel: np.ndarray
+    landmarks: np.ndarray
+    carried_over: np.ndarray
+    captured_at: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.frame_index)
+
+    def position(self, row: int) -> HandPosition:
+        """Rebuild the HandPosition stored in ``row``."""
+
+        palm_x, palm_y = self.palm_normalized[row].tolist()
+        pixel_x, pixel_y = self.palm_pixel[row].tolist()
+        return HandPosition(
+            label=str(self.label[row]),
+            confidence=float(self.confidence[row]),
+            normalized_palm=(palm_x, palm_y),
+            pixel_palm=(int(pixel_x), int(pixel_y)),
+            landmark_array=self.landmarks[row],
+        )
+
+
+class HandLogReader:
+    """Memory-mapped reader with row-group pruning and NumPy output.
+
+    Filters on ``frame_index`` ranges (half-open), ``label`` and a minimum
+    ``confidence`` are checked against row-group statistics first, so row
+    groups that cannot match are never decoded; surviving rows are then
+    filtered exactly. ``start_time``/``end_time`` (Unix seconds, half-open)
+    filter on ``captured_at``; logs recorded without timestamps, and rows
+    without a capture time, are not filtered by time.
+    """
+
+    def __init__(self, path: str | Path | pa.NativeFile, memory_map: bool = True) -> None:
+        # Open pyarrow files (e.g. a BufferReader over an object-store download) are read as-is.
+        if isinstance(path, pa.NativeFile):
+            self.path: Optional[Path] = None
+            self._file = pq.ParquetFile(path)
+        else:
+            self.path = Path(path)
+            self._file = pq.ParquetFile(str(self.path), memory_map=memory_map)
+        self._column_index = {
+            self._file.metadata.schema.column(idx).path: idx
+            for idx in range(self._file.metadata.num_columns)
+        }
+        metadata = self._file.schema_arrow.metadata or {}
+        names = metadata.get(LANDMARK_NAMES_KEY)
+        self.landmark_names: Tuple[str, ...] = tuple(json.loads(names)) if names else LANDMARK_NAMES
+        epoch = metadata.get(MONOTONIC_EPOCH_KEY)
+        # Unix time of ``captured_at == 0``; None for logs without timestamps.
+        self.monotonic_epoch: Optional[float] = float(epoch) if epoch else None
+
+    def __enter__(self) -> "HandLogReader":
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self.close()
+
+    @property
+    def num_rows(self) -> int:
+        return self._file.metadata.num_rows
+
+    @property
+    def num_row_groups(self) -> int:
+        return self._file.num_row_groups
+
+    def frame_range(self) -> Optional[Tuple[int, int]]:
+        """Smallest and largest ``frame_index`` in the log, or None if it has no rows."""
+
+        if self.num_rows == 0:
+            return None
+        bounds = [self._stats(group, "frame_index") for group in range(self.num_row_groups)]
+        if all(low is not None and high is not None for low, high in bounds):
+            return int(min(low for low, _ in bounds)), int(max(high for _, high in bounds))
+        extremes = pc.min_max(self._file.read(columns=["frame_index"]).column("frame_index"))
+        return int(extremes["min"].as_py()), int(extremes["max"].as_py())
+
+    def row_groups_for(
+        self,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+        labels: Optional[Collection[str]] = None,
+        min_confidence: Optional[float] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> List[int]:
+        """Indices of row groups whose statistics allow a match."""
+
+        captured_from, captured_to = self._captured_bounds(start_time, end_time)
+        selected = []
+        for group in range(self.num_row_groups):
+            frame_min, frame_max = self._stats(group, "frame_index")
+            if start_frame is not None and frame_max is not None and frame_max < start_frame:
+                continue
+            if end_frame is not None and frame_min is not None and frame_min >= end_frame:
+                continue
+            if min_confidence is not None:
+                _, confidence_max = self._stats(group, "confidence")
+                if confidence_max is not None and confidence_max < min_confidence:
+                    continue
+            if labels is not None:
+                label_min, label_max = self._stats(group, "label")
+                if label_min is not None and label_max is not None and not any(
+                    label_min <= label <= label_max for label in labels
+                ):
+                    continue
+            # Rows without a capture time are never filtered by time, so groups holding any are kept.
+            if (captured_from is not None or captured_to is not None) and not self._null_count(group, "captured_at"):
+                captured_min, captured_max = self._stats(group, "captured_at")
+                if captured_from is not None and captured_max is not None and captured_max < captured_from:
+                    continue
+                if captured_to is not None and captured_min is not None and captured_min >= captured_to:
+                    continue
+            selected.append(group)
+        return selected
+
+    def iter_batches(
+        self,
+        batch_size: int = 65536,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+        labels: Optional[Collection[str]] = None,
+        min_confidence: Optional[float] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> Iterator[HandLogBatch]:
+        """Stream matching rows without loading the whole log into memory."""
+
+        row_groups = self.row_groups_for(start_frame, end_frame, labels, min_confidence, start_time, end_time)
+        if not row_groups:
+            return
+        captured_from, captured_to = self._captured_bounds(start_time, end_time)
+        for record_batch in self._file.iter_batches(batch_size=batch_size, row_groups=row_groups):
+            record_batch = self._filter(
+                record_batch, start_frame, end_frame, labels, min_confidence, captured_from, captured_to
+            )
+            if record_batch.num_rows:
+                yield self._to_numpy(record_batch)
+
+    def read(
+        self,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+        labels: Optional[Collection[str]] = None,
+        min_confidence: Optional[float] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> HandLogBatch:
+        """Read every matching row into a single batch."""
+
+        row_groups = self.row_groups_for(start_frame, end_frame, labels, min_confidence, start_time, end_time)
+        table = self._file.read_row_groups(row_groups) if row_groups else self._file.schema_arrow.empty_table()
+        captured_from, captured_to = self._captured_bounds(start_time, end_time)
+        table = self._filter(table, start_frame, end_frame, labels, min_confidence, captured_from, captured_to)
+        batches = table.combine_chunks().to_batches()
+        if not batches:
+            return self._to_numpy(pa.RecordBatch.from_pylist([], schema=table.schema))
+        return self._to_numpy(batches[0])
+
+    def iter_frames(
+        self,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+    ) -> Iterator[Tuple[int, List[HandPosition]]]:
+        """Yield ``(frame_index, positions)`` for every frame that has detections."""
+
+        current_frame: Optional[int] = None
+        positions: List[HandPosition] = []
+        for batch in self.iter_batches(start_frame=start_frame, end_frame=end_frame):
+            for row, frame_index in enumerate(batch.frame_index.tolist()):
+                if frame_index != current_frame:
+                    if current_frame is not None:
+                        yield current_frame, positions
+                    current_frame, positions = frame_index, []
+                positions.append(batch.position(row))
+        if current_frame is not None:
+            yield current_frame, positions
+
+    def close(self) -> None:
+        self._file.close()
+
+    def _stats(self, group: int, column: str) -> Tuple[object, object]:
+        index = self._column_index.get(column)
+        if index is None:
+            return None, None
+        statistics = self._file.metadata.row_group(group).column(index).statistics
+        if statistics is None or not statistics.has_min_max:
+            return None, None
+        return statistics.min, statistics.max
+
+    def _null_count(self, group: int, column: str) -> Optional[int]:
+        index = self._column_index.get(column)
+        if index is None:
+            return None
+        statistics = self._file.metadata.row_group(group).column(index).statistics
+        return None if statistics is None or not statistics.has_null_count else statistics.null_count
+
+    def _captured_bounds(
+        self, start_time: Optional[float], end_time: Optional[float]
+    ) -> Tuple[Optional[float], Optional[float]]:
+        """Unix time bounds as ``captured_at`` values; (None, None) for logs without timestamps."""
+
+        if self.monotonic_epoch is None or "captured_at" not in self._column_index:
+            return None, None
+        return (
+            None if start_time is None else start_time - self.monotonic_epoch,
+            None if end_time is None else end_time - self.monotonic_epoch,
+        )
+
+    @staticmethod
+    def _filter(
+        data: pa.RecordBatch | pa.Table,
+        start_frame: Optional[int],
+        end_frame: Optional[int],
+        labels: Optional[Collection[str]],
+        min_confidence: Optional[float],
+        captured_from: Optional[float] = None,
+        captured_to: Optional[float] = None,
+    ) -> pa.RecordBatch | pa.Table:
+        masks = []
+        if start_frame is not None:
+            masks.append(pc.greater_equal(data.column("frame_index"), start_frame))
+        if end_frame is not None:
+            masks.append(pc.less(data.column("frame_index"), end_frame))
+        if labels is not None:
+            masks.append(pc.is_in(data.column("label"), value_set=pa.array(list(labels), type=pa.string())))
+        if min_confidence is not None:
+            masks.append(pc.greater_equal(data.column("confidence"), min_confidence))
+        if captured_from is not None:
+            masks.append(pc.fill_null(pc.greater_equal(data.column("captured_at"), captured_from), True))
+        if captured_to is not None:
+            masks.append(pc.fill_null(pc.less(data.column("captured_at"), captured_to), True))
+        if not masks:
+            return data
+        mask = masks[0]
+        for extra in masks[1:]:
+            mask = pc.and_(mask, extra)
+        return data.filter(mask)
+
+    @staticmethod
+    def _to_numpy(batch: pa.RecordBatch) -> HandLogBatch:
+        rows = batch.num_rows
+        return HandLogBatch(
+            frame_index=batch.column("frame_index").to_numpy(),
+            hand_index=batch.column("hand_index").to_numpy(),
+            label=batch.column("label").to_numpy(zero_copy_only=False),
+            confidence=batch.column("confidence").to_numpy(),
+            palm_normalized=_fixed_list_values(batch.column("palm_normalized")).reshape(rows, 2),
+            palm_pixel=_fixed_list_values(batch.column("palm_pixel")).reshape(rows, 2),
+            landmarks=_landmark_values(batch.column("landmarks")).reshape(rows, NUM_LANDMARKS, 3),
+            carried_over=(
+                batch.column("carried_over").to_numpy(zero_copy_only=False)
+                if "carried_over" in batch.schema.names
+                else np.zeros(rows, dtype=np.bool_)
+            ),
+            captured_at=(
+                batch.column("captured_at").to_numpy(zero_copy_only=False)
+                if "captured_at" in batch.schema.names
+                else np.full(rows, np.nan)
+            ),
+        )
+
+
+def _fixed_list_values(array: pa.Array) -> np.ndarray:
+    """Flat float32 values of a (possibly nested) fixed-size list array, zero-copy."""
+
+    while pa.types.is_fixed_size_list(array.type):
+        array = array.flatten()
+    return array.to_numpy(zero_copy_only=True)
+
+
+def _landmark_values(array: pa.Array) -> np.ndarray:
+    if pa.types.is_fixed_size_list(array.type):
+        return _fixed_list_values(array)
+    # Logs written before landmarks became fixed-size lists store
+    # list<struct<name, x, y, z>>; those have to be copied out field by field.
+    structs = array.flatten()
+    return np.stack(
+        [structs.field(axis).to_numpy(zero_copy_only=False) for axis in ("x", "y", "z")],
+        axis=-1,
+    ).astype(np.float32, copy=False)
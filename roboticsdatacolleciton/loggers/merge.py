@@ -0,0 +1,133 @@
+"""Helpers for combining several HandLogWriter outputs into one log."""
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from .hand_logger import FrameSummaryWriter, hand_log_schema
+
+
+@dataclass(slots=True)
+class HandLogPart:
+    """One log to merge, optionally clipped to a half-open frame range."""
+
+    log_path: Path
+    summary_path: Optional[Path] = None
+    start_frame: int = 0
+    end_frame: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        self.log_path = Path(self.log_path)
+        if self.summary_path is None:
+            self.summary_path = self.log_path.with_suffix(".summary.json")
+        self.summary_path = Path(self.summary_path)
+
+    def contains(self, frame_index: int) -> bool:
+        if frame_index < self.start_frame:
+            return False
+        return self.end_frame is None or frame_index < self.end_frame
+
+
+def merge_hand_logs(
+    parts: Sequence[HandLogPart],
+    output_path: str | Path,
+    summary_path: str | Path | None = None,
+    compression: str | None = "zstd",
+    row_group_size: int = 65536,
+) -> int:
+    """Concatenate logs in the given order.
+
+    Parts are expected to be frame-ordered and non-overlapping once clipped, so
+    the merged log stays ordered by ``frame_index``. Rows outside each part's
+    frame range are dropped, which is how warm-up frames of overlapping shards
+    are discarded. Shards end wherever the video was split, so their rows are
+    regrouped into full ``row_group_size`` groups. The log and summary are
+    written under ``.partial`` names and moved into place once complete; if
+    no part has rows the log is still written, empty. Returns the number of
+    rows written.
+    """
+
+    output_path = Path(output_path)
+    summary_path = Path(summary_path) if summary_path else output_path.with_suffix(".summary.json")
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    summary_path.parent.mkdir(parents=True, exist_ok=True)
+    partial_log, partial_summary = _partial_path(output_path), _partial_path(summary_path)
+
+    schema: pa.Schema | None = None
+    writer: pq.ParquetWriter | None = None
+    pending: List[pa.RecordBatch] = []
+    pending_rows = 0
+    rows = 0
+
+    def open_writer() -> pq.ParquetWriter:
+        return pq.ParquetWriter(
+            str(partial_log),
+            schema if schema is not None else hand_log_schema(),
+            compression=compression or "none",
+            use_dictionary=["label"],
+        )
+
+    try:
+        try:
+            for part in parts:
+                if not part.log_path.exists():
+                    continue
+                parquet_file = pq.ParquetFile(part.log_path)
+                if schema is None:
+                    schema = parquet_file.schema_arrow
+                for batch in parquet_file.iter_batches(batch_size=row_group_size):
+                    frame_index = batch.column("frame_index")
+                    mask = pc.greater_equal(frame_index, part.start_frame)
+                    if part.end_frame is not None:
+                        mask = pc.and_(mask, pc.less(frame_index, part.end_frame))
+                    batch = batch.filter(mask)
+                    if batch.num_rows == 0:
+                        continue
+                    pending.append(batch)
+                    pending_rows += batch.num_rows
+                    rows += batch.num_rows
+                    while pending_rows >= row_group_size:
+                        table = pa.Table.from_batches(pending)
+                        if writer is None:
+                            writer = open_writer()
+                        writer.write_table(table.slice(0, row_group_size), row_group_size=row_group_size)
+                        rest = table.slice(row_group_size)
+                        pending, pending_rows = rest.to_batches(), rest.num_rows
+            if writer is None:
+                writer = open_writer()
+            if pending_rows:
+                writer.write_table(pa.Table.from_batches(pending), row_group_size=row_group_size)
+        finally:
+            if writer is not None:
+                writer.close()
+
+        summary = FrameSummaryWriter(partial_summary)
+        try:
+            for part in parts:
+                if not part.summary_path.exists():
+                    continue
+                with part.summary_path.open("r", encoding="utf-8") as fp:
+                    for entry in json.load(fp)["frames"]:
+                        if part.contains(entry["frame_index"]):
+                            summary.append(entry["frame_index"], entry["hand_count"])
+        finally:
+            summary.close()
+    except BaseException:
+        partial_log.unlink(missing_ok=True)
+        partial_summary.unlink(missing_ok=True)
+        raise
+    # Summary first: a log at output_path always has its summary next to it.
+    os.replace(partial_summary, summary_path)
+    os.replace(partial_log, output_path)
+    return rows
+
+
+def _partial_path(path: Path) -> Path:
+    return path.with_name(f".{path.stem}.partial{path.suffix}")
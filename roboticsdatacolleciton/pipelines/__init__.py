@@ -1,6 +1,74 @@
 """Pipelines orchestrate detectors, IO, and future processors."""
 
-from .realtime import RealTimeHandTrackingPipeline
-from .video_batch import VideoProcessingPipeline
+from typing import TYPE_CHECKING
 
-__all__ = ["RealTimeHandTrackingPipeline", "VideoProcessingPipeline"]
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .aio import (
+        BACKPRESSURE_POLICIES,
+        AsyncHandTracker,
+        CallableSink,
+        FrameSink,
+        HandLogSink,
+        SinkFanOut,
+        SinkStats,
+        TrackedFrame,
+    )
+    from .multi_camera import (
+        CameraResult,
+        CameraStats,
+        MultiCameraFrame,
+        MultiCameraPipeline,
+        MultiCameraStats,
+        TimestampAligner,
+    )
+    from .realtime import RealtimeStats, RealTimeHandTrackingPipeline
+    from .video_batch import VideoProcessingPipeline, VideoProcessingStats
+
+__all__ = [
+    "BACKPRESSURE_POLICIES",
+    "AsyncHandTracker",
+    "CallableSink",
+    "CameraResult",
+    "CameraStats",
+    "FrameSink",
+    "HandLogSink",
+    "MultiCameraFrame",
+    "MultiCameraPipeline",
+    "MultiCameraStats",
+    "RealTimeHandTrackingPipeline",
+    "RealtimeStats",
+    "SinkFanOut",
+    "SinkStats",
+    "TimestampAligner",
+    "TrackedFrame",
+    "VideoProcessingPipeline",
+    "VideoProcessingStats",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".aio": (
+            "BACKPRESSURE_POLICIES",
+            "AsyncHandTracker",
+            "CallableSink",
+            "FrameSink",
+            "HandLogSink",
+            "SinkFanOut",
+            "SinkStats",
+            "TrackedFrame",
+        ),
+        ".multi_camera": (
+            "CameraResult",
+            "CameraStats",
+            "MultiCameraFrame",
+            "MultiCameraPipeline",
+            "MultiCameraStats",
+            "TimestampAligner",
+        ),
+        ".realtime": ("RealtimeStats", "RealTimeHandTrackingPipeline"),
+        ".video_batch": ("VideoProcessingPipeline", "VideoProcessingStats"),
+    },
+)
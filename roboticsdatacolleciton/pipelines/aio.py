@@ -0,0 +1,276 @@
+"""Asyncio interface to hand tracking with fan-out to independent sinks."""
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, Dict, Iterator, List, NamedTuple, Optional, Protocol, Tuple
+
+import numpy as np
+
+from roboticsdatacolleciton.detection import HandDetector
+from roboticsdatacolleciton.loggers import HandLogWriter
+from roboticsdatacolleciton.types import HandPosition
+from roboticsdatacolleciton.video import CameraStream, VideoFileStream
+
+BACKPRESSURE_POLICIES = ("block", "drop_oldest", "drop_newest")
+_END = object()
+
+
+class TrackedFrame(NamedTuple):
+    """Detections for one frame.
+
+    ``timestamp`` is the ``time.monotonic()`` capture time for cameras and
+    the position in seconds (``frame_index / fps``) for video files.
+    """
+
+    frame_index: int
+    timestamp: float
+    positions: List[HandPosition]
+
+
+class FrameSink(Protocol):
+    """Consumer of tracked frames; ``send`` may be slow without stalling detection."""
+
+    async def send(self, frame: TrackedFrame) -> None:
+        ...
+
+    async def close(self) -> None:
+        ...
+
+
+class CallableSink:
+    """Adapts a plain callable (sync or async) such as ``console_output`` into a sink.
+
+    Synchronous callables run in a worker thread so they never block the
+    event loop. ``close_fn`` is called once when the fan-out shuts down.
+    """
+
+    def __init__(
+        self,
+        fn: Callable[[TrackedFrame], object],
+        close_fn: Optional[Callable[[], object]] = None,
+    ) -> None:
+        self.fn = fn
+        self.close_fn = close_fn
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sink")
+
+    async def send(self, frame: TrackedFrame) -> None:
+        await self._call(self.fn, frame)
+
+    async def close(self) -> None:
+        try:
+            if self.close_fn is not None:
+                await self._call(self.close_fn)
+        finally:
+            self._executor.shutdown(wait=False)
+
+    async def _call(self, fn: Callable, *args) -> None:  # noqa: ANN002
+        if inspect.iscoroutinefunction(fn):
+            await fn(*args)
+        else:
+            await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+
+class HandLogSink(CallableSink):
+    """Records every frame into a HandLogWriter on a background thread."""
+
+    def __init__(self, writer: HandLogWriter) -> None:
+        super().__init__(
+            lambda frame: writer.record(frame.frame_index, frame.positions),
+            close_fn=writer.close,
+        )
+        self.writer = writer
+
+
+@dataclass(slots=True)
+class SinkStats:
+    """Per-sink delivery counters; ``error`` is set once the sink has failed."""
+
+    name: str
+    delivered: int = 0
+    dropped: int = 0
+    max_queue_depth: int = 0
+    error: Optional[str] = None
+
+
+class SinkFanOut:
+    """Delivers each published frame to every sink through its own bounded queue.
+
+    Each sink runs in its own task, so a slow sink only fills its own queue.
+    When a queue is full the sink's policy decides: ``block`` makes
+    ``publish`` wait (backpressure on the producer), ``drop_oldest``
+    discards the oldest queued frame and ``drop_newest`` discards the
+    incoming one. A sink that raises is disabled and its error recorded;
+    the others keep running.
+    """
+
+    def __init__(
+        self,
+        sinks: Dict[str, FrameSink],
+        queue_size: int = 64,
+        policy: str = "drop_oldest",
+        policies: Optional[Dict[str, str]] = None,
+    ) -> None:
+        policies = {name: (policies or {}).get(name, policy) for name in sinks}
+        for name, sink_policy in policies.items():
+            if sink_policy not in BACKPRESSURE_POLICIES:
+                raise ValueError(
+                    f"Unknown backpressure policy {sink_policy!r} for sink {name!r}; "
+                    f"expected one of {', '.join(BACKPRESSURE_POLICIES)}"
+                )
+        self.sinks = dict(sinks)
+        self.policies = policies
+        self.queue_size = queue_size
+        self.stats = {name: SinkStats(name) for name in self.sinks}
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._tasks: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> "SinkFanOut":
+        self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        await self.close()
+
+    def start(self) -> None:
+        for name, sink in self.sinks.items():
+            self._queues[name] = asyncio.Queue(maxsize=self.queue_size)
+            self._tasks.append(asyncio.create_task(self._drain(name, sink), name=f"sink-{name}"))
+
+    async def publish(self, frame: TrackedFrame) -> None:
+        for name, frames in self._queues.items():
+            stats = self.stats[name]
+            if stats.error is not None:
+                continue
+            if frames.full():
+                policy = self.policies[name]
+                if policy == "drop_newest":
+                    stats.dropped += 1
+                    continue
+                if policy == "drop_oldest":
+                    frames.get_nowait()
+                    frames.task_done()
+                    stats.dropped += 1
+            await frames.put(frame)
+            stats.max_queue_depth = max(stats.max_queue_depth, frames.qsize())
+
+    async def close(self) -> None:
+        """Deliver whatever is queued, then close every sink."""
+
+        for frames in self._queues.values():
+            await frames.put(_END)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+
+    async def _drain(self, name: str, sink: FrameSink) -> None:
+        frames = self._queues[name]
+        stats = self.stats[name]
+        try:
+            while True:
+                frame = await frames.get()
+                frames.task_done()
+                if frame is _END:
+                    return
+                if stats.error is not None:
+                    continue
+                try:
+                    await sink.send(frame)
+                    stats.delivered += 1
+                except Exception as exc:  # one broken sink must not take down the others
+                    stats.error = repr(exc)
+        finally:
+            try:
+                await sink.close()
+            except Exception as exc:
+                stats.error = stats.error or repr(exc)
+
+
+class AsyncHandTracker:
+    """Async iterator of TrackedFrame over a camera or video file.
+
+    Capture and inference each run on a dedicated worker thread; the next
+    frame is captured while the current one is being detected, and the event
+    loop stays free for other work. ``run`` fans the frames out to sinks.
+
+    The source and detector are released when iteration ends. A loop that
+    breaks out early (or raises) leaves the generator suspended until it is
+    garbage collected, so iterate ``contextlib.aclosing(tracker.frames())``
+    to release the camera as soon as the loop exits.
+    """
+
+    def __init__(
+        self,
+        source: CameraStream | VideoFileStream,
+        detector: HandDetector,
+        close_detector: bool = True,
+    ) -> None:
+        self.source = source
+        self.detector = detector
+        self.close_detector = close_detector
+
+    def __aiter__(self) -> AsyncIterator[TrackedFrame]:
+        return self.frames()
+
+    async def frames(self) -> AsyncIterator[TrackedFrame]:
+        loop = asyncio.get_running_loop()
+        capture_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capture")
+        detect_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="detect")
+        source = self.source
+        pending: Optional[Awaitable] = None
+        items: Optional[Iterator[Tuple[int, float, np.ndarray]]] = None
+        try:
+            await loop.run_in_executor(capture_pool, source.__enter__)
+            try:
+                items = await loop.run_in_executor(capture_pool, self._items)
+                pending = loop.run_in_executor(capture_pool, next, items, _END)
+                while True:
+                    item = await pending
+                    pending = None
+                    if item is _END:
+                        break
+                    frame_index, timestamp, frame = item
+                    # Capture the next frame while this one is being detected.
+                    pending = loop.run_in_executor(capture_pool, next, items, _END)
+                    positions = await loop.run_in_executor(detect_pool, self.detector.detect, frame)
+                    source.release(frame)
+                    yield TrackedFrame(frame_index, timestamp, positions)
+            finally:
+                if pending is not None:
+                    await asyncio.gather(pending, return_exceptions=True)
+                if items is not None:
+                    await loop.run_in_executor(capture_pool, items.close)
+                await loop.run_in_executor(capture_pool, source.__exit__, None, None, None)
+        finally:
+            if self.close_detector:
+                await loop.run_in_executor(detect_pool, self.detector.close)
+            capture_pool.shutdown(wait=False)
+            detect_pool.shutdown(wait=False)
+
+    async def run(
+        self,
+        sinks: Dict[str, FrameSink],
+        queue_size: int = 64,
+        policy: str = "drop_oldest",
+        policies: Optional[Dict[str, str]] = None,
+    ) -> Dict[str, SinkStats]:
+        """Track until the source ends and deliver every frame to ``sinks``."""
+
+        async with SinkFanOut(sinks, queue_size=queue_size, policy=policy, policies=policies) as fanout:
+            # Closes the source right away if publishing fails or the task is cancelled.
+            async with contextlib.aclosing(self.frames()) as frames:
+                async for frame in frames:
+                    await fanout.publish(frame)
+        return fanout.stats
+
+    def _items(self) -> Iterator[Tuple[int, float, np.ndarray]]:
+        if isinstance(self.source, VideoFileStream):
+            fps = self.source.fps or 30.0
+            return ((index, index / fps, frame) for index, frame in self.source.frames())
+        return (
+            (index, captured_at, frame)
+            for index, (captured_at, frame) in enumerate(self.source.timestamped_frames())
+        )
+
@@ -0,0 +1,350 @@
+"""Parallel multi-camera hand tracking with capture-timestamp alignment."""
+from __future__ import annotations
+
+import multiprocessing
+import queue
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, List, Optional, Sequence
+
+from roboticsdatacolleciton.config import MultiCameraConfig
+from roboticsdatacolleciton.detection import create_hand_detector
+from roboticsdatacolleciton.types import HandPosition
+from roboticsdatacolleciton.video import CameraStream, FileCameraStream
+
+from .realtime import RealtimeStats
+
+
+@dataclass(slots=True)
+class CameraResult:
+    """Detections for one frame of one camera."""
+
+    camera: str
+    frame_index: int
+    captured_at: float
+    latency_ms: float
+    dropped_frames: int
+    positions: List[HandPosition]
+
+
+@dataclass(slots=True)
+class MultiCameraFrame:
+    """Results from all cameras captured within the sync tolerance of ``timestamp``.
+
+    Cameras without a frame inside the tolerance window map to None.
+    """
+
+    timestamp: float
+    results: Dict[str, Optional[CameraResult]]
+
+    @property
+    def complete(self) -> bool:
+        return all(result is not None for result in self.results.values())
+
+    @property
+    def skew_ms(self) -> float:
+        """Spread between the earliest and latest capture time in the group."""
+
+        stamps = [result.captured_at for result in self.results.values() if result is not None]
+        return (max(stamps) - min(stamps)) * 1000.0 if stamps else 0.0
+
+
+@dataclass(slots=True)
+class CameraStats:
+    """Throughput, drops and capture-to-detection latency for one camera."""
+
+    name: str
+    latency: RealtimeStats = field(default_factory=RealtimeStats)
+    dropped_frames: int = 0
+    first_capture: Optional[float] = None
+    last_capture: Optional[float] = None
+    error: Optional[str] = None
+
+    @property
+    def frames(self) -> int:
+        return self.latency.frames
+
+    @property
+    def fps(self) -> float:
+        if self.first_capture is None or self.last_capture is None or self.frames < 2:
+            return 0.0
+        span = self.last_capture - self.first_capture
+        return (self.frames - 1) / span if span > 0 else 0.0
+
+    def add(self, result: CameraResult) -> None:
+        self.latency.add(result.latency_ms)
+        self.dropped_frames = result.dropped_frames
+        if self.first_capture is None:
+            self.first_capture = result.captured_at
+        self.last_capture = result.captured_at
+
+
+@dataclass(slots=True)
+class MultiCameraStats:
+    cameras: Dict[str, CameraStats]
+    merged_frames: int = 0
+    complete_frames: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class TimestampAligner:
+    """Groups per-camera results whose capture times fall within ``tolerance``.
+
+    The oldest pending result anchors each group. A camera joins the group
+    with its oldest pending result if that was captured no later than
+    ``anchor + tolerance``; a camera whose next result is later, that has
+    finished, or that has not delivered anything for ``max_wait`` seconds
+    past the anchor is reported as missing. Times are in seconds on the
+    ``time.monotonic()`` clock, which all worker processes share.
+    """
+
+    def __init__(self, cameras: Sequence[str], tolerance: float, max_wait: float) -> None:
+        self.tolerance = tolerance
+        self.max_wait = max_wait
+        self._pending: Dict[str, Deque[CameraResult]] = {name: deque() for name in cameras}
+        self._finished: set[str] = set()
+
+    def push(self, result: CameraResult) -> None:
+        self._pending[result.camera].append(result)
+
+    def finish(self, camera: str) -> None:
+        self._finished.add(camera)
+
+    def pop_ready(self, now: float) -> List[MultiCameraFrame]:
+        return self._pop(now, flush=False)
+
+    def drain(self) -> List[MultiCameraFrame]:
+        """Group everything still pending, without waiting for more results."""
+
+        return self._pop(0.0, flush=True)
+
+    def _pop(self, now: float, flush: bool) -> List[MultiCameraFrame]:
+        ready: List[MultiCameraFrame] = []
+        while True:
+            heads = [pending[0].captured_at for pending in self._pending.values() if pending]
+            if not heads:
+                return ready
+            anchor = min(heads)
+            waiting = not flush and now - anchor < self.max_wait
+            matched: List[str] = []
+            for name, pending in self._pending.items():
+                if pending and pending[0].captured_at <= anchor + self.tolerance:
+                    matched.append(name)
+                elif not pending and waiting and name not in self._finished:
+                    return ready
+            ready.append(
+                MultiCameraFrame(
+                    timestamp=anchor,
+                    results={
+                        name: pending.popleft() if name in matched else None
+                        for name, pending in self._pending.items()
+                    },
+                )
+            )
+
+
+class MultiCameraPipeline:
+    """Runs one capture-and-detection process per camera and merges the results.
+
+    Each source in ``config.sources`` gets its own spawned worker with its
+    own detector, so cameras never wait on each other. Workers stream
+    CameraResult items back over a bounded queue; this process aligns them
+    with TimestampAligner and passes each MultiCameraFrame to ``output_fn``.
+    Integer sources are camera devices and strings are video files played
+    back through FileCameraStream.
+    """
+
+    def __init__(
+        self,
+        config: MultiCameraConfig,
+        output_fn: Callable[[MultiCameraFrame], None],
+        queue_size: int = 256,
+    ) -> None:
+        if not config.sources:
+            raise ValueError("MultiCameraPipeline needs at least one camera source")
+        self.config = config
+        self.output_fn = output_fn
+        self.queue_size = queue_size
+        self.camera_names = [f"cam{idx}" for idx in range(len(config.sources))]
+        self.stats = MultiCameraStats(cameras={name: CameraStats(name) for name in self.camera_names})
+
+    def run(self, duration: Optional[float] = None) -> MultiCameraStats:
+        """Track hands until every camera ends, ``duration`` elapses or Ctrl+C."""
+
+        self.stats = MultiCameraStats(cameras={name: CameraStats(name) for name in self.camera_names})
+        aligner = TimestampAligner(
+            self.camera_names,
+            tolerance=self.config.sync_tolerance_ms / 1000.0,
+            max_wait=self.config.max_wait_ms / 1000.0,
+        )
+        # MediaPipe graphs are not fork-safe, so always start clean interpreters.
+        context = multiprocessing.get_context("spawn")
+        results = context.Queue(maxsize=self.queue_size)
+        go = context.Event()
+        stop = context.Event()
+        workers = [
+            context.Process(
+                target=_camera_worker,
+                args=(name, source, self._camera_kwargs(source), self._detector_kwargs(), results, go, stop),
+                name=f"camera-{name}",
+                daemon=True,
+            )
+            for name, source in zip(self.camera_names, self.config.sources)
+        ]
+        for worker in workers:
+            worker.start()
+
+        running = set(self.camera_names)
+        waiting_ready = set(self.camera_names)
+        started = time.monotonic()
+        try:
+            while running:
+                if duration is not None and go.is_set() and time.monotonic() - started >= duration:
+                    break
+                try:
+                    item = results.get(timeout=0.05)
+                except queue.Empty:
+                    item = None
+                if isinstance(item, _CameraReady):
+                    waiting_ready.discard(item.camera)
+                elif isinstance(item, _CameraDone):
+                    running.discard(item.camera)
+                    waiting_ready.discard(item.camera)
+                    aligner.finish(item.camera)
+                    self.stats.cameras[item.camera].error = item.error
+                elif item is not None:
+                    self.stats.cameras[item.camera].add(item)
+                    aligner.push(item)
+                if not waiting_ready and not go.is_set():
+                    # Start every camera together once all detectors are loaded.
+                    go.set()
+                    started = time.monotonic()
+                for frame in aligner.pop_ready(time.monotonic()):
+                    self._emit(frame)
+        except KeyboardInterrupt:
+            print("\nStopping multi-camera tracking...")
+        finally:
+            stop.set()
+            go.set()
+            self._join(workers, results, aligner)
+        self.stats.elapsed_seconds = time.monotonic() - started
+        return self.stats
+
+    def _emit(self, frame: MultiCameraFrame) -> None:
+        self.stats.merged_frames += 1
+        if frame.complete:
+            self.stats.complete_frames += 1
+        self.output_fn(frame)
+
+    def _join(self, workers: List[multiprocessing.Process], results, aligner: TimestampAligner) -> None:  # noqa: ANN001
+        # Keep draining so workers blocked on a full queue can see ``stop`` and exit.
+        while any(worker.is_alive() for worker in workers):
+            try:
+                self._absorb(results.get(timeout=0.05), aligner)
+            except queue.Empty:
+                continue
+        for worker in workers:
+            worker.join()
+        # Results a worker queued right before exiting are still in the queue.
+        while True:
+            try:
+                self._absorb(results.get_nowait(), aligner)
+            except queue.Empty:
+                break
+        for frame in aligner.drain():
+            self._emit(frame)
+
+    def _absorb(self, item: object, aligner: TimestampAligner) -> None:
+        if isinstance(item, CameraResult):
+            self.stats.cameras[item.camera].add(item)
+            aligner.push(item)
+        elif isinstance(item, _CameraDone):
+            aligner.finish(item.camera)
+            if item.error:
+                self.stats.cameras[item.camera].error = item.error
+
+    def _camera_kwargs(self, source: int | str) -> dict:
+        kwargs = {
+            "frame_width": self.config.frame_width,
+            "frame_height": self.config.frame_height,
+            "latest_frame_only": self.config.latest_frame_only,
+        }
+        if isinstance(source, str):
+            kwargs.update(path=source, loop=self.config.loop_files)
+        else:
+            kwargs.update(device_index=source)
+        return kwargs
+
+    def _detector_kwargs(self) -> dict:
+        return {
+            "backend": self.config.detector_backend,
+            "model_path": self.config.model_path,
+            "model_complexity": self.config.model_complexity,
+            "max_num_hands": self.config.max_num_hands,
+            "min_detection_confidence": self.config.min_detection_confidence,
+            "min_tracking_confidence": self.config.min_tracking_confidence,
+        }
+
+
+@dataclass(slots=True)
+class _CameraReady:
+    camera: str
+
+
+@dataclass(slots=True)
+class _CameraDone:
+    camera: str
+    error: Optional[str] = None
+
+
+def _camera_worker(
+    name: str,
+    source: int | str,
+    camera_kwargs: dict,
+    detector_kwargs: dict,
+    results,  # noqa: ANN001 - multiprocessing queue
+    go,  # noqa: ANN001 - multiprocessing event
+    stop,  # noqa: ANN001 - multiprocessing event
+) -> None:
+    error = None
+    try:
+        camera = FileCameraStream(**camera_kwargs) if isinstance(source, str) else CameraStream(**camera_kwargs)
+        detector = create_hand_detector(running_mode="video", **detector_kwargs)
+        try:
+            detector.warm_up()
+            _put(results, _CameraReady(name), stop)
+            while not go.wait(0.1):
+                if stop.is_set():
+                    return
+            with camera:
+                for frame_index, (captured_at, frame) in enumerate(camera.timestamped_frames()):
+                    if stop.is_set():
+                        break
+                    positions = detector.detect(frame)
+                    camera.release(frame)
+                    result = CameraResult(
+                        camera=name,
+                        frame_index=frame_index,
+                        captured_at=captured_at,
+                        latency_ms=(time.monotonic() - captured_at) * 1000.0,
+                        dropped_frames=camera.stats.dropped_frames,
+                        positions=positions,
+                    )
+                    if not _put(results, result, stop):
+                        break
+        finally:
+            detector.close()
+    except Exception as exc:  # reported to the parent instead of killing the pipeline
+        error = repr(exc)
+    _put(results, _CameraDone(name, error), stop)
+
+
+def _put(results, item, stop) -> bool:  # noqa: ANN001
+    while True:
+        try:
+            results.put(item, timeout=0.1)
+            return True
+        except queue.Full:
+            if stop.is_set():
+                return False
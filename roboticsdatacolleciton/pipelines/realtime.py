@@ -2,49 +2,151 @@
 from __future__ import annotations
 
 import time
-from typing import Callable, Iterable, Optional
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Iterable, List, Optional
 
 from roboticsdatacolleciton.config import RealtimeTrackingConfig
-from roboticsdatacolleciton.detection import MediaPipeHandTracker
+from roboticsdatacolleciton.detection import AsyncHandDetector, HandDetector
+from roboticsdatacolleciton.ipc import SharedHandsPublisher
+from roboticsdatacolleciton.loggers import BackgroundHandLogWriter
+from roboticsdatacolleciton.profiling import NULL_PROFILER, StageProfiler
 from roboticsdatacolleciton.types import HandPosition
 from roboticsdatacolleciton.video import CameraStream
 from roboticsdatacolleciton.visualization import HandPreviewRenderer
 
 
+@dataclass(slots=True)
+class RealtimeStats:
+    """Capture-to-detection latency over a rolling window of recent frames."""
+
+    window: int = 300
+    frames: int = 0
+    dropped_frames: int = 0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    _latencies: Deque[float] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._latencies = deque(maxlen=self.window)
+
+    def add(self, latency_ms: float) -> None:
+        self.frames += 1
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self._latencies.append(latency_ms)
+
+    @property
+    def mean_latency_ms(self) -> float:
+        if not self._latencies:
+            return 0.0
+        return sum(self._latencies) / len(self._latencies)
+
+    @property
+    def p95_latency_ms(self) -> float:
+        if not self._latencies:
+            return 0.0
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(0.95 * len(ordered)))]
+
+
 class RealTimeHandTrackingPipeline:
     """Coordinates camera ingestion and detection, emitting console output."""
 
     def __init__(
         self,
         camera: CameraStream,
-        detector: MediaPipeHandTracker,
+        detector: HandDetector | AsyncHandDetector,
         config: RealtimeTrackingConfig,
         output_fn: Callable[[Iterable[HandPosition]], None],
         visualizer: Optional[HandPreviewRenderer] = None,
+        profiler: Optional[StageProfiler] = None,
+        publisher: Optional[SharedHandsPublisher] = None,
+        recorder: Optional[BackgroundHandLogWriter] = None,
     ) -> None:
         self.camera = camera
         self.detector = detector
         self.config = config
         self.output_fn = output_fn
         self.visualizer = visualizer
+        self.profiler = profiler or NULL_PROFILER
+        self.publisher = publisher
+        self.recorder = recorder
+        self.stats = RealtimeStats()
 
-    def run(self) -> None:
+    def run(self) -> RealtimeStats:
         """Continuously read frames, detect hands, and stream results."""
 
+        self.stats = RealtimeStats()
         try:
             with self.camera as camera:
                 try:
-                    for frame in camera.frames():
-                        positions = self.detector.detect(frame)
-                        self.output_fn(positions)
-                        if self.visualizer:
-                            keep_running = self.visualizer.render(frame, positions)
-                            if not keep_running:
-                                break
-                        time.sleep(0.01)
+                    if getattr(self.detector, "asynchronous", False):
+                        self._run_async(camera)
+                    else:
+                        self._run_sync(camera)
                 except KeyboardInterrupt:
                     print("\nStopping realtime hand tracking...")
         finally:
             self.detector.close()
             if self.visualizer:
                 self.visualizer.close()
+            if self.publisher:
+                self.publisher.close()
+            if self.recorder:
+                self.recorder.close()
+        return self.stats
+
+    def _run_sync(self, camera: CameraStream) -> None:
+        for captured_at, frame in self.profiler.iterate("capture", camera.timestamped_frames()):
+            positions = self.detector.detect(frame)
+            latency = time.monotonic() - captured_at
+            self.stats.add(latency * 1000.0)
+            self.profiler.record("capture_to_result", int(latency * 1e9))
+            self.stats.dropped_frames = camera.stats.dropped_frames
+            self.profiler.tick("frames")
+            self._deliver(positions, captured_at)
+            with self.profiler.stage("output"):
+                self.output_fn(positions)
+            keep_running = self._show(frame, positions)
+            camera.release(frame)
+            if not keep_running:
+                break
+
+    def _run_async(self, camera: CameraStream) -> None:
+        # Capture keeps going while MediaPipe works on an earlier frame; each
+        # frame is drawn with the newest detections available when it arrives.
+        positions: List[HandPosition] = []
+        for captured_at, frame in self.profiler.iterate("capture", camera.timestamped_frames()):
+            self.detector.submit(frame, int(captured_at * 1000))
+            self.profiler.tick("frames")
+            result = self.detector.latest()
+            if result is not None:
+                positions = result.positions
+                latency_ms = time.monotonic() * 1000.0 - result.timestamp_ms
+                self.stats.add(latency_ms)
+                self.profiler.record("capture_to_result", int(latency_ms * 1e6))
+                self.stats.dropped_frames = camera.stats.dropped_frames
+                self.profiler.tick("results")
+                self._deliver(positions, result.timestamp_ms / 1000.0)
+                with self.profiler.stage("output"):
+                    self.output_fn(positions)
+            keep_running = self._show(frame, positions)
+            camera.release(frame)
+            if not keep_running:
+                break
+
+    def _deliver(self, positions: List[HandPosition], captured_at: float) -> None:
+        if self.publisher is not None:
+            with self.profiler.stage("publish"):
+                self.publisher.publish(positions, captured_at)
+        if self.recorder is not None:
+            with self.profiler.stage("record"):
+                # Frames are numbered in result order; ``captured_at`` carries the real timing.
+                self.recorder.record(self.stats.frames - 1, positions, captured_at=captured_at)
+
+    def _show(self, frame, positions: List[HandPosition]) -> bool:  # noqa: ANN001
+        if self.visualizer is None:
+            return True
+        with self.profiler.stage("render"):
+            return self.visualizer.render(frame, positions)
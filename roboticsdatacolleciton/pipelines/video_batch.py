@@ -1,50 +1,183 @@
 """Offline video processing pipeline."""
 from __future__ import annotations
 
+import time
+from dataclasses import dataclass
 from typing import Optional, Sequence
 
-from roboticsdatacolleciton.detection import MediaPipeHandTracker
+from roboticsdatacolleciton.detection import CacheEntry, DetectionCache, HandDetector, MotionGate
 from roboticsdatacolleciton.loggers import HandLogWriter
+from roboticsdatacolleciton.profiling import NULL_PROFILER, StageProfiler
 from roboticsdatacolleciton.types import HandPosition
 from roboticsdatacolleciton.video import VideoFileStream
 from roboticsdatacolleciton.visualization import HandPreviewRenderer
 
 
+@dataclass(slots=True)
+class VideoProcessingStats:
+    """Counters collected while a pipeline run is in progress."""
+
+    frames: int = 0
+    detections: int = 0
+    elapsed_seconds: float = 0.0
+    cache_hit: bool = False
+    skipped_frames: int = 0
+    interrupted: bool = False
+
+    @property
+    def fps(self) -> float:
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.frames / self.elapsed_seconds
+
+    @property
+    def skip_ratio(self) -> float:
+        """Share of frames whose detections were carried over by the motion gate."""
+
+        if self.frames == 0:
+            return 0.0
+        return self.skipped_frames / self.frames
+
+
 class VideoProcessingPipeline:
-    """Runs detection over a video file with optional preview/logging."""
+    """Runs detection over a video file with optional preview/logging.
+
+    With a ``cache`` the pipeline first looks up detections for this video
+    and detector configuration; on a hit they are replayed instead of calling
+    ``detect()`` (frames are only decoded when a visualizer needs them), and
+    on a miss a full run is stored for next time.
+
+    With a ``motion_gate`` the detector only runs when the scene changed;
+    otherwise the previous detections are reused and logged as carried over.
+    Gated runs are not written to the cache because they are approximate.
+    """
 
     def __init__(
         self,
         video_stream: VideoFileStream,
-        detector: MediaPipeHandTracker,
+        detector: HandDetector,
         logger: Optional[HandLogWriter] = None,
         visualizer: Optional[HandPreviewRenderer] = None,
+        close_detector: bool = True,
+        cache: Optional[DetectionCache] = None,
+        motion_gate: Optional[MotionGate] = None,
+        profiler: Optional[StageProfiler] = None,
     ) -> None:
         self.video_stream = video_stream
         self.detector = detector
         self.logger = logger
         self.visualizer = visualizer
+        self.close_detector = close_detector
+        self.cache = cache
+        self.motion_gate = motion_gate
+        self.profiler = profiler or NULL_PROFILER
+        self.stats = VideoProcessingStats()
+        self._cache_key: Optional[str] = None
+        self._cache_entry: Optional[CacheEntry] = None
+        self._cache_writer: Optional[HandLogWriter] = None
 
-    def run(self) -> None:
+    def run(self) -> VideoProcessingStats:
+        self.stats = VideoProcessingStats()
+        started = time.perf_counter()
+        completed = False
+        exhausted = False
         try:
             with self.video_stream as stream:
                 try:
-                    for frame_index, frame in stream.frames():
-                        positions = self.detector.detect(frame)
-                        self._emit(frame_index, positions)
-                        if self.visualizer:
-                            keep_running = self.visualizer.render(frame, positions)
-                            if not keep_running:
-                                break
+                    self._open_cache(stream)
+                    exhausted = self._replay(stream) if self._cache_entry else self._detect(stream)
+                    completed = True
                 except KeyboardInterrupt:
+                    self.stats.interrupted = True
                     print("\nStopping video processing early...")
         finally:
-            self.detector.close()
+            self.stats.elapsed_seconds = time.perf_counter() - started
+            if self.close_detector:
+                self.detector.close()
             if self.logger:
-                self.logger.close()
+                # Interrupted or failed runs leave a resumable checkpoint instead of a final log.
+                self.logger.close(finalize=completed)
             if self.visualizer:
                 self.visualizer.close()
+            self._close_cache(commit=completed and exhausted)
+        return self.stats
+
+    def _detect(self, stream: VideoFileStream) -> bool:
+        if self.motion_gate:
+            self.motion_gate.reset()
+        positions: Sequence[HandPosition] = []
+        for frame_index, frame in self.profiler.iterate("decode", stream.frames()):
+            if self.motion_gate is None:
+                carried_over = False
+            else:
+                with self.profiler.stage("motion_gate"):
+                    carried_over = not self.motion_gate.should_detect(frame)
+            if carried_over:
+                self.stats.skipped_frames += 1
+            else:
+                positions = self.detector.detect(frame)
+            self._emit(frame_index, positions, carried_over)
+            keep_running = self._show(frame, positions)
+            stream.release(frame)
+            if not keep_running:
+                return False
+        return True
+
+    def _replay(self, stream: VideoFileStream) -> bool:
+        detections = self.profiler.iterate(
+            "cache_read", self._cache_entry.iter_frames(stream.start_frame, stream.end_frame)
+        )
+        if self.visualizer is None:
+            for frame_index, positions in detections:
+                self._emit(frame_index, positions)
+            return True
+        for (frame_index, frame), (_, positions) in zip(self.profiler.iterate("decode", stream.frames()), detections):
+            self._emit(frame_index, positions)
+            keep_running = self._show(frame, positions)
+            stream.release(frame)
+            if not keep_running:
+                return False
+        return True
 
-    def _emit(self, frame_index: int, positions: Sequence[HandPosition]) -> None:
+    def _show(self, frame, positions: Sequence[HandPosition]) -> bool:  # noqa: ANN001
+        if self.visualizer:
+            with self.profiler.stage("render"):
+                return self.visualizer.render(frame, positions)
+        return True
+
+    def _emit(self, frame_index: int, positions: Sequence[HandPosition], carried_over: bool = False) -> None:
+        self.stats.frames += 1
+        self.stats.detections += len(positions)
+        self.profiler.tick("frames")
         if self.logger:
-            self.logger.record(frame_index, positions)
+            with self.profiler.stage("log"):
+                self.logger.record(frame_index, positions, carried_over=carried_over)
+        if self._cache_writer:
+            with self.profiler.stage("cache_write"):
+                self._cache_writer.record(frame_index, positions)
+
+    def _open_cache(self, stream: VideoFileStream) -> None:
+        self._cache_key = self._cache_entry = self._cache_writer = None
+        if self.cache is None:
+            return
+        self._cache_key = self.cache.key_for(stream.path, self.detector.cache_params)
+        self._cache_entry = self.cache.lookup(self._cache_key)
+        self.stats.cache_hit = self._cache_entry is not None
+        # Only ungated whole-video runs are complete enough to be reused later.
+        whole_video = stream.start_frame == 0 and stream.end_frame is None
+        if self._cache_entry is None and whole_video and self.motion_gate is None:
+            self._cache_writer = self.cache.writer(self._cache_key)
+
+    def _close_cache(self, commit: bool) -> None:
+        if self._cache_writer is None:
+            return
+        if commit:
+            self.cache.commit(
+                self._cache_key,
+                self._cache_writer,
+                frame_count=self.stats.frames,
+                metadata={"video": str(self.video_stream.path), "detector": self.detector.cache_params},
+            )
+        else:
+            self.cache.discard(self._cache_writer)
+        self._cache_writer = None
@@ -0,0 +1,38 @@
+"""Per-stage profiling and metrics export for the pipelines."""
+
+from typing import TYPE_CHECKING
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .profiler import (
+        NULL_PROFILER,
+        FpsCounter,
+        NullProfiler,
+        PrometheusTextfileWriter,
+        StageMetrics,
+        StageProfiler,
+    )
+
+__all__ = [
+    "NULL_PROFILER",
+    "FpsCounter",
+    "NullProfiler",
+    "PrometheusTextfileWriter",
+    "StageMetrics",
+    "StageProfiler",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".profiler": (
+            "NULL_PROFILER",
+            "FpsCounter",
+            "NullProfiler",
+            "PrometheusTextfileWriter",
+            "StageMetrics",
+            "StageProfiler",
+        ),
+    },
+)
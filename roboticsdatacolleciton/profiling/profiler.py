@@ -0,0 +1,299 @@
+"""Low-overhead per-stage timers, rolling latency histograms and fps counters."""
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# Upper bounds (seconds) of the cumulative Prometheus histogram buckets.
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.035, 0.05, 0.1, 0.2, 0.5, 1.0,
+)
+
+
+class StageMetrics:
+    """Durations recorded for one stage.
+
+    Totals and bucket counts cover the whole run; percentiles are computed
+    over the most recent ``window`` samples so they track current behaviour.
+    """
+
+    __slots__ = ("name", "count", "total_ns", "max_ns", "buckets", "bucket_counts", "_recent")
+
+    def __init__(self, name: str, window: int, buckets: Tuple[float, ...]) -> None:
+        self.name = name
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.buckets = buckets
+        self.bucket_counts = [0] * len(buckets)
+        self._recent: Deque[int] = deque(maxlen=window)
+
+    def add(self, duration_ns: int) -> None:
+        self.count += 1
+        self.total_ns += duration_ns
+        if duration_ns > self.max_ns:
+            self.max_ns = duration_ns
+        self._recent.append(duration_ns)
+        seconds = duration_ns / 1e9
+        for idx, bound in enumerate(self.buckets):
+            if seconds <= bound:
+                self.bucket_counts[idx] += 1
+                break
+
+    def snapshot(self) -> dict:
+        recent = sorted(self._recent)
+        return {
+            "count": self.count,
+            "total_seconds": self.total_ns / 1e9,
+            "mean_ms": self.total_ns / self.count / 1e6 if self.count else 0.0,
+            "max_ms": self.max_ns / 1e6,
+            "p50_ms": _percentile(recent, 0.50) / 1e6,
+            "p95_ms": _percentile(recent, 0.95) / 1e6,
+            "p99_ms": _percentile(recent, 0.99) / 1e6,
+        }
+
+
+class _StageTimer:
+    __slots__ = ("_metrics", "_started")
+
+    def __init__(self, metrics: StageMetrics) -> None:
+        self._metrics = metrics
+        self._started = 0
+
+    def __enter__(self) -> None:
+        self._started = time.perf_counter_ns()
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self._metrics.add(time.perf_counter_ns() - self._started)
+
+
+class FpsCounter:
+    """Total events plus the rate over the last ``window`` events."""
+
+    __slots__ = ("name", "count", "started", "_recent")
+
+    def __init__(self, name: str, window: int) -> None:
+        self.name = name
+        self.count = 0
+        self.started: Optional[float] = None
+        self._recent: Deque[float] = deque(maxlen=window)
+
+    def tick(self) -> None:
+        now = time.perf_counter()
+        if self.started is None:
+            self.started = now
+        self.count += 1
+        self._recent.append(now)
+
+    @property
+    def fps(self) -> float:
+        if len(self._recent) < 2:
+            return 0.0
+        span = self._recent[-1] - self._recent[0]
+        return (len(self._recent) - 1) / span if span > 0 else 0.0
+
+    def snapshot(self) -> dict:
+        elapsed = (self._recent[-1] - self.started) if self._recent and self.started is not None else 0.0
+        return {
+            "count": self.count,
+            "fps": self.fps,
+            "mean_fps": (self.count - 1) / elapsed if elapsed > 0 else 0.0,
+        }
+
+
+class StageProfiler:
+    """Collects per-stage timings and event rates for a pipeline run.
+
+    ``stage(name)`` returns a reusable context manager timing one stage
+    (each stage should only be timed from one thread at a time),
+    ``iterate(name, iterable)`` times every ``next()`` of an iterator, which
+    is how decode and capture are measured, and ``tick(name)`` advances an
+    fps counter.
+    """
+
+    enabled = True
+
+    def __init__(self, window: int = 1000, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.window = window
+        self.buckets = buckets
+        self.started_at = time.time()
+        self._stages: Dict[str, StageMetrics] = {}
+        self._timers: Dict[str, _StageTimer] = {}
+        self._counters: Dict[str, FpsCounter] = {}
+        self._lock = threading.Lock()
+
+    def stage(self, name: str) -> _StageTimer:
+        timer = self._timers.get(name)
+        if timer is None:
+            with self._lock:
+                metrics = self._stages.setdefault(name, StageMetrics(name, self.window, self.buckets))
+                timer = self._timers.setdefault(name, _StageTimer(metrics))
+        return timer
+
+    def record(self, name: str, duration_ns: int) -> None:
+        """Add a duration measured elsewhere, e.g. capture-to-result latency."""
+
+        self.stage(name)._metrics.add(duration_ns)
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterator[T]:
+        iterator = iter(iterable)
+        timer = self.stage(name)
+        try:
+            while True:
+                with timer:
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+
+    def tick(self, name: str = "frames") -> None:
+        counter = self._counters.get(name)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(name, FpsCounter(name, self.window))
+        counter.tick()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            stages = list(self._stages.values())
+            counters = list(self._counters.values())
+        return {
+            "started_at": self.started_at,
+            "elapsed_seconds": time.time() - self.started_at,
+            "stages": {metrics.name: metrics.snapshot() for metrics in stages},
+            "counters": {counter.name: counter.snapshot() for counter in counters},
+        }
+
+    def format_table(self) -> str:
+        """Human-readable per-stage summary for printing at exit."""
+
+        snapshot = self.snapshot()
+        lines = [f"{'stage':<18}{'count':>9}{'mean ms':>10}{'p95 ms':>10}{'max ms':>10}{'total s':>10}"]
+        for name, stage in snapshot["stages"].items():
+            lines.append(
+                f"{name:<18}{stage['count']:>9}{stage['mean_ms']:>10.2f}{stage['p95_ms']:>10.2f}"
+                f"{stage['max_ms']:>10.2f}{stage['total_seconds']:>10.2f}"
+            )
+        for name, counter in snapshot["counters"].items():
+            lines.append(f"{name}: {counter['count']} at {counter['fps']:.1f}/s (mean {counter['mean_fps']:.1f}/s)")
+        return "\n".join(lines)
+
+    def dump_json(self, path: str | Path) -> None:
+        _atomic_write(Path(path), json.dumps(self.snapshot(), indent=2))
+
+    def prometheus_text(self, prefix: str = "handtracking") -> str:
+        with self._lock:
+            stages = list(self._stages.values())
+            counters = list(self._counters.values())
+        lines: List[str] = [
+            f"# HELP {prefix}_stage_duration_seconds Time spent in each pipeline stage.",
+            f"# TYPE {prefix}_stage_duration_seconds histogram",
+        ]
+        for metrics in stages:
+            label = f'stage="{metrics.name}"'
+            cumulative = 0
+            for bound, count in zip(metrics.buckets, metrics.bucket_counts):
+                cumulative += count
+                lines.append(f'{prefix}_stage_duration_seconds_bucket{{{label},le="{bound:g}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_duration_seconds_bucket{{{label},le="+Inf"}} {metrics.count}')
+            lines.append(f"{prefix}_stage_duration_seconds_sum{{{label}}} {metrics.total_ns / 1e9:.9f}")
+            lines.append(f"{prefix}_stage_duration_seconds_count{{{label}}} {metrics.count}")
+        lines += [
+            f"# HELP {prefix}_events_total Events counted by the pipeline.",
+            f"# TYPE {prefix}_events_total counter",
+        ]
+        lines += [f'{prefix}_events_total{{counter="{counter.name}"}} {counter.count}' for counter in counters]
+        lines += [
+            f"# HELP {prefix}_events_per_second Recent event rate.",
+            f"# TYPE {prefix}_events_per_second gauge",
+        ]
+        lines += [f'{prefix}_events_per_second{{counter="{counter.name}"}} {counter.fps:.3f}' for counter in counters]
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus(self, path: str | Path, prefix: str = "handtracking") -> None:
+        """Write the Prometheus text exposition format, e.g. for node_exporter's textfile collector."""
+
+        _atomic_write(Path(path), self.prometheus_text(prefix))
+
+
+class NullProfiler:
+    """Stand-in used when profiling is off; every call is a no-op."""
+
+    enabled = False
+    _NULL_TIMER = nullcontext()
+
+    def stage(self, name: str) -> nullcontext:
+        return self._NULL_TIMER
+
+    def iterate(self, name: str, iterable: Iterable[T]) -> Iterable[T]:
+        return iterable
+
+    def record(self, name: str, duration_ns: int) -> None:
+        pass
+
+    def tick(self, name: str = "frames") -> None:
+        pass
+
+
+NULL_PROFILER = NullProfiler()
+
+
+class PrometheusTextfileWriter:
+    """Background thread that rewrites a Prometheus text file every ``interval`` seconds."""
+
+    def __init__(self, profiler: StageProfiler, path: str | Path, interval: float = 10.0) -> None:
+        self.profiler = profiler
+        self.path = Path(path)
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "PrometheusTextfileWriter":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self.stop()
+
+    def start(self) -> None:
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, name="prometheus-textfile", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.profiler.write_prometheus(self.path)
+
+    def _loop(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.profiler.write_prometheus(self.path)
+
+
+def _percentile(ordered: List[int], fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return float(ordered[min(len(ordered) - 1, int(fraction * len(ordered)))])
+
+
+def _atomic_write(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with tmp_path.open("w", encoding="utf-8") as fp:
+        fp.write(text)
+    os.replace(tmp_path, path)
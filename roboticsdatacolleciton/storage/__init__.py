@@ -1,3 +1,65 @@
-"""Placeholder for storage backends (e.g., S3, local disk)."""
+"""Storage backends (local disk, S3) and partitioned hand-log datasets."""
+from __future__ import annotations
 
-# This module will later host storage abstractions.
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .base import ObjectInfo, StorageBackend
+    from .dataset import (
+        MANIFEST_KEY,
+        PARTITION_KEYS,
+        CompactionReport,
+        HandDataset,
+        ManifestEntry,
+        Partition,
+    )
+    from .local import LocalStorage
+    from .s3 import S3Storage
+
+
+def open_storage(url: str | Path, **kwargs: Any) -> StorageBackend:
+    """Backend for ``s3://bucket/prefix`` URLs or a local directory path.
+
+    Extra keyword arguments (``endpoint_url``, ``part_size``, ...) go to ``S3Storage``.
+    """
+
+    from .local import LocalStorage
+    from .s3 import S3Storage
+
+    text = str(url)
+    if text.startswith("s3://"):
+        bucket, _, prefix = text[len("s3://"):].partition("/")
+        if not bucket:
+            raise ValueError(f"Missing bucket in storage URL {text!r}")
+        return S3Storage(bucket, prefix, **kwargs)
+    if kwargs:
+        raise ValueError(f"Unexpected options for local storage: {', '.join(sorted(kwargs))}")
+    return LocalStorage(text[len("file://"):] if text.startswith("file://") else text)
+
+
+__all__ = [
+    "MANIFEST_KEY",
+    "PARTITION_KEYS",
+    "CompactionReport",
+    "HandDataset",
+    "LocalStorage",
+    "ManifestEntry",
+    "ObjectInfo",
+    "Partition",
+    "S3Storage",
+    "StorageBackend",
+    "open_storage",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".base": ("ObjectInfo", "StorageBackend"),
+        ".dataset": ("MANIFEST_KEY", "PARTITION_KEYS", "CompactionReport", "HandDataset", "ManifestEntry", "Partition"),
+        ".local": ("LocalStorage",),
+        ".s3": ("S3Storage",),
+    },
+)
@@ -0,0 +1,58 @@
+"""Interface shared by the storage backends."""
+from __future__ import annotations
+
+from concurrent.futures import Future
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Protocol
+
+import pyarrow as pa
+
+
+@dataclass(slots=True)
+class ObjectInfo:
+    """One stored object; ``key`` is relative to the backend root."""
+
+    key: str
+    size: int
+
+
+class StorageBackend(Protocol):
+    """Key/value object storage for datasets.
+
+    Keys use ``/`` separators on every backend. ``put_file`` may upload in
+    the background and returns a future; everything else is synchronous.
+    Writes of a single key are atomic: readers see the old or the new
+    object, never a partial one.
+    """
+
+    def put_file(self, local_path: str | Path, key: str) -> Future:
+        ...
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        ...
+
+    def get_bytes(self, key: str) -> bytes:
+        ...
+
+    def open_input(self, key: str) -> pa.NativeFile:
+        """Readable pyarrow file over ``key``, suitable for ``pq.ParquetFile``."""
+
+        ...
+
+    def exists(self, key: str) -> bool:
+        ...
+
+    def list(self, prefix: str = "") -> List[ObjectInfo]:
+        ...
+
+    def delete(self, key: str) -> None:
+        ...
+
+    def flush(self) -> None:
+        """Wait for background uploads; raises the first upload error."""
+
+        ...
+
+    def close(self) -> None:
+        ...
@@ -0,0 +1,496 @@
+"""Hive-partitioned hand-log datasets with a manifest and small-file compaction."""
+from __future__ import annotations
+
+import json
+import tempfile
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+from typing import Collection, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import quote, unquote
+
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from roboticsdatacolleciton.loggers import FrameSummaryWriter, HandLogBatch, HandLogReader
+from roboticsdatacolleciton.loggers.hand_logger import MONOTONIC_EPOCH_KEY, hand_log_schema
+
+from .base import StorageBackend
+
+MANIFEST_KEY = "_manifest.json"
+MANIFEST_VERSION = 1
+PARTITION_KEYS = ("session", "camera", "date")
+# Column added by compaction naming the recording each row came from.
+SOURCE_COLUMN = "source"
+
+
+@dataclass(slots=True, frozen=True)
+class Partition:
+    """Hive partition of a dataset: ``session=<id>/camera=<id>/date=<YYYY-MM-DD>``."""
+
+    session: str
+    camera: str
+    date: str
+
+    @property
+    def prefix(self) -> str:
+        return "/".join(f"{name}={quote(getattr(self, name), safe='')}" for name in PARTITION_KEYS)
+
+    @classmethod
+    def for_log(cls, log_path: str | Path, session: str, camera: str = "cam0", date: Optional[str] = None) -> "Partition":
+        """Partition of a local log; ``date`` defaults to its modification date (UTC)."""
+
+        if date is None:
+            date = datetime.fromtimestamp(Path(log_path).stat().st_mtime, tz=timezone.utc).date().isoformat()
+        return cls(session, camera, date)
+
+    @classmethod
+    def from_key(cls, key: str) -> "Partition":
+        values = dict(part.split("=", 1) for part in key.split("/") if "=" in part)
+        return cls(**{name: unquote(values[name]) for name in PARTITION_KEYS})
+
+
+@dataclass(slots=True)
+class ManifestEntry:
+    """Statistics of one data file, enough to decide whether a scan must open it.
+
+    ``captured_min``/``captured_max`` are ``time.monotonic()`` seconds and
+    ``epoch`` the Unix time of monotonic zero, for logs recorded with
+    timestamps; they are None otherwise. ``sources`` names the recordings
+    in the file, in row order: the uploaded file's stem, or the values of
+    the ``source`` column once compaction has merged several.
+    """
+
+    key: str
+    session: str
+    camera: str
+    date: str
+    rows: int
+    row_groups: int
+    bytes: int
+    frame_min: Optional[int]
+    frame_max: Optional[int]
+    confidence_max: Optional[float]
+    labels: List[str]
+    captured_min: Optional[float] = None
+    captured_max: Optional[float] = None
+    epoch: Optional[float] = None
+    summary_key: Optional[str] = None
+    added_at: float = field(default_factory=time.time)
+    sources: List[str] = field(default_factory=list)
+
+    @property
+    def partition(self) -> Partition:
+        return Partition(self.session, self.camera, self.date)
+
+    def overlaps(
+        self,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+        labels: Optional[Collection[str]] = None,
+        min_confidence: Optional[float] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> bool:
+        """Whether the file may hold matching rows; times are Unix seconds, half-open."""
+
+        if self.rows == 0:
+            return False
+        if start_frame is not None and self.frame_max is not None and self.frame_max < start_frame:
+            return False
+        if end_frame is not None and self.frame_min is not None and self.frame_min >= end_frame:
+            return False
+        if labels is not None and not set(labels) & set(self.labels):
+            return False
+        if min_confidence is not None and self.confidence_max is not None and self.confidence_max < min_confidence:
+            return False
+        if (start_time is not None or end_time is not None) and self.epoch is not None:
+            if self.captured_min is not None and end_time is not None and self.epoch + self.captured_min >= end_time:
+                return False
+            if self.captured_max is not None and start_time is not None and self.epoch + self.captured_max < start_time:
+                return False
+        return True
+
+
+@dataclass(slots=True)
+class CompactionReport:
+    """Files merged by ``HandDataset.compact``."""
+
+    files_before: int = 0
+    files_after: int = 0
+    rows: int = 0
+    bytes_before: int = 0
+    bytes_after: int = 0
+    elapsed_seconds: float = 0.0
+
+
+class HandDataset:
+    """A dataset of HandLogWriter logs on a storage backend.
+
+    Files live under Hive partitions (``session=.../camera=.../date=...``)
+    so other engines (DuckDB, Spark, ``pyarrow.dataset``) can read the tree
+    directly. ``_manifest.json`` at the root lists every file with its row
+    count, frame and capture-time range, labels and maximum confidence,
+    which lets ``scan`` skip files without opening them. ``compact`` merges
+    small files of a partition into large row groups, keeping each
+    recording's rows together and tagging them with a ``source`` column.
+
+    The manifest is rewritten as a whole after each change, so a dataset
+    should have a single writer at a time; readers can run concurrently.
+    """
+
+    def __init__(
+        self,
+        storage: StorageBackend,
+        row_group_size: int = 1_048_576,
+        compression: str | None = "zstd",
+    ) -> None:
+        self.storage = storage
+        self.row_group_size = row_group_size
+        self.compression = compression
+        self._entries: Optional[Dict[str, ManifestEntry]] = None
+
+    @property
+    def entries(self) -> List[ManifestEntry]:
+        return list(self._manifest().values())
+
+    def partitions(self) -> List[Partition]:
+        return sorted({entry.partition for entry in self.entries}, key=lambda partition: partition.prefix)
+
+    def add_logs(self, logs: Iterable[Tuple[str | Path, Partition]]) -> List[ManifestEntry]:
+        """Upload logs (and their summary JSON, when present) into their partitions.
+
+        Uploads run in the background on backends that support it; the
+        manifest is updated once every upload has finished.
+        """
+
+        added = []
+        for log_path, partition in logs:
+            log_path = Path(log_path)
+            stem = f"{partition.prefix}/part-{uuid.uuid4().hex}"
+            entry = _describe(pq.ParquetFile(str(log_path)), f"{stem}.parquet", partition, log_path.stat().st_size)
+            self.storage.put_file(log_path, entry.key)
+            summary_path = log_path.with_suffix(".summary.json")
+            if summary_path.exists():
+                entry.summary_key = f"{stem}.summary.json"
+                self.storage.put_file(summary_path, entry.summary_key)
+            added.append(entry)
+        self.storage.flush()
+        manifest = self._manifest()
+        for entry in added:
+            manifest[entry.key] = entry
+        self._save_manifest()
+        return added
+
+    def add_log(
+        self,
+        log_path: str | Path,
+        session: str,
+        camera: str = "cam0",
+        date: Optional[str] = None,
+    ) -> ManifestEntry:
+        """Add one log; ``date`` defaults to the log's modification date (UTC).
+
+        Use ``add_logs`` for several files so the manifest is written once.
+        """
+
+        return self.add_logs([(log_path, Partition.for_log(log_path, session, camera, date))])[0]
+
+    def scan(
+        self,
+        sessions: Optional[Collection[str]] = None,
+        cameras: Optional[Collection[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+        labels: Optional[Collection[str]] = None,
+        min_confidence: Optional[float] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> List[ManifestEntry]:
+        """Files that may contain matching rows, decided from the manifest alone.
+
+        Dates are inclusive ``YYYY-MM-DD`` strings; frame and time ranges are
+        half-open, with times in Unix seconds.
+        """
+
+        selected = []
+        for entry in self.entries:
+            if sessions is not None and entry.session not in sessions:
+                continue
+            if cameras is not None and entry.camera not in cameras:
+                continue
+            if date_from is not None and entry.date < date_from:
+                continue
+            if date_to is not None and entry.date > date_to:
+                continue
+            if entry.overlaps(start_frame, end_frame, labels, min_confidence, start_time, end_time):
+                selected.append(entry)
+        return sorted(selected, key=lambda entry: (entry.session, entry.camera, entry.date, entry.frame_min or 0))
+
+    def iter_batches(
+        self,
+        batch_size: int = 65536,
+        sessions: Optional[Collection[str]] = None,
+        cameras: Optional[Collection[str]] = None,
+        date_from: Optional[str] = None,
+        date_to: Optional[str] = None,
+        start_frame: Optional[int] = None,
+        end_frame: Optional[int] = None,
+        labels: Optional[Collection[str]] = None,
+        min_confidence: Optional[float] = None,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+    ) -> Iterator[Tuple[ManifestEntry, HandLogBatch]]:
+        """Stream matching rows file by file, pruning files via the manifest and row groups via statistics.
+
+        Filters match ``scan``; capture times are Unix seconds and leave
+        rows recorded without timestamps in.
+        """
+
+        entries = self.scan(
+            sessions, cameras, date_from, date_to, start_frame, end_frame, labels, min_confidence, start_time, end_time
+        )
+        for entry in entries:
+            with HandLogReader(self.storage.open_input(entry.key)) as reader:
+                batches = reader.iter_batches(
+                    batch_size, start_frame, end_frame, labels, min_confidence, start_time, end_time
+                )
+                for batch in batches:
+                    yield entry, batch
+
+    def compact(
+        self,
+        small_file_bytes: int = 32 * 1024 * 1024,
+        target_file_bytes: int = 512 * 1024 * 1024,
+        partitions: Optional[Sequence[Partition]] = None,
+    ) -> CompactionReport:
+        """Merge files smaller than ``small_file_bytes`` within each partition.
+
+        Small files are grouped in the order they were added, up to
+        ``target_file_bytes``; each group of two or more becomes one file
+        with ``row_group_size`` rows per row group. Files are concatenated
+        whole, never interleaved, so every recording keeps its own frame
+        order, and each row's recording is named in the ``source`` column
+        (see ``ManifestEntry.sources``). Frame summaries are merged the same
+        way, with a ``source`` per entry. Capture times from files recorded
+        after different boots are shifted onto the first file's clock.
+        Replaced files are deleted after the manifest is updated.
+        """
+
+        report = CompactionReport()
+        started = time.perf_counter()
+        wanted = set(partitions) if partitions is not None else None
+        by_partition: Dict[Partition, List[ManifestEntry]] = {}
+        for entry in self.entries:
+            if entry.bytes < small_file_bytes and (wanted is None or entry.partition in wanted):
+                by_partition.setdefault(entry.partition, []).append(entry)
+
+        replaced: List[ManifestEntry] = []
+        with tempfile.TemporaryDirectory(prefix="hand-dataset-") as scratch:
+            for partition, candidates in sorted(by_partition.items(), key=lambda item: item[0].prefix):
+                for group in _group_by_size(candidates, target_file_bytes):
+                    if len(group) < 2:
+                        continue
+                    merged = self._merge(partition, group, Path(scratch))
+                    manifest = self._manifest()
+                    for entry in group:
+                        del manifest[entry.key]
+                    manifest[merged.key] = merged
+                    replaced.extend(group)
+                    report.files_before += len(group)
+                    report.files_after += 1
+                    report.rows += merged.rows
+                    report.bytes_before += sum(entry.bytes for entry in group)
+                    report.bytes_after += merged.bytes
+            if replaced:
+                self.storage.flush()
+                self._save_manifest()
+                for entry in replaced:
+                    self.storage.delete(entry.key)
+                    if entry.summary_key:
+                        self.storage.delete(entry.summary_key)
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def rebuild_manifest(self) -> List[ManifestEntry]:
+        """Recreate the manifest by listing the backend and reading each file's footer."""
+
+        objects = {item.key: item for item in self.storage.list()}
+        manifest: Dict[str, ManifestEntry] = {}
+        for key, item in objects.items():
+            if not key.endswith(".parquet") or "=" not in key:
+                continue
+            entry = _describe(pq.ParquetFile(self.storage.open_input(key)), key, Partition.from_key(key), item.size)
+            summary_key = key[: -len(".parquet")] + ".summary.json"
+            entry.summary_key = summary_key if summary_key in objects else None
+            manifest[key] = entry
+        self._entries = manifest
+        self._save_manifest()
+        return list(manifest.values())
+
+    def _merge(self, partition: Partition, group: List[ManifestEntry], scratch: Path) -> ManifestEntry:
+        # Streamed batch by batch into one writer so a group never has to fit
+        # in memory. Files are appended in group order without sorting: frame
+        # indices restart per recording, so a global sort would interleave
+        # separate logs. Batches are regrouped into full ``row_group_size``
+        # groups because the small files end mid-group.
+        epoch = next((entry.epoch for entry in group if entry.epoch is not None), None)
+        timestamps = any(entry.epoch is not None or entry.captured_min is not None for entry in group)
+        schema = hand_log_schema(timestamps, epoch).append(pa.field(SOURCE_COLUMN, pa.string()))
+
+        stem = f"{partition.prefix}/part-{uuid.uuid4().hex}"
+        local = scratch / f"{uuid.uuid4().hex}.parquet"
+        writer = pq.ParquetWriter(
+            str(local),
+            schema,
+            compression=self.compression or "none",
+            use_dictionary=["label", SOURCE_COLUMN],
+        )
+        pending: List[pa.RecordBatch] = []
+        pending_rows = 0
+        try:
+            for item in group:
+                shift = item.epoch - epoch if epoch is not None and item.epoch is not None else 0.0
+                parquet_file = pq.ParquetFile(self.storage.open_input(item.key))
+                for batch in parquet_file.iter_batches(batch_size=self.row_group_size):
+                    pending.append(_conform(batch, schema, _source_id(item.key), shift))
+                    pending_rows += batch.num_rows
+                    while pending_rows >= self.row_group_size:
+                        table = pa.Table.from_batches(pending)
+                        writer.write_table(table.slice(0, self.row_group_size), row_group_size=self.row_group_size)
+                        rest = table.slice(self.row_group_size)
+                        pending, pending_rows = rest.to_batches(), rest.num_rows
+            if pending_rows:
+                writer.write_table(pa.Table.from_batches(pending, schema=schema), row_group_size=self.row_group_size)
+        finally:
+            writer.close()
+        entry = _describe(pq.ParquetFile(str(local)), f"{stem}.parquet", partition, local.stat().st_size)
+        entry.added_at = min(item.added_at for item in group)
+        self.storage.put_file(local, entry.key)
+
+        if any(item.summary_key for item in group):
+            summary = local.with_suffix(".summary.json")
+            writer = FrameSummaryWriter(summary)
+            for item in group:
+                if not item.summary_key:
+                    continue
+                for frame in self._summary_frames(item):
+                    source = frame.get("source", _source_id(item.key))
+                    writer.append(frame["frame_index"], frame["hand_count"], source=source)
+            writer.close()
+            entry.summary_key = f"{stem}.summary.json"
+            self.storage.put_file(summary, entry.summary_key)
+        return entry
+
+    def _summary_frames(self, entry: ManifestEntry) -> List[dict]:
+        return json.loads(self.storage.get_bytes(entry.summary_key))["frames"]
+
+    def _manifest(self) -> Dict[str, ManifestEntry]:
+        if self._entries is None:
+            self._entries = {}
+            if self.storage.exists(MANIFEST_KEY):
+                payload = json.loads(self.storage.get_bytes(MANIFEST_KEY))
+                if payload.get("version") != MANIFEST_VERSION:
+                    raise ValueError(f"Unsupported dataset manifest version {payload.get('version')!r}")
+                for item in payload["files"]:
+                    entry = ManifestEntry(**item)
+                    self._entries[entry.key] = entry
+        return self._entries
+
+    def _save_manifest(self) -> None:
+        files = sorted((asdict(entry) for entry in self._manifest().values()), key=lambda item: item["key"])
+        payload = {"version": MANIFEST_VERSION, "updated_at": time.time(), "files": files}
+        self.storage.put_bytes(MANIFEST_KEY, json.dumps(payload, indent=1).encode("utf-8"))
+
+
+def _describe(parquet_file: pq.ParquetFile, key: str, partition: Partition, size: int) -> ManifestEntry:
+    """Build a manifest entry from a file's footer statistics and label column."""
+
+    metadata = parquet_file.metadata
+    schema = parquet_file.schema_arrow
+    columns = {metadata.schema.column(idx).path: idx for idx in range(metadata.num_columns)}
+
+    def bounds(column: str) -> Tuple[Optional[object], Optional[object]]:
+        index = columns.get(column)
+        if index is None:
+            return None, None
+        lows, highs = [], []
+        for group in range(metadata.num_row_groups):
+            statistics = metadata.row_group(group).column(index).statistics
+            if statistics is None or not statistics.has_min_max:
+                return None, None
+            lows.append(statistics.min)
+            highs.append(statistics.max)
+        return (min(lows), max(highs)) if lows else (None, None)
+
+    frame_min, frame_max = bounds("frame_index")
+    _, confidence_max = bounds("confidence")
+    captured_min, captured_max = bounds("captured_at")
+    epoch = (schema.metadata or {}).get(MONOTONIC_EPOCH_KEY)
+    labels = parquet_file.read(columns=["label"]).column("label").unique().drop_null().to_pylist() if metadata.num_rows else []
+    if SOURCE_COLUMN in schema.names:
+        sources = parquet_file.read(columns=[SOURCE_COLUMN]).column(SOURCE_COLUMN).unique().drop_null().to_pylist()
+    else:
+        sources = [_source_id(key)]
+    return ManifestEntry(
+        key=key,
+        session=partition.session,
+        camera=partition.camera,
+        date=partition.date,
+        rows=metadata.num_rows,
+        row_groups=metadata.num_row_groups,
+        bytes=size,
+        frame_min=frame_min,
+        frame_max=frame_max,
+        confidence_max=None if confidence_max is None else float(confidence_max),
+        labels=sorted(labels),
+        captured_min=None if captured_min is None else float(captured_min),
+        captured_max=None if captured_max is None else float(captured_max),
+        epoch=float(epoch) if epoch else None,
+        sources=sources,
+    )
+
+
+def _conform(batch: pa.RecordBatch, schema: pa.Schema, source: str, shift: float) -> pa.RecordBatch:
+    """``batch`` in the merged ``schema``: missing columns as nulls, ``source`` filled, capture times shifted."""
+
+    columns = []
+    for target in schema:
+        if target.name in batch.schema.names:
+            column = batch.column(target.name)
+            if target.name == "captured_at" and shift:
+                column = pc.add(column, shift)
+            if column.type != target.type:
+                column = column.cast(target.type)
+        elif target.name == SOURCE_COLUMN:
+            column = pa.repeat(source, batch.num_rows)
+        else:
+            column = pa.nulls(batch.num_rows, target.type)
+        columns.append(column)
+    return pa.RecordBatch.from_arrays(columns, schema=schema)
+
+
+def _source_id(key: str) -> str:
+    """Recording id of an uploaded file: its key's stem (``part-<uuid>``)."""
+
+    return PurePosixPath(key).stem
+
+
+def _group_by_size(entries: List[ManifestEntry], target_bytes: int) -> List[List[ManifestEntry]]:
+    groups: List[List[ManifestEntry]] = []
+    current: List[ManifestEntry] = []
+    size = 0
+    for entry in sorted(entries, key=lambda item: (item.added_at, item.key)):
+        if current and size + entry.bytes > target_bytes:
+            groups.append(current)
+            current, size = [], 0
+        current.append(entry)
+        size += entry.bytes
+    if current:
+        groups.append(current)
+    return groups
@@ -0,0 +1,79 @@
+"""Local-disk storage backend."""
+from __future__ import annotations
+
+import os
+import shutil
+from concurrent.futures import Future
+from pathlib import Path
+from typing import List
+
+import pyarrow as pa
+
+from .base import ObjectInfo
+
+
+class LocalStorage:
+    """Stores objects as files under ``root``.
+
+    Files are written to a temporary name next to the target and renamed
+    into place, so a key is never visible half-written. ``put_file`` copies
+    synchronously and returns an already completed future.
+    """
+
+    def __init__(self, root: str | Path) -> None:
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    def path_for(self, key: str) -> Path:
+        return self.root.joinpath(*key.split("/"))
+
+    def put_file(self, local_path: str | Path, key: str) -> Future:
+        future: Future = Future()
+        try:
+            target = self.path_for(key)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            staging = target.with_name(f".{target.name}.tmp")
+            shutil.copyfile(local_path, staging)
+            os.replace(staging, target)
+            future.set_result(key)
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        target = self.path_for(key)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = target.with_name(f".{target.name}.tmp")
+        with staging.open("wb") as fp:
+            fp.write(data)
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(staging, target)
+
+    def get_bytes(self, key: str) -> bytes:
+        return self.path_for(key).read_bytes()
+
+    def open_input(self, key: str) -> pa.NativeFile:
+        return pa.memory_map(str(self.path_for(key)), "r")
+
+    def exists(self, key: str) -> bool:
+        return self.path_for(key).is_file()
+
+    def list(self, prefix: str = "") -> List[ObjectInfo]:
+        objects = []
+        for path in sorted(self.root.rglob("*")):
+            if not path.is_file() or path.name.startswith("."):
+                continue
+            key = path.relative_to(self.root).as_posix()
+            if key.startswith(prefix):
+                objects.append(ObjectInfo(key=key, size=path.stat().st_size))
+        return objects
+
+    def delete(self, key: str) -> None:
+        self.path_for(key).unlink(missing_ok=True)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
@@ -0,0 +1,137 @@
+"""S3-compatible object storage backend (AWS S3, MinIO, Ceph RGW, ...)."""
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, List, Optional
+
+import pyarrow as pa
+
+from .base import ObjectInfo
+
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+# S3 rejects multipart parts smaller than 5 MiB (except the last one).
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3Storage:
+    """Stores objects under ``prefix`` in an S3 bucket.
+
+    ``boto3`` is imported only when no ``client`` is passed, so the rest of
+    the package works without it; pass ``endpoint_url`` for MinIO or another
+    S3-compatible service. ``put_file`` uploads on a pool of
+    ``max_concurrency`` background threads; files larger than ``part_size``
+    go up as multipart uploads, which are aborted if any part fails. Call
+    ``flush()`` before relying on uploaded keys.
+    """
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        client: Any = None,
+        endpoint_url: Optional[str] = None,
+        part_size: int = DEFAULT_PART_SIZE,
+        max_concurrency: int = 4,
+    ) -> None:
+        if part_size < MIN_PART_SIZE:
+            raise ValueError(f"part_size must be at least {MIN_PART_SIZE} bytes")
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.endpoint_url = endpoint_url
+        self.part_size = part_size
+        self._client = client
+        self._client_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="s3-upload")
+        self._pending: List[Future] = []
+        self._pending_lock = threading.Lock()
+
+    @property
+    def client(self) -> Any:
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    try:
+                        import boto3
+                    except ImportError as exc:
+                        raise ImportError(
+                            "S3Storage needs boto3 (pip install boto3) or an explicit S3 client"
+                        ) from exc
+                    self._client = boto3.client("s3", endpoint_url=self.endpoint_url)
+        return self._client
+
+    def put_file(self, local_path: str | Path, key: str) -> Future:
+        future = self._executor.submit(self._upload, Path(local_path), self._key(key))
+        with self._pending_lock:
+            self._pending.append(future)
+        return future
+
+    def put_bytes(self, key: str, data: bytes) -> None:
+        self.client.put_object(Bucket=self.bucket, Key=self._key(key), Body=data)
+
+    def get_bytes(self, key: str) -> bytes:
+        return self.client.get_object(Bucket=self.bucket, Key=self._key(key))["Body"].read()
+
+    def open_input(self, key: str) -> pa.NativeFile:
+        return pa.BufferReader(self.get_bytes(key))
+
+    def exists(self, key: str) -> bool:
+        full_key = self._key(key)
+        response = self.client.list_objects_v2(Bucket=self.bucket, Prefix=full_key, MaxKeys=1)
+        return any(item["Key"] == full_key for item in response.get("Contents", []))
+
+    def list(self, prefix: str = "") -> List[ObjectInfo]:
+        root = f"{self.prefix}/" if self.prefix else ""
+        objects = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=root + prefix):
+            for item in page.get("Contents", []):
+                objects.append(ObjectInfo(key=item["Key"][len(root):], size=int(item["Size"])))
+        return objects
+
+    def delete(self, key: str) -> None:
+        self.client.delete_object(Bucket=self.bucket, Key=self._key(key))
+
+    def flush(self) -> None:
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+        errors = [future.exception() for future in pending]
+        for error in errors:
+            if error is not None:
+                raise error
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            self._executor.shutdown(wait=True)
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def _upload(self, local_path: Path, key: str) -> str:
+        size = local_path.stat().st_size
+        if size <= self.part_size:
+            with local_path.open("rb") as fp:
+                self.client.put_object(Bucket=self.bucket, Key=key, Body=fp.read())
+            return key
+
+        upload_id = self.client.create_multipart_upload(Bucket=self.bucket, Key=key)["UploadId"]
+        try:
+            parts = []
+            with local_path.open("rb") as fp:
+                number = 1
+                while chunk := fp.read(self.part_size):
+                    response = self.client.upload_part(
+                        Bucket=self.bucket, Key=key, PartNumber=number, UploadId=upload_id, Body=chunk
+                    )
+                    parts.append({"PartNumber": number, "ETag": response["ETag"]})
+                    number += 1
+            self.client.complete_multipart_upload(
+                Bucket=self.bucket, Key=key, UploadId=upload_id, MultipartUpload={"Parts": parts}
+            )
+        except BaseException:
+            self.client.abort_multipart_upload(Bucket=self.bucket, Key=key, UploadId=upload_id)
+            raise
+        return key
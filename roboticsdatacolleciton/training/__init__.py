@@ -0,0 +1,35 @@
+"""Training-ready exports of detection logs."""
+
+from typing import TYPE_CHECKING
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .tensors import (
+        LandmarkWindow,
+        LandmarkWindowDataset,
+        TensorExportReport,
+        TensorVideo,
+        export_training_tensors,
+    )
+
+__all__ = [
+    "LandmarkWindow",
+    "LandmarkWindowDataset",
+    "TensorExportReport",
+    "TensorVideo",
+    "export_training_tensors",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".tensors": (
+            "LandmarkWindow",
+            "LandmarkWindowDataset",
+            "TensorExportReport",
+            "TensorVideo",
+            "export_training_tensors",
+        ),
+    },
+)
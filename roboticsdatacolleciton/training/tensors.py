@@ -0,0 +1,275 @@
+"""Packed, memory-mappable landmark tensors for training, and a windowed dataset over them."""
+from __future__ import annotations
+
+import json
+import shutil
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Collection, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from roboticsdatacolleciton.loggers import HandLogReader
+from roboticsdatacolleciton.types import NUM_LANDMARKS
+
+INDEX_FILE = "index.json"
+TENSOR_FORMAT_VERSION = 1
+# Handedness codes stored in ``handedness.npy``; -1 marks an empty slot.
+HANDEDNESS_CODES: Dict[str, int] = {"Left": 0, "Right": 1}
+UNKNOWN_HANDEDNESS = 2
+EMPTY_SLOT = -1
+
+
+@dataclass(slots=True)
+class TensorVideo:
+    """Rows ``offset`` to ``offset + frames`` of an export, taken from one log.
+
+    Row ``offset + i`` holds frame ``first_frame + i``; frames without
+    detections are kept as all-masked rows so time steps stay regular.
+    """
+
+    log_path: str
+    offset: int
+    frames: int
+    first_frame: int
+    monotonic_epoch: Optional[float] = None
+
+
+@dataclass(slots=True)
+class TensorExportReport:
+    """Result of ``export_training_tensors``."""
+
+    output_dir: Path
+    videos: List[TensorVideo] = field(default_factory=list)
+    frames: int = 0
+    hands: int = 0
+    dropped_hands: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def bytes(self) -> int:
+        return sum(path.stat().st_size for path in self.output_dir.glob("*.npy"))
+
+
+def export_training_tensors(
+    log_paths: Sequence[str | Path],
+    output_dir: str | Path,
+    max_hands: int = 2,
+    min_confidence: Optional[float] = None,
+    labels: Optional[Collection[str]] = None,
+    batch_size: int = 65536,
+    overwrite: bool = False,
+) -> TensorExportReport:
+    """Pack hand logs into ``.npy`` arrays that can be memory-mapped for training.
+
+    ``output_dir`` receives:
+
+    - ``landmarks.npy``: float32 ``(frames, max_hands, 21, 3)``;
+    - ``mask.npy``: bool ``(frames, max_hands)``, True where a slot holds a hand;
+    - ``handedness.npy``: int8 ``(frames, max_hands)``, see ``HANDEDNESS_CODES``;
+    - ``confidence.npy``: float32 ``(frames, max_hands)``;
+    - ``frame_index.npy``: int32 ``(frames,)``, the source frame of each row;
+    - ``index.json``: the per-log offsets (``TensorVideo``), written last.
+
+    Logs are concatenated in the given order. Each log covers its frames
+    from first to last detection. With two slots, left hands go to slot 0
+    and right hands to slot 1 so slots keep their meaning across frames;
+    otherwise, and when a preferred slot is taken, hands fill the next free
+    slot in ``hand_index`` order. Hands that find no free slot are counted
+    in ``dropped_hands``. Frame ranges come from the Parquet footers, so the
+    arrays are allocated up front and filled while the logs stream through
+    in ``batch_size`` rows, without holding a whole log in memory.
+    """
+
+    started = time.perf_counter()
+    if max_hands < 1:
+        raise ValueError("max_hands must be at least 1")
+    output_dir = Path(output_dir)
+    if output_dir.exists() and any(output_dir.iterdir()):
+        if not overwrite:
+            raise FileExistsError(f"{output_dir} is not empty; pass overwrite=True to replace it")
+        shutil.rmtree(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    report = TensorExportReport(output_dir=output_dir)
+    offset = 0
+    for log_path in log_paths:
+        with HandLogReader(log_path) as reader:
+            frame_range = reader.frame_range()
+            first, frames = (frame_range[0], frame_range[1] - frame_range[0] + 1) if frame_range else (0, 0)
+            report.videos.append(
+                TensorVideo(str(log_path), offset, frames, first, monotonic_epoch=reader.monotonic_epoch)
+            )
+            offset += frames
+    report.frames = offset
+
+    def allocate(name: str, dtype: type, shape: tuple) -> np.memmap:
+        # New memmaps are zero-filled, so only non-zero defaults need writing.
+        return np.lib.format.open_memmap(output_dir / f"{name}.npy", mode="w+", dtype=dtype, shape=shape)
+
+    landmarks = allocate("landmarks", np.float32, (offset, max_hands, NUM_LANDMARKS, 3))
+    mask = allocate("mask", np.bool_, (offset, max_hands))
+    handedness = allocate("handedness", np.int8, (offset, max_hands))
+    handedness[...] = EMPTY_SLOT
+    confidence = allocate("confidence", np.float32, (offset, max_hands))
+    frame_index = allocate("frame_index", np.int32, (offset,))
+
+    for video in report.videos:
+        frame_index[video.offset:video.offset + video.frames] = np.arange(
+            video.first_frame, video.first_frame + video.frames, dtype=np.int32
+        )
+        with HandLogReader(video.log_path) as reader:
+            for batch in reader.iter_batches(batch_size=batch_size, labels=labels, min_confidence=min_confidence):
+                rows = video.offset + (batch.frame_index.astype(np.int64) - video.first_frame)
+                codes = np.array(
+                    [HANDEDNESS_CODES.get(name, UNKNOWN_HANDEDNESS) for name in batch.label.tolist()], dtype=np.int8
+                )
+                slots = _assign_slots(rows, codes, mask, max_hands)
+                kept = slots >= 0
+                rows, slots = rows[kept], slots[kept]
+                landmarks[rows, slots] = batch.landmarks[kept]
+                handedness[rows, slots] = codes[kept]
+                confidence[rows, slots] = batch.confidence[kept]
+                report.hands += int(np.count_nonzero(kept))
+                report.dropped_hands += int(np.count_nonzero(~kept))
+
+    for array in (landmarks, mask, handedness, confidence, frame_index):
+        array.flush()
+    del landmarks, mask, handedness, confidence, frame_index
+
+    index = {
+        "version": TENSOR_FORMAT_VERSION,
+        "frames": report.frames,
+        "max_hands": max_hands,
+        "num_landmarks": NUM_LANDMARKS,
+        "handedness_codes": HANDEDNESS_CODES,
+        "videos": [
+            {
+                "log_path": video.log_path,
+                "offset": video.offset,
+                "frames": video.frames,
+                "first_frame": video.first_frame,
+                "monotonic_epoch": video.monotonic_epoch,
+            }
+            for video in report.videos
+        ],
+    }
+    staging = output_dir / f".{INDEX_FILE}.tmp"
+    staging.write_text(json.dumps(index, indent=1), encoding="utf-8")
+    staging.replace(output_dir / INDEX_FILE)
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def _assign_slots(rows: np.ndarray, codes: np.ndarray, mask: np.ndarray, max_hands: int) -> np.ndarray:
+    """Pick a slot per hand (-1 when its frame is full) and mark it taken in ``mask``."""
+
+    slots = np.full(len(rows), EMPTY_SLOT, dtype=np.int64)
+    if max_hands == 2:
+        claims = np.flatnonzero(codes < UNKNOWN_HANDEDNESS)
+        # The first hand of a frame to ask for a slot gets it, if an earlier batch has not filled it.
+        _, first = np.unique(rows[claims] * 2 + codes[claims], return_index=True)
+        claims = claims[first]
+        claims = claims[~mask[rows[claims], codes[claims]]]
+        slots[claims] = codes[claims]
+        mask[rows[claims], slots[claims]] = True
+    # The rest (unknown labels, duplicates, more than two slots) take the next free slot in log order.
+    for hand in np.flatnonzero(slots < 0).tolist():
+        free = np.flatnonzero(~mask[rows[hand]])
+        if len(free):
+            slots[hand] = free[0]
+            mask[rows[hand], free[0]] = True
+    return slots
+
+
+class LandmarkWindow(NamedTuple):
+    """One training example; a NamedTuple so PyTorch's default collate can batch it."""
+
+    landmarks: np.ndarray
+    mask: np.ndarray
+    handedness: np.ndarray
+    frame_index: np.ndarray
+    video: int
+
+
+class LandmarkWindowDataset:
+    """Fixed-length windows over an ``export_training_tensors`` directory.
+
+    Window ``i`` is ``window`` consecutive rows of one video (windows never
+    span two logs), starting every ``stride`` rows. The arrays are opened
+    with ``mmap_mode="r"`` on first access, so only the rows a window
+    touches are read from disk and each DataLoader worker maps the files
+    itself instead of receiving them pickled. ``min_valid_fraction`` skips
+    windows in which fewer than that share of frames has any hand.
+    """
+
+    def __init__(
+        self,
+        root: str | Path,
+        window: int = 32,
+        stride: int = 1,
+        min_valid_fraction: float = 0.0,
+    ) -> None:
+        if window < 1 or stride < 1:
+            raise ValueError("window and stride must be positive")
+        self.root = Path(root)
+        self.window = window
+        self.stride = stride
+        index = json.loads((self.root / INDEX_FILE).read_text(encoding="utf-8"))
+        if index.get("version") != TENSOR_FORMAT_VERSION:
+            raise ValueError(f"Unsupported tensor export version {index.get('version')!r}")
+        self.max_hands: int = index["max_hands"]
+        self.videos = [TensorVideo(**video) for video in index["videos"]]
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+
+        starts = []
+        videos = []
+        for number, video in enumerate(self.videos):
+            count = max(0, (video.frames - window) // stride + 1)
+            starts.append(video.offset + stride * np.arange(count, dtype=np.int64))
+            videos.append(np.full(count, number, dtype=np.int32))
+        self._starts = np.concatenate(starts) if starts else np.empty(0, dtype=np.int64)
+        self._videos = np.concatenate(videos) if videos else np.empty(0, dtype=np.int32)
+        if min_valid_fraction > 0 and len(self._starts):
+            # Prefix sums over "frame has a hand" rate every window in one pass.
+            valid = np.concatenate([[0], np.cumsum(self._array("mask").any(axis=1), dtype=np.int64)])
+            fraction = (valid[self._starts + window] - valid[self._starts]) / window
+            keep = fraction >= min_valid_fraction
+            self._starts, self._videos = self._starts[keep], self._videos[keep]
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def __getitem__(self, index: int) -> LandmarkWindow:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"window {index} out of range for {len(self)} windows")
+        start = int(self._starts[index])
+        rows = slice(start, start + self.window)
+        return LandmarkWindow(
+            landmarks=np.array(self._array("landmarks")[rows]),
+            mask=np.array(self._array("mask")[rows]),
+            handedness=np.array(self._array("handedness")[rows]),
+            frame_index=np.array(self._array("frame_index")[rows]),
+            video=int(self._videos[index]),
+        )
+
+    def __getstate__(self) -> dict:
+        # Memory maps are reopened lazily in each worker process rather than pickled.
+        state = {name: getattr(self, name) for name in ("root", "window", "stride", "max_hands", "videos")}
+        state.update(_starts=self._starts, _videos=self._videos, _arrays=None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def _array(self, name: str) -> np.ndarray:
+        if self._arrays is None:
+            self._arrays = {}
+        array = self._arrays.get(name)
+        if array is None:
+            array = self._arrays[name] = np.load(self.root / f"{name}.npy", mmap_mode="r")
+        return array
@@ -2,7 +2,37 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Sequence
+from typing import Iterator, Sequence, overload
+
+import numpy as np
+
+# Order matches mediapipe.solutions.hands.HandLandmark, so row ``i`` of a
+# landmark array is the landmark named ``LANDMARK_NAMES[i]``.
+LANDMARK_NAMES: tuple[str, ...] = (
+    "WRIST",
+    "THUMB_CMC",
+    "THUMB_MCP",
+    "THUMB_IP",
+    "THUMB_TIP",
+    "INDEX_FINGER_MCP",
+    "INDEX_FINGER_PIP",
+    "INDEX_FINGER_DIP",
+    "INDEX_FINGER_TIP",
+    "MIDDLE_FINGER_MCP",
+    "MIDDLE_FINGER_PIP",
+    "MIDDLE_FINGER_DIP",
+    "MIDDLE_FINGER_TIP",
+    "RING_FINGER_MCP",
+    "RING_FINGER_PIP",
+    "RING_FINGER_DIP",
+    "RING_FINGER_TIP",
+    "PINKY_MCP",
+    "PINKY_PIP",
+    "PINKY_DIP",
+    "PINKY_TIP",
+)
+NUM_LANDMARKS = len(LANDMARK_NAMES)
+LANDMARK_INDEX: dict[str, int] = {name: idx for idx, name in enumerate(LANDMARK_NAMES)}
 
 
 @dataclass(slots=True)
@@ -15,12 +45,82 @@ class Landmark:
     z: float | None
 
 
+class LandmarkView(Sequence[Landmark]):
+    """Read-only ``Sequence[Landmark]`` facade over a ``(21, 3)`` landmark array."""
+
+    __slots__ = ("_array",)
+
+    def __init__(self, array: np.ndarray) -> None:
+        self._array = array
+
+    def __len__(self) -> int:
+        return len(self._array)
+
+    @overload
+    def __getitem__(self, index: int) -> Landmark: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[Landmark]: ...
+
+    def __getitem__(self, index):  # noqa: ANN001
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        x, y, z = self._array[index].tolist()
+        return Landmark(name=LANDMARK_NAMES[index], x=x, y=y, z=z)
+
+    def __iter__(self) -> Iterator[Landmark]:
+        for name, (x, y, z) in zip(LANDMARK_NAMES, self._array.tolist()):
+            yield Landmark(name=name, x=x, y=y, z=z)
+
+
 @dataclass(slots=True)
 class HandPosition:
-    """Represents the inferred position of a single hand."""
+    """Represents the inferred position of a single hand.
+
+    ``landmark_array`` holds normalized ``(x, y, z)`` rows as ``float32`` in
+    ``LANDMARK_NAMES`` order; ``landmarks`` exposes the same data as
+    ``Landmark`` objects for callers that prefer named access.
+    """
 
     label: str
     confidence: float
     normalized_palm: tuple[float, float]
     pixel_palm: tuple[int, int]
-    landmarks: Sequence[Landmark]
+    landmark_array: np.ndarray
+
+    @property
+    def landmarks(self) -> Sequence[Landmark]:
+        return LandmarkView(self.landmark_array)
+
+    @classmethod
+    def from_landmarks(
+        cls,
+        label: str,
+        confidence: float,
+        normalized_palm: tuple[float, float],
+        pixel_palm: tuple[int, int],
+        landmarks: Sequence[Landmark],
+    ) -> "HandPosition":
+        """Build a HandPosition from ``Landmark`` objects (any order, by name)."""
+
+        array = np.full((NUM_LANDMARKS, 3), np.nan, dtype=np.float32)
+        for landmark in landmarks:
+            z = landmark.z if landmark.z is not None else np.nan
+            array[LANDMARK_INDEX[landmark.name]] = (landmark.x, landmark.y, z)
+        return cls(
+            label=label,
+            confidence=confidence,
+            normalized_palm=normalized_palm,
+            pixel_palm=pixel_palm,
+            landmark_array=array,
+        )
+
+
+def stack_landmarks(positions: Sequence[HandPosition]) -> np.ndarray:
+    """Return a ``(hands, 21, 3)`` float32 array for one frame's detections."""
+
+    if not positions:
+        return np.empty((0, NUM_LANDMARKS, 3), dtype=np.float32)
+    return np.stack([position.landmark_array for position in positions])
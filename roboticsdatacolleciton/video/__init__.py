@@ -1,12 +1,34 @@
 """Video and camera utilities."""
 
-from .capture import CameraStream
-from .errors import CameraOpenError, VideoFileOpenError
-from .file_stream import VideoFileStream
+from typing import TYPE_CHECKING
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .buffers import BufferPoolStats, FrameBufferPool
+    from .capture import CameraStream
+    from .errors import CameraOpenError, VideoFileOpenError
+    from .file_stream import PrefetchStats, VideoFileStream
+    from .virtual_camera import FileCameraStream
 
 __all__ = [
+    "BufferPoolStats",
     "CameraStream",
     "CameraOpenError",
+    "FileCameraStream",
+    "FrameBufferPool",
+    "PrefetchStats",
     "VideoFileStream",
     "VideoFileOpenError",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".buffers": ("BufferPoolStats", "FrameBufferPool"),
+        ".capture": ("CameraStream",),
+        ".errors": ("CameraOpenError", "VideoFileOpenError"),
+        ".file_stream": ("PrefetchStats", "VideoFileStream"),
+        ".virtual_camera": ("FileCameraStream",),
+    },
+)
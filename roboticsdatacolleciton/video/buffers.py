@@ -0,0 +1,88 @@
+"""Reusable frame buffers shared by capture, detection and rendering."""
+from __future__ import annotations
+
+import threading
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+_Key = Tuple[Tuple[int, ...], str]
+
+
+@dataclass(slots=True)
+class BufferPoolStats:
+    """Allocation counters; ``bytes_reused`` is memory that did not need allocating."""
+
+    acquired: int = 0
+    allocations: int = 0
+    reuses: int = 0
+    released: int = 0
+    bytes_allocated: int = 0
+    bytes_reused: int = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        if self.acquired == 0:
+            return 0.0
+        return self.reuses / self.acquired
+
+
+class FrameBufferPool:
+    """Thread-safe pool of NumPy arrays keyed by shape and dtype.
+
+    ``acquire`` hands out a free buffer of the requested shape (allocating
+    only when none is free) and ``release`` returns it. Releasing an array
+    the pool did not hand out is a no-op, so callers can release frames
+    without tracking where they came from; buffers that are never released
+    are simply garbage collected. At most ``max_free_per_shape``
+    idle buffers are kept per shape and ``max_shapes`` shapes are retained,
+    least recently used first out.
+    """
+
+    def __init__(self, max_free_per_shape: int = 8, max_shapes: int = 8) -> None:
+        self.max_free_per_shape = max_free_per_shape
+        self.max_shapes = max_shapes
+        self.stats = BufferPoolStats()
+        self._free: "OrderedDict[_Key, List[np.ndarray]]" = OrderedDict()
+        self._leased: "weakref.WeakValueDictionary[int, np.ndarray]" = weakref.WeakValueDictionary()
+        self._lock = threading.Lock()
+
+    def acquire(self, shape: Tuple[int, ...], dtype: np.dtype | type = np.uint8) -> np.ndarray:
+        key = (tuple(shape), np.dtype(dtype).str)
+        with self._lock:
+            self.stats.acquired += 1
+            free = self._free.get(key)
+            if free:
+                self._free.move_to_end(key)
+                buffer = free.pop()
+                self.stats.reuses += 1
+                self.stats.bytes_reused += buffer.nbytes
+            else:
+                buffer = np.empty(shape, dtype=dtype)
+                self.stats.allocations += 1
+                self.stats.bytes_allocated += buffer.nbytes
+            self._leased[id(buffer)] = buffer
+            return buffer
+
+    def release(self, buffer: np.ndarray | None) -> None:
+        if buffer is None:
+            return
+        with self._lock:
+            if self._leased.pop(id(buffer), None) is None:
+                return
+            self.stats.released += 1
+            key = (buffer.shape, buffer.dtype.str)
+            free = self._free.setdefault(key, [])
+            self._free.move_to_end(key)
+            if len(free) < self.max_free_per_shape:
+                free.append(buffer)
+            while len(self._free) > self.max_shapes:
+                self._free.popitem(last=False)
+
+    @property
+    def leased(self) -> int:
+        with self._lock:
+            return len(self._leased)
@@ -1,47 +1,174 @@
 """Camera capture utilities to abstract OpenCV specifics."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Iterator, Optional
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterator, Optional, Tuple
 
 import cv2
+import numpy as np
 
+from .buffers import FrameBufferPool
 from .errors import CameraOpenError
 
 
+@dataclass(slots=True)
+class CaptureStats:
+    """Counters for frames grabbed from the device versus frames handed out."""
+
+    frames_captured: int = 0
+    frames_delivered: int = 0
+    dropped_frames: int = 0
+
+
 @dataclass
 class CameraStream:
-    """Context manager around cv2.VideoCapture."""
+    """Context manager around cv2.VideoCapture.
+
+    With ``latest_frame_only`` a grab thread reads the device continuously and
+    keeps just the newest frame, so a slow consumer always sees a fresh image
+    instead of a backlog buffered inside the driver. Replaced frames are
+    counted in ``stats.dropped_frames``. With a ``buffer_pool`` frames are
+    read into pooled arrays; hand each frame back with ``release()``.
+    """
 
     device_index: int = 0
     frame_width: Optional[int] = None
     frame_height: Optional[int] = None
+    latest_frame_only: bool = False
+    buffer_pool: Optional[FrameBufferPool] = None
+    stats: CaptureStats = field(init=False, default_factory=CaptureStats)
 
     def __post_init__(self) -> None:
         self._capture: Optional[cv2.VideoCapture] = None
+        self._grabber: Optional[threading.Thread] = None
+        self._running = False
+        self._latest: Optional[Tuple[float, np.ndarray]] = None
+        self._grab_error: Optional[BaseException] = None
+        self._finished = False
+        self._frame_ready = threading.Condition()
 
     def __enter__(self) -> "CameraStream":
-        self._capture = cv2.VideoCapture(self.device_index)
-        if not self._capture.isOpened():
-            raise CameraOpenError(self.device_index)
-
+        self._capture = self._open()
         if self.frame_width:
             self._capture.set(cv2.CAP_PROP_FRAME_WIDTH, self.frame_width)
         if self.frame_height:
             self._capture.set(cv2.CAP_PROP_FRAME_HEIGHT, self.frame_height)
+        self.stats = CaptureStats()
+        if self.latest_frame_only:
+            self._start_grabber()
         return self
 
     def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self._stop_grabber()
         if self._capture is not None:
             self._capture.release()
             self._capture = None
 
+    def _open(self) -> cv2.VideoCapture:
+        capture = cv2.VideoCapture(self.device_index)
+        if not capture.isOpened():
+            raise CameraOpenError(self.device_index)
+        return capture
+
+    @property
+    def _end_of_stream(self) -> bool:
+        """True when a failed read means the source ended rather than broke."""
+
+        return False
+
     def frames(self) -> Iterator:
+        for _, frame in self.timestamped_frames():
+            yield frame
+
+    def timestamped_frames(self) -> Iterator[Tuple[float, np.ndarray]]:
+        """Yield ``(capture_time, frame)`` pairs stamped with ``time.monotonic()``."""
+
         if self._capture is None:
             raise RuntimeError("CameraStream must be entered before reading frames")
 
+        if self.latest_frame_only:
+            yield from self._latest_frames()
+            return
+
+        shape = self._frame_shape()
         while True:
-            success, frame = self._capture.read()
+            success, frame = self._read(shape)
+            captured_at = time.monotonic()
             if not success:
+                if self._end_of_stream:
+                    return
                 raise RuntimeError("Failed to read from camera stream")
-            yield frame
+            self.stats.frames_captured += 1
+            self.stats.frames_delivered += 1
+            yield captured_at, frame
+
+    def _latest_frames(self) -> Iterator[Tuple[float, np.ndarray]]:
+        while True:
+            with self._frame_ready:
+                while self._latest is None and self._grab_error is None and not self._finished:
+                    self._frame_ready.wait()
+                if self._latest is None:
+                    if self._finished:
+                        return
+                    raise RuntimeError("Failed to read from camera stream") from self._grab_error
+                item, self._latest = self._latest, None
+                self.stats.frames_delivered += 1
+            yield item
+
+    def _start_grabber(self) -> None:
+        self._running = True
+        self._latest = None
+        self._grab_error = None
+        self._finished = False
+        self._grabber = threading.Thread(
+            target=self._grab_loop, name=f"camera-{self.device_index}", daemon=True
+        )
+        self._grabber.start()
+
+    def _stop_grabber(self) -> None:
+        self._running = False
+        if self._grabber is not None:
+            self._grabber.join()
+            self._grabber = None
+
+    def release(self, frame: np.ndarray) -> None:
+        """Return a frame yielded by this stream to the buffer pool, if any."""
+
+        if self.buffer_pool is not None:
+            self.buffer_pool.release(frame)
+
+    def _read(self, shape: Optional[Tuple[int, int, int]]) -> Tuple[bool, Optional[np.ndarray]]:
+        buffer = self.buffer_pool.acquire(shape) if self.buffer_pool and shape else None
+        success, frame = self._capture.read(buffer)
+        if frame is not buffer:
+            self.release(buffer)
+        return success, frame
+
+    def _frame_shape(self) -> Optional[Tuple[int, int, int]]:
+        height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        if height <= 0 or width <= 0:
+            return None
+        return height, width, 3
+
+    def _grab_loop(self) -> None:
+        shape = self._frame_shape()
+        while self._running:
+            success, frame = self._read(shape)
+            captured_at = time.monotonic()
+            with self._frame_ready:
+                if not success:
+                    if self._end_of_stream:
+                        self._finished = True
+                    else:
+                        self._grab_error = RuntimeError(f"camera {self.device_index} returned no frame")
+                    self._frame_ready.notify_all()
+                    return
+                self.stats.frames_captured += 1
+                if self._latest is not None:
+                    self.stats.dropped_frames += 1
+                    self.release(self._latest[1])
+                self._latest = (captured_at, frame)
+                self._frame_ready.notify_all()
@@ -1,25 +1,64 @@
 """Utilities for reading frames from a video file."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+import queue
+import threading
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Iterator, Optional, Tuple
 
 import cv2
 import numpy as np
 
+from .buffers import FrameBufferPool
 from .errors import VideoFileOpenError
 
 
+_END_OF_STREAM = object()
+
+
+@dataclass(slots=True)
+class PrefetchStats:
+    """Queue health for a prefetching VideoFileStream."""
+
+    frames: int = 0
+    consumer_stall_seconds: float = 0.0
+    decoder_stall_seconds: float = 0.0
+    occupancy_total: int = 0
+    max_occupancy: int = 0
+
+    @property
+    def mean_occupancy(self) -> float:
+        if self.frames == 0:
+            return 0.0
+        return self.occupancy_total / self.frames
+
+
 @dataclass
 class VideoFileStream:
-    """Context-managed reader over a video file."""
+    """Context-managed reader over a video file.
+
+    ``start_frame``/``end_frame`` restrict decoding to a half-open frame range;
+    the reader seeks straight to ``start_frame`` instead of decoding from 0.
+    With ``prefetch > 0`` a background thread decodes up to that many frames
+    ahead (cv2 releases the GIL while decoding), overlapping decode with detection.
+    With a ``buffer_pool`` frames are decoded into pooled arrays; hand each
+    frame back with ``release()`` once it is no longer needed.
+    """
 
     path: str | Path
+    start_frame: int = 0
+    end_frame: Optional[int] = None
+    prefetch: int = 0
+    buffer_pool: Optional[FrameBufferPool] = None
+    prefetch_stats: PrefetchStats = field(init=False, default_factory=PrefetchStats)
 
     def __post_init__(self) -> None:
         self.path = Path(self.path)
         self._capture: Optional[cv2.VideoCapture] = None
+        self._decoder: Optional[threading.Thread] = None
+        self._stop_decoder = threading.Event()
 
     def __enter__(self) -> "VideoFileStream":
         if not self.path.exists():
@@ -28,21 +67,132 @@ class VideoFileStream:
         self._capture = cv2.VideoCapture(str(self.path))
         if not self._capture.isOpened():
             raise VideoFileOpenError(self.path, reason="open-failed")
+        if self.start_frame > 0 and not self._capture.set(cv2.CAP_PROP_POS_FRAMES, self.start_frame):
+            self._capture.release()
+            self._capture = None
+            raise VideoFileOpenError(self.path, reason=f"seek-failed:{self.start_frame}")
         return self
 
     def __exit__(self, exc_type, exc, exc_tb) -> None:  # noqa: ANN001
+        self._join_decoder()
         if self._capture is not None:
             self._capture.release()
             self._capture = None
 
+    @property
+    def frame_count(self) -> int:
+        """Container-reported frame count (may be approximate for some codecs)."""
+
+        return int(self._probe(cv2.CAP_PROP_FRAME_COUNT))
+
+    @property
+    def fps(self) -> float:
+        return float(self._probe(cv2.CAP_PROP_FPS))
+
     def frames(self) -> Iterator[Tuple[int, np.ndarray]]:
         if self._capture is None:
             raise RuntimeError("VideoFileStream must be entered before reading frames")
+        if self.prefetch > 0:
+            return self._prefetched_frames()
+        return self._decoded_frames()
 
-        frame_idx = 0
-        while True:
-            success, frame = self._capture.read()
+    def release(self, frame: np.ndarray) -> None:
+        """Return a frame yielded by ``frames()`` to the buffer pool, if any."""
+
+        if self.buffer_pool is not None:
+            self.buffer_pool.release(frame)
+
+    def _decoded_frames(self) -> Iterator[Tuple[int, np.ndarray]]:
+        frame_idx = self.start_frame
+        shape = self._frame_shape()
+        while self.end_frame is None or frame_idx < self.end_frame:
+            buffer = self.buffer_pool.acquire(shape) if self.buffer_pool and shape else None
+            success, frame = self._capture.read(buffer)
+            if frame is not buffer:
+                self.release(buffer)
             if not success:
                 break
             yield frame_idx, frame
             frame_idx += 1
+
+    def _frame_shape(self) -> Optional[Tuple[int, int, int]]:
+        height = int(self._capture.get(cv2.CAP_PROP_FRAME_HEIGHT))
+        width = int(self._capture.get(cv2.CAP_PROP_FRAME_WIDTH))
+        if height <= 0 or width <= 0:
+            return None
+        return height, width, 3
+
+    def _prefetched_frames(self) -> Iterator[Tuple[int, np.ndarray]]:
+        self._join_decoder()
+        self.prefetch_stats = PrefetchStats()
+        frames: queue.Queue = queue.Queue(maxsize=self.prefetch)
+        self._stop_decoder.clear()
+        self._decoder = threading.Thread(
+            target=self._decode_into,
+            args=(frames,),
+            name=f"decode-{self.path.name}",
+            daemon=True,
+        )
+        self._decoder.start()
+
+        stats = self.prefetch_stats
+        try:
+            while True:
+                occupancy = frames.qsize()
+                if occupancy:
+                    item = frames.get_nowait()
+                else:
+                    waited = time.perf_counter()
+                    item = frames.get()
+                    stats.consumer_stall_seconds += time.perf_counter() - waited
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                stats.frames += 1
+                stats.occupancy_total += occupancy
+                stats.max_occupancy = max(stats.max_occupancy, occupancy)
+                yield item
+        finally:
+            self._join_decoder()
+
+    def _decode_into(self, frames: queue.Queue) -> None:
+        try:
+            for item in self._decoded_frames():
+                if not self._put(frames, item):
+                    return
+        except BaseException as exc:  # surfaced on the consumer thread
+            self._put(frames, exc)
+            return
+        self._put(frames, _END_OF_STREAM)
+
+    def _put(self, frames: queue.Queue, item: object) -> bool:
+        waited = time.perf_counter()
+        while not self._stop_decoder.is_set():
+            try:
+                frames.put(item, timeout=0.1)
+            except queue.Full:
+                continue
+            self.prefetch_stats.decoder_stall_seconds += time.perf_counter() - waited
+            return True
+        return False
+
+    def _join_decoder(self) -> None:
+        if self._decoder is None:
+            return
+        self._stop_decoder.set()
+        self._decoder.join()
+        self._decoder = None
+
+    def _probe(self, prop: int) -> float:
+        if self._capture is not None:
+            return self._capture.get(prop)
+        if not self.path.exists():
+            raise VideoFileOpenError(self.path, reason="file-not-found")
+        capture = cv2.VideoCapture(str(self.path))
+        try:
+            if not capture.isOpened():
+                raise VideoFileOpenError(self.path, reason="open-failed")
+            return capture.get(prop)
+        finally:
+            capture.release()
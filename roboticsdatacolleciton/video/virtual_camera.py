@@ -0,0 +1,61 @@
+"""Video files played back as live cameras."""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Tuple
+
+import cv2
+import numpy as np
+
+from .capture import CameraStream
+from .errors import VideoFileOpenError
+
+
+@dataclass
+class FileCameraStream(CameraStream):
+    """A CameraStream that reads from a video file instead of a device.
+
+    With ``realtime`` frames are released at the file's frame rate, so
+    capture timestamps, drops and latency behave like a live camera; with
+    ``loop`` playback restarts at the end, otherwise the stream simply ends.
+    Useful for exercising realtime and multi-camera pipelines without
+    hardware.
+    """
+
+    path: str | Path = ""
+    realtime: bool = True
+    loop: bool = False
+
+    def _open(self) -> cv2.VideoCapture:
+        path = Path(self.path)
+        if not path.exists():
+            raise VideoFileOpenError(path, reason="file-not-found")
+        capture = cv2.VideoCapture(str(path))
+        if not capture.isOpened():
+            raise VideoFileOpenError(path, reason="open-failed")
+        fps = capture.get(cv2.CAP_PROP_FPS)
+        self._interval = 1.0 / fps if fps and fps > 0 else 1.0 / 30.0
+        self._next_due: Optional[float] = None
+        self._eof = False
+        return capture
+
+    @property
+    def _end_of_stream(self) -> bool:
+        return self._eof
+
+    def _read(self, shape: Optional[Tuple[int, int, int]]) -> Tuple[bool, Optional[np.ndarray]]:
+        if self.realtime:
+            now = time.monotonic()
+            if self._next_due is None:
+                self._next_due = now
+            elif self._next_due > now:
+                time.sleep(self._next_due - now)
+            self._next_due += self._interval
+        success, frame = super()._read(shape)
+        if not success and self.loop:
+            self._capture.set(cv2.CAP_PROP_POS_FRAMES, 0)
+            success, frame = super()._read(shape)
+        self._eof = not success
+        return success, frame
@@ -1,5 +1,17 @@
 """Visualization helpers for presenting detection results."""
 
-from .preview import HandPreviewRenderer
+from typing import TYPE_CHECKING
+
+from roboticsdatacolleciton._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .preview import HandPreviewRenderer
 
 __all__ = ["HandPreviewRenderer"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        ".preview": ("HandPreviewRenderer",),
+    },
+)
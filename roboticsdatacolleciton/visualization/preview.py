@@ -1,77 +1,150 @@
 """Utilities for visualizing detected hands on a live preview window."""
 from __future__ import annotations
 
+import sys
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Iterable, Optional, Tuple
 
 import cv2
-import mediapipe as mp
+import numpy as np
 
 from roboticsdatacolleciton.types import HandPosition
+from roboticsdatacolleciton.video import FrameBufferPool
+
+# Landmark index pairs joined by a line, matching MediaPipe's HAND_CONNECTIONS.
+HAND_CONNECTIONS = np.array(
+    [
+        (0, 1), (1, 2), (2, 3), (3, 4),
+        (0, 5), (5, 6), (6, 7), (7, 8),
+        (5, 9), (9, 10), (10, 11), (11, 12),
+        (9, 13), (13, 14), (14, 15), (15, 16),
+        (13, 17), (0, 17), (17, 18), (18, 19), (19, 20),
+    ],
+    dtype=np.intp,
+)
+
+_QUIT_KEYS = (27, ord("q"))
 
 
 @dataclass(slots=True)
 class HandPreviewRenderer:
-    """Render video frames with MediaPipe-style hand overlays."""
+    """Render video frames with MediaPipe-style hand overlays.
+
+    ``annotate`` draws the overlays into a copy of a frame: landmarks are
+    scaled to pixels in one NumPy operation and every hand is drawn with two
+    ``cv2.polylines`` calls (connections as two-point segments, landmarks as
+    zero-length round-capped segments).
+
+    With ``threaded`` (the default except on macOS, where OpenCV windows must
+    be driven from the main thread) ``render`` hands frames to a display
+    thread that shows the newest one at most ``max_display_fps`` times per
+    second. Frames arriving while the display is busy or ahead of that rate
+    are not annotated at all, so the preview costs the pipeline almost
+    nothing beyond the frames actually shown.
+    """
 
     window_name: str = "Hand Tracking"
     circle_radius: int = 4
     line_thickness: int = 2
-    _connections: List[Tuple[str, str]] = field(init=False, repr=False)
-
-    def __post_init__(self) -> None:
-        self._connections = [
-            (self._landmark_name(start), self._landmark_name(end))
-            for start, end in mp.solutions.hands.HAND_CONNECTIONS
-        ]
+    buffer_pool: Optional[FrameBufferPool] = None
+    max_display_fps: float = 30.0
+    threaded: bool = field(default_factory=lambda: sys.platform != "darwin")
+    _pending: Optional[np.ndarray] = field(init=False, repr=False, default=None)
+    _next_due: float = field(init=False, repr=False, default=0.0)
+    _quit: bool = field(init=False, repr=False, default=False)
+    _ready: threading.Condition = field(init=False, repr=False, default_factory=threading.Condition)
+    _stop: threading.Event = field(init=False, repr=False, default_factory=threading.Event)
+    _thread: Optional[threading.Thread] = field(init=False, repr=False, default=None)
 
     def render(self, frame, positions: Iterable[HandPosition]) -> bool:
-        display_frame = frame.copy()
-        height, width = display_frame.shape[:2]
+        """Show ``frame`` with overlays; returns False once the user pressed ``q`` or Esc."""
+
+        if not self.threaded:
+            display_frame = self.annotate(frame, positions)
+            cv2.imshow(self.window_name, display_frame)
+            self._release(display_frame)
+            return (cv2.waitKey(1) & 0xFF) not in _QUIT_KEYS
+
+        if self._quit:
+            return False
+        if self._thread is None:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._display_loop, name="preview-display", daemon=True)
+            self._thread.start()
+        now = time.monotonic()
+        if self._pending is not None or now < self._next_due:
+            return True
+        display_frame = self.annotate(frame, positions)
+        with self._ready:
+            self._pending = display_frame
+            self._ready.notify()
+        self._next_due = now + 1.0 / self.max_display_fps if self.max_display_fps > 0 else now
+        return True
+
+    def annotate(self, frame, positions: Iterable[HandPosition]) -> np.ndarray:
+        """Return a copy of ``frame`` with hand overlays drawn on it.
+
+        The copy comes from ``buffer_pool`` when one is set.
+        """
+
+        if self.buffer_pool:
+            display_frame = self.buffer_pool.acquire(frame.shape, frame.dtype)
+            np.copyto(display_frame, frame)
+        else:
+            display_frame = frame.copy()
         hands = list(positions)
+        if not hands:
+            return display_frame
 
+        height, width = display_frame.shape[:2]
+        landmarks = np.stack([hand.landmark_array[:, :2] for hand in hands])
+        pixels = (landmarks * (width, height)).astype(np.int32)
         for idx, hand in enumerate(hands):
             color = self._color_for_hand(hand.label, idx)
-            points = self._landmark_points(hand, width, height)
-            self._draw_connections(display_frame, points, color)
-            self._draw_landmarks(display_frame, points, color)
+            points = pixels[idx]
+            cv2.polylines(display_frame, points[HAND_CONNECTIONS], False, color, self.line_thickness)
+            cv2.polylines(
+                display_frame, points[:, None, :].repeat(2, axis=1), False, color, self.circle_radius * 2
+            )
             self._draw_label(display_frame, hand, color)
-
-        cv2.imshow(self.window_name, display_frame)
-        key = cv2.waitKey(1) & 0xFF
-        if key in (27, ord("q")):
-            return False
-        return True
+        return display_frame
 
     def close(self) -> None:
-        """Destroy the OpenCV window."""
-
-        cv2.destroyWindow(self.window_name)
-
-    def _landmark_points(
-        self, hand: HandPosition, width: int, height: int
-    ) -> Dict[str, Tuple[int, int]]:
-        points: Dict[str, Tuple[int, int]] = {}
-        for landmark in hand.landmarks:
-            px = int(landmark.x * width)
-            py = int(landmark.y * height)
-            points[landmark.name] = (px, py)
-        return points
-
-    def _draw_connections(
-        self, frame, points: Dict[str, Tuple[int, int]], color: Tuple[int, int, int]
-    ) -> None:
-        for start_name, end_name in self._connections:
-            start = points.get(start_name)
-            end = points.get(end_name)
-            if start and end:
-                cv2.line(frame, start, end, color, self.line_thickness)
-
-    def _draw_landmarks(
-        self, frame, points: Dict[str, Tuple[int, int]], color: Tuple[int, int, int]
-    ) -> None:
-        for point in points.values():
-            cv2.circle(frame, point, self.circle_radius, color, -1)
+        """Stop the display thread and destroy the OpenCV window."""
+
+        if self._thread is None:
+            cv2.destroyWindow(self.window_name)
+            return
+        self._stop.set()
+        with self._ready:
+            self._ready.notify()
+        self._thread.join()
+        self._thread = None
+
+    def _display_loop(self) -> None:
+        try:
+            while not self._stop.is_set():
+                with self._ready:
+                    if self._pending is None:
+                        self._ready.wait(timeout=0.02)
+                    display_frame, self._pending = self._pending, None
+                if display_frame is not None:
+                    cv2.imshow(self.window_name, display_frame)
+                    self._release(display_frame)
+                # waitKey also pumps window events, so call it even without a new frame.
+                if (cv2.waitKey(1) & 0xFF) in _QUIT_KEYS:
+                    self._quit = True
+        finally:
+            with self._ready:
+                self._release(self._pending)
+                self._pending = None
+            cv2.destroyWindow(self.window_name)
+
+    def _release(self, display_frame: Optional[np.ndarray]) -> None:
+        if self.buffer_pool:
+            self.buffer_pool.release(display_frame)
 
     def _draw_label(self, frame, hand: HandPosition, color: Tuple[int, int, int]) -> None:
         px, py = hand.pixel_palm
@@ -93,8 +166,3 @@ class HandPreviewRenderer:
             "Right": (0, 200, 255),
         }
         return mapping.get(label, ((50 + idx * 70) % 255, 255, (150 + idx * 40) % 255))
-
-    def _landmark_name(self, landmark: Any) -> str:
-        if hasattr(landmark, "name"):
-            return landmark.name  # type: ignore[return-value]
-        return mp.solutions.hands.HandLandmark(int(landmark)).name